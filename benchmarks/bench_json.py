@@ -0,0 +1,130 @@
+"""Benchmark JSON decoding of NHL API payloads: stdlib vs edgework.jsonlib.
+
+Usage (from the repository root, with edgework installed or on PYTHONPATH):
+    python benchmarks/bench_json.py [payload.json ...]
+
+Pass recorded responses (e.g. saved ``gamecenter/{id}/play-by-play`` and
+``skater/summary`` bodies) to benchmark them; without arguments, synthetic
+payloads shaped like a play-by-play and a full-season skater report are used.
+"""
+
+import json
+import random
+import sys
+import timeit
+from pathlib import Path
+
+from edgework import jsonlib
+
+
+def synthetic_play_by_play(n_plays: int = 320) -> bytes:
+    """Build a play-by-play body about the size of a real regular-season game."""
+    rng = random.Random(0)
+    plays = []
+    for i in range(n_plays):
+        plays.append(
+            {
+                "eventId": i + 100,
+                "periodDescriptor": {
+                    "number": i * 3 // n_plays + 1,
+                    "periodType": "REG",
+                    "maxRegulationPeriods": 3,
+                },
+                "timeInPeriod": f"{rng.randint(0, 19):02d}:{rng.randint(0, 59):02d}",
+                "timeRemaining": f"{rng.randint(0, 19):02d}:{rng.randint(0, 59):02d}",
+                "situationCode": "1551",
+                "homeTeamDefendingSide": "left",
+                "typeCode": rng.choice([502, 503, 504, 505, 506, 507, 508, 509]),
+                "typeDescKey": rng.choice(
+                    ["faceoff", "hit", "giveaway", "shot-on-goal", "blocked-shot"]
+                ),
+                "sortOrder": i * 7,
+                "details": {
+                    "xCoord": rng.randint(-99, 99),
+                    "yCoord": rng.randint(-42, 42),
+                    "zoneCode": rng.choice("ODN"),
+                    "eventOwnerTeamId": rng.choice([10, 22]),
+                    "shootingPlayerId": rng.randint(8470000, 8485000),
+                    "goalieInNetId": rng.randint(8470000, 8485000),
+                    "shotType": rng.choice(["wrist", "snap", "slap", "backhand"]),
+                    "awaySOG": rng.randint(0, 40),
+                    "homeSOG": rng.randint(0, 40),
+                },
+            }
+        )
+    roster = [
+        {
+            "teamId": 10 if i % 2 else 22,
+            "playerId": 8470000 + i,
+            "firstName": {"default": f"First{i}"},
+            "lastName": {"default": f"Last{i}"},
+            "sweaterNumber": i,
+            "positionCode": "CLRDG"[i % 5],
+            "headshot": f"https://assets.nhle.com/mugs/nhl/20232024/TOR/{8470000 + i}.png",
+        }
+        for i in range(40)
+    ]
+    body = {
+        "id": 2023020001,
+        "season": 20232024,
+        "gameType": 2,
+        "gameState": "OFF",
+        "plays": plays,
+        "rosterSpots": roster,
+    }
+    return json.dumps(body).encode("utf-8")
+
+
+def synthetic_skater_report(n_rows: int = 900) -> bytes:
+    """Build a body shaped like ``skater/summary`` with ``limit=-1``."""
+    rng = random.Random(1)
+    data = [
+        {
+            "playerId": 8470000 + i,
+            "skaterFullName": f"Player {i}",
+            "teamAbbrevs": "TOR",
+            "positionCode": "C",
+            "gamesPlayed": rng.randint(1, 82),
+            "goals": rng.randint(0, 60),
+            "assists": rng.randint(0, 80),
+            "points": rng.randint(0, 140),
+            "plusMinus": rng.randint(-30, 30),
+            "penaltyMinutes": rng.randint(0, 100),
+            "pointsPerGame": rng.random() * 2,
+            "shootingPct": rng.random() * 0.25,
+            "timeOnIcePerGame": rng.random() * 1500,
+            "faceoffWinPct": rng.random(),
+            "seasonId": 20232024,
+        }
+        for i in range(n_rows)
+    ]
+    return json.dumps({"data": data, "total": n_rows}).encode("utf-8")
+
+
+def bench(name: str, body: bytes, number: int) -> None:
+    stdlib = min(timeit.repeat(lambda: json.loads(body), number=number, repeat=5))
+    fast = min(timeit.repeat(lambda: jsonlib.loads(body), number=number, repeat=5))
+    per_call = 1000 / number
+    print(
+        f"{name:<28} {len(body) / 1024:8.1f} KiB  "
+        f"json {stdlib * per_call:7.3f} ms  "
+        f"{jsonlib.BACKEND} {fast * per_call:7.3f} ms  "
+        f"x{stdlib / fast:5.2f}"
+    )
+
+
+def main(paths) -> None:
+    print(f"backend: {jsonlib.BACKEND}")
+    if paths:
+        payloads = [(Path(p).name, Path(p).read_bytes()) for p in paths]
+    else:
+        payloads = [
+            ("play-by-play (synthetic)", synthetic_play_by_play()),
+            ("skater/summary (synthetic)", synthetic_skater_report()),
+        ]
+    for name, body in payloads:
+        bench(name, body, number=50)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
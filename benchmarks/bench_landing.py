@@ -0,0 +1,169 @@
+"""Benchmark flattening a league's worth of player landing payloads.
+
+Usage (from the repository root, with edgework installed or on PYTHONPATH):
+    python benchmarks/bench_landing.py [landing.json ...]
+
+Compares the previous closure-based ``landing_to_dict`` (nested helpers and
+uncompiled regexes rebuilt on every call) with the shared ``PayloadFlattener``
+engine. Without arguments, 900 synthetic landings are used.
+"""
+
+import json
+import random
+import re
+import sys
+import timeit
+from datetime import datetime
+from pathlib import Path
+
+from edgework.clients.player_client import landing_to_dict
+
+
+def _legacy_landing_to_dict(data: dict) -> dict:
+    """The pre-PayloadFlattener implementation, kept for comparison."""
+
+    def camel_to_snake(name):
+        s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
+        return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+
+    def process_value(value):
+        if value is None:
+            return None
+        if isinstance(value, dict):
+            if "default" in value:
+                return value["default"]
+            return {camel_to_snake(k): process_value(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [process_value(item) for item in value]
+        if isinstance(value, str):
+            for fmt in ["%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M:%SZ"]:
+                try:
+                    return datetime.strptime(value, fmt)
+                except ValueError:
+                    continue
+            return value
+        return value
+
+    def flatten(data, result, parent_key=""):
+        for key, value in data.items():
+            snake_key = camel_to_snake(key)
+            if key == "draftDetails" and isinstance(value, dict):
+                for draft_key, draft_value in value.items():
+                    draft_snake_key = f"draft_{camel_to_snake(draft_key)}"
+                    if draft_key == "year" and draft_value:
+                        result[draft_snake_key] = datetime(draft_value, 1, 1)
+                    else:
+                        result[draft_snake_key] = process_value(draft_value)
+            elif isinstance(value, dict) and "default" not in value:
+                flatten(
+                    value,
+                    result,
+                    f"{parent_key}_{snake_key}" if parent_key else snake_key,
+                )
+            else:
+                key_ = f"{parent_key}_{snake_key}" if parent_key else snake_key
+                result[key_] = process_value(value)
+
+    result = {}
+    flatten(data, result)
+    return result
+
+
+def synthetic_landing(player_id: int, rng: random.Random) -> dict:
+    """Build a landing payload with the structure of ``player/{id}/landing``."""
+    season_totals = [
+        {
+            "season": 20100000 + 10001 * year,
+            "gameTypeId": 2,
+            "leagueAbbrev": "NHL",
+            "teamName": {"default": "Edmonton Oilers", "fr": "Oilers d'Edmonton"},
+            "sequence": year,
+            "gamesPlayed": rng.randint(1, 82),
+            "goals": rng.randint(0, 60),
+            "assists": rng.randint(0, 80),
+            "points": rng.randint(0, 140),
+            "plusMinus": rng.randint(-30, 30),
+            "pim": rng.randint(0, 100),
+            "avgToi": f"{rng.randint(10, 25)}:{rng.randint(10, 59)}",
+        }
+        for year in range(rng.randint(1, 15))
+    ]
+    last5 = [
+        {
+            "gameId": 2023020000 + i,
+            "gameDate": f"2024-04-{10 + i:02d}",
+            "teamAbbrev": "EDM",
+            "homeRoadFlag": "H",
+            "opponentAbbrev": "CGY",
+            "opponentCommonName": {"default": "Flames"},
+            "goals": rng.randint(0, 3),
+            "assists": rng.randint(0, 3),
+            "toi": f"{rng.randint(10, 25)}:{rng.randint(10, 59)}",
+        }
+        for i in range(5)
+    ]
+    return {
+        "playerId": player_id,
+        "isActive": True,
+        "currentTeamId": 22,
+        "currentTeamAbbrev": "EDM",
+        "fullTeamName": {"default": "Edmonton Oilers", "fr": "Oilers d'Edmonton"},
+        "firstName": {"default": "First"},
+        "lastName": {"default": f"Last{player_id}"},
+        "teamLogo": "https://assets.nhle.com/logos/nhl/svg/EDM_light.svg",
+        "sweaterNumber": rng.randint(1, 99),
+        "position": "C",
+        "headshot": f"https://assets.nhle.com/mugs/nhl/20232024/EDM/{player_id}.png",
+        "heightInInches": 73,
+        "weightInPounds": 194,
+        "birthDate": "1997-01-13",
+        "birthCity": {"default": "Richmond Hill"},
+        "birthCountry": "CAN",
+        "shootsCatches": "L",
+        "draftDetails": {
+            "year": 2015,
+            "teamAbbrev": "EDM",
+            "round": 1,
+            "pickInRound": 1,
+            "overallPick": 1,
+        },
+        "featuredStats": {
+            "season": 20232024,
+            "regularSeason": {
+                "subSeason": {"gamesPlayed": 76, "goals": 32, "assists": 100},
+                "career": {"gamesPlayed": 645, "goals": 335, "assists": 647},
+            },
+        },
+        "careerTotals": {
+            "regularSeason": {"gamesPlayed": 645, "goals": 335, "avgToi": "21:28"},
+            "playoffs": {"gamesPlayed": 70, "goals": 38, "avgToi": "22:10"},
+        },
+        "last5Games": last5,
+        "seasonTotals": season_totals,
+    }
+
+
+def main(paths) -> None:
+    if paths:
+        landings = [json.loads(Path(p).read_bytes()) for p in paths]
+    else:
+        rng = random.Random(0)
+        landings = [synthetic_landing(8470000 + i, rng) for i in range(900)]
+    print(f"{len(landings)} landings")
+
+    legacy = min(
+        timeit.repeat(
+            lambda: [_legacy_landing_to_dict(d) for d in landings], number=1, repeat=5
+        )
+    )
+    current = min(
+        timeit.repeat(
+            lambda: [landing_to_dict(d) for d in landings], number=1, repeat=5
+        )
+    )
+    print(f"legacy closures    {legacy * 1000:8.1f} ms")
+    print(f"PayloadFlattener   {current * 1000:8.1f} ms  x{legacy / current:5.2f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,83 @@
+"""Measure memory held by Play records for a season of play-by-play.
+
+Usage (from the repository root, with edgework installed or on PYTHONPATH):
+    python benchmarks/bench_play_memory.py [--games N] [play-by-play.json]
+
+Builds Play records for N games (default: a full 1,312-game regular season)
+from a recorded or synthetic play-by-play payload, and reports the memory
+allocated for the records themselves (the decoded JSON is shared), comparing
+the previous dict-backed BaseNHLModel plays with the slotted records.
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from pathlib import Path
+
+from bench_json import synthetic_play_by_play
+
+from edgework.models.base import BaseNHLModel
+from edgework.models.play import Play
+
+
+class LegacyPlay(BaseNHLModel):
+    """The previous Play: a BaseNHLModel with a copied ``_data`` dict."""
+
+    def __init__(self, edgework_client, obj_id=None, **kwargs):
+        super().__init__(edgework_client, obj_id)
+        self._data = kwargs
+
+    @classmethod
+    def from_api(cls, data, client):
+        play = cls(
+            edgework_client=client,
+            event_id=data.get("eventId"),
+            period_number=data.get("periodDescriptor", {}).get("number"),
+            period_type=data.get("periodDescriptor", {}).get("periodType"),
+            time_in_period=data.get("timeInPeriod"),
+            time_remaining=data.get("timeRemaining"),
+            situation_code=data.get("situationCode"),
+            home_team_defending_side=data.get("homeTeamDefendingSide"),
+            type_code=data.get("typeCode"),
+            type_desc_key=data.get("typeDescKey"),
+            sort_order=data.get("sortOrder"),
+            details=data.get("details", {}),
+            ppt_replay_url=data.get("pptReplayUrl"),
+        )
+        play._fetched = True
+        return play
+
+
+def measure(cls, raw_plays, games):
+    gc.collect()
+    tracemalloc.start()
+    season = [[cls.from_api(p, None) for p in raw_plays] for _ in range(games)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    count = sum(len(game) for game in season)
+    del season
+    return current, count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("payload", nargs="?", help="recorded play-by-play JSON")
+    parser.add_argument("--games", type=int, default=1312)
+    args = parser.parse_args()
+
+    body = Path(args.payload).read_bytes() if args.payload else synthetic_play_by_play()
+    raw_plays = json.loads(body)["plays"]
+
+    legacy, count = measure(LegacyPlay, raw_plays, args.games)
+    slotted, _ = measure(Play, raw_plays, args.games)
+    print(f"{count} plays over {args.games} games")
+    print(f"legacy BaseNHLModel plays {legacy / 2**20:8.1f} MiB")
+    print(
+        f"slotted Play records      {slotted / 2**20:8.1f} MiB  "
+        f"({100 * (1 - slotted / legacy):.0f}% less)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Benchmark camelCase -> snake_case conversion of a full-season skater report.
+
+Usage (from the repository root, with edgework installed or on PYTHONPATH):
+    python benchmarks/bench_snake_case.py [skater_summary.json]
+
+Compares the original uncompiled, uncached conversion applied row by row, the
+memoized ``dict_camel_to_snake`` row by row, and the bulk
+``rows_camel_to_snake``. Without an argument, a synthetic ``skater/summary``
+body with ~900 rows is used.
+"""
+
+import json
+import re
+import sys
+import timeit
+from pathlib import Path
+
+from bench_json import synthetic_skater_report
+
+from edgework.utilities import dict_camel_to_snake, rows_camel_to_snake
+
+
+def _uncached_camel_to_snake(name):
+    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
+    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+
+
+def _uncached_dict_camel_to_snake(data):
+    if isinstance(data, dict):
+        return {
+            _uncached_camel_to_snake(k): (
+                _uncached_dict_camel_to_snake(v) if isinstance(v, (dict, list)) else v
+            )
+            for k, v in data.items()
+        }
+    if isinstance(data, list):
+        return [_uncached_dict_camel_to_snake(item) for item in data]
+    return data
+
+
+def main(paths) -> None:
+    body = Path(paths[0]).read_bytes() if paths else synthetic_skater_report()
+    rows = json.loads(body)["data"]
+    print(f"{len(rows)} rows x {len(rows[0])} keys")
+
+    candidates = [
+        ("uncached per row", lambda: [_uncached_dict_camel_to_snake(r) for r in rows]),
+        ("memoized per row", lambda: [dict_camel_to_snake(r) for r in rows]),
+        ("rows_camel_to_snake", lambda: rows_camel_to_snake(rows)),
+    ]
+    baseline = None
+    for name, func in candidates:
+        best = min(timeit.repeat(func, number=10, repeat=5)) / 10
+        baseline = baseline or best
+        print(f"{name:<22} {best * 1000:8.3f} ms  x{baseline / best:5.2f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -2,6 +2,6 @@
 
 __version__ = "0.4.8"
 
-from .edgework import Edgework
+from .edgework import AsyncEdgework, Edgework
 
-__all__ = ["Edgework", "__version__"]
+__all__ = ["AsyncEdgework", "Edgework", "__version__"]
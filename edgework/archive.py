@@ -0,0 +1,191 @@
+"""Durable SQLite archive for immutable final-game payloads."""
+
+import re
+import sqlite3
+import threading
+import zlib
+from datetime import datetime
+from typing import Optional, Tuple
+
+import httpx
+
+from .cache import FOREVER, CachedResponse, is_final_game_payload
+
+_GAMECENTER_RE = re.compile(r"/v1/gamecenter/(\d+)/(boxscore|play-by-play)/?$")
+_SHIFTCHARTS_PATH = "/stats/rest/en/shiftcharts"
+_SHIFT_GAME_RE = re.compile(r"^gameId=(\d+)$")
+_EMPTY_TOTAL_RE = re.compile(rb'"total"\s*:\s*0\s*[,}]')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS game_payloads (
+    game_id INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    body BLOB NOT NULL,
+    PRIMARY KEY (game_id, kind)
+)
+"""
+
+
+def archive_target(url: str) -> Optional[Tuple[int, str]]:
+    """
+    Identify archivable game payload URLs.
+
+    Args:
+        url: Full request URL including query parameters
+
+    Returns:
+        ``(game_id, kind)`` where kind is ``boxscore``, ``play-by-play`` or
+        ``shiftcharts``, or None if the URL is not archivable
+    """
+    parsed = httpx.URL(url)
+    match = _GAMECENTER_RE.search(parsed.path)
+    if match:
+        return int(match.group(1)), match.group(2)
+    if parsed.path.rstrip("/") == _SHIFTCHARTS_PATH:
+        match = _SHIFT_GAME_RE.match(parsed.params.get("cayenneExp", ""))
+        if match:
+            return int(match.group(1)), "shiftcharts"
+    return None
+
+
+def season_is_over(game_id: int, now: Optional[datetime] = None) -> bool:
+    """
+    Whether the season a game belongs to has finished.
+
+    Game IDs start with the season's first year (e.g. ``2023020001`` is in
+    2023-24); a season is treated as over from the following 1 September.
+
+    Args:
+        game_id: The NHL game ID
+        now: Reference time, defaults to now
+
+    Returns:
+        True if every game of that season is final
+    """
+    now = now or datetime.now()
+    start_year = game_id // 1_000_000
+    return (now.year, now.month) >= (start_year + 1, 9)
+
+
+class GameArchive:
+    """SQLite-backed store of boxscore, play-by-play and shift chart payloads.
+
+    Payloads are written only once they can no longer change: boxscores and
+    play-by-play when they report a ``gameState`` of ``OFF`` or ``FINAL``, and
+    shift charts once the game is known to be final (from an archived
+    boxscore/play-by-play, or because its season is over). Archived payloads
+    are served without any network request, across process restarts.
+    """
+
+    def __init__(self, path: str = "edgework-games.sqlite3"):
+        """
+        Initialize the archive.
+
+        Args:
+            path: SQLite database file; created if missing. Use ``":memory:"``
+                for a process-local archive.
+        """
+        self.path = path
+        self.hits: int = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(_SCHEMA)
+
+    def get(self, game_id: int, kind: str) -> Optional[bytes]:
+        """
+        Fetch an archived payload.
+
+        Args:
+            game_id: The NHL game ID
+            kind: ``boxscore``, ``play-by-play`` or ``shiftcharts``
+
+        Returns:
+            The raw JSON body, or None if not archived
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM game_payloads WHERE game_id = ? AND kind = ?",
+                (game_id, kind),
+            ).fetchone()
+        if row is None:
+            return None
+        return zlib.decompress(row[0])
+
+    def put(self, game_id: int, kind: str, body: bytes) -> None:
+        """
+        Archive a payload, replacing any previous one.
+
+        Args:
+            game_id: The NHL game ID
+            kind: ``boxscore``, ``play-by-play`` or ``shiftcharts``
+            body: The raw JSON body
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO game_payloads (game_id, kind, body) "
+                "VALUES (?, ?, ?)",
+                (game_id, kind, zlib.compress(body)),
+            )
+
+    def is_final(self, game_id: int) -> bool:
+        """Whether a final boxscore or play-by-play is archived for a game."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM game_payloads WHERE game_id = ? AND kind != ?",
+                (game_id, "shiftcharts"),
+            ).fetchone()
+        return row is not None
+
+    def lookup(self, url: str) -> Optional[httpx.Response]:
+        """
+        Serve a request from the archive.
+
+        Args:
+            url: Full request URL including query parameters
+
+        Returns:
+            The archived response, or None if the URL is not archived
+        """
+        target = archive_target(url)
+        if target is None:
+            return None
+        body = self.get(*target)
+        if body is None:
+            return None
+        self.hits += 1
+        entry = CachedResponse(
+            url=url,
+            status_code=200,
+            headers={"content-type": "application/json"},
+            content=body,
+            expires_at=FOREVER,
+        )
+        return entry.to_response()
+
+    def store(self, url: str, response: httpx.Response) -> None:
+        """
+        Archive a response if it is an immutable final-game payload.
+
+        Args:
+            url: Full request URL including query parameters
+            response: The successful response for ``url``
+        """
+        target = archive_target(url)
+        if target is None:
+            return
+        game_id, kind = target
+        if kind == "shiftcharts":
+            if not (self.is_final(game_id) or season_is_over(game_id)):
+                return
+            if _EMPTY_TOTAL_RE.search(response.content):
+                # Shift charts are published after the final horn; an empty
+                # payload may still be filled in later.
+                return
+        elif not is_final_game_payload(response.content):
+            return
+        self.put(game_id, kind, response.content)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
@@ -0,0 +1,520 @@
+"""Response caching for the NHL API HTTP clients."""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+import httpx
+
+from .endpoints import API_PATH
+from .jsonlib import JSONResponse
+
+FOREVER: float = float("inf")
+"""TTL for responses that never expire."""
+
+# TTLs in seconds, keyed by route family name from ``endpoints.API_PATH``.
+DEFAULT_TTLS: Dict[str, float] = {
+    # Live scoring
+    "score_now": 10,
+    "score_date": 60,
+    "scoreboard_now": 10,
+    "team_scoreboard": 10,
+    "where_to_watch": 3600,
+    "partner_game": 3600,
+    # Game centre (FINAL_GAME_ROUTES switch to FOREVER once the game is over)
+    "play_by_play": 10,
+    "game_landing": 10,
+    "game_boxscore": 10,
+    "game_story": 10,
+    "game_right_rail": 10,
+    "wsc_play_by_play": 10,
+    "goal_replay": FOREVER,
+    "play_replay": FOREVER,
+    # Players
+    "player_landing": 3600,
+    "player_game_logs": 300,
+    "player_game_log_now": 300,
+    "player_spotlight": 3600,
+    # Leaders and club stats
+    "skater_stats_now": 300,
+    "skater_stats_season_game_type": 3600,
+    "goalie_stats_now": 300,
+    "goalie_stats_season_game_type": 3600,
+    "club_stats": 300,
+    "club_stats_season": 3600,
+    "club_stats_season_season_game_type": 3600,
+    # Standings
+    "standings": 300,
+    "standings_date": 3600,
+    "standings_season": 86400,
+    # Teams and rosters
+    "teams": 6 * 3600,
+    "roster_current": 3600,
+    "roster_season": 86400,
+    "roster_season_team": 86400,
+    "team_prospects": 86400,
+    # Schedules
+    "club_schedule_season_now": 3600,
+    "club_schedule_season": 3600,
+    "club_schedule_month_now": 600,
+    "club_schedule_month": 600,
+    "club_schedule_week": 600,
+    "club_schedule_week_now": 600,
+    "schedule_now": 60,
+    "schedule_date": 300,
+    "schedule_calendar_now": 3600,
+    "schedule_calendar_date": 3600,
+    "tv_schedule_date": 3600,
+    "tv_schedule_now": 600,
+    # Playoffs
+    "playoff_series_carousel": 300,
+    "playoff_series_schedule": 300,
+    "playoff_bracket": 300,
+    # Draft
+    "draft_rankings_now": 3600,
+    "draft_rankings": 86400,
+    "draft_tracker_picks_now": 60,
+    "draft_picks_now": 300,
+    "draft_picks": 86400,
+    # Metadata
+    "season": 86400,
+    "meta": 86400,
+    "meta_game": 3600,
+    "location": 86400,
+    "meta_playoff_series": 3600,
+    "postal_lookup": 86400,
+    "openapi_spec": 86400,
+}
+
+# Game-scoped routes whose payloads are immutable once the game is final.
+FINAL_GAME_ROUTES = frozenset(
+    {
+        "play_by_play",
+        "game_landing",
+        "game_boxscore",
+        "game_story",
+        "game_right_rail",
+        "wsc_play_by_play",
+    }
+)
+
+_FINAL_STATE_RE = re.compile(rb'"gameState"\s*:\s*"(?:OFF|FINAL)"')
+_PLACEHOLDER_RE = re.compile(r"\{[^}]+\}")
+_PATH_PREFIXES = ("/stats/rest/en/", "/v1/")
+
+
+def is_final_game_payload(content: bytes) -> bool:
+    """Whether a raw game payload reports a ``gameState`` of OFF or FINAL."""
+    return _FINAL_STATE_RE.search(content) is not None
+
+
+def _compile_routes() -> list:
+    """Compile ``API_PATH`` templates into (name, regex) pairs.
+
+    Routes with fewer placeholders come first so that literal routes such as
+    ``standings/now`` win over ``standings/{date}``.
+    """
+    routes = []
+    for name, template in API_PATH.items():
+        path = template.replace("/{API_VERSION}/", "", 1).strip("/")
+        pattern = "[^/]+".join(re.escape(part) for part in _PLACEHOLDER_RE.split(path))
+        routes.append((path.count("{"), name, re.compile(f"^{pattern}/?$")))
+    routes.sort(key=lambda route: route[0])
+    return [(name, regex) for _, name, regex in routes]
+
+
+class CachePolicy:
+    """Decides how long a response may be cached, per route family.
+
+    Route families are the keys of ``endpoints.API_PATH``. Game centre routes
+    (``FINAL_GAME_ROUTES``) are cached forever once the payload reports a
+    ``gameState`` of ``OFF`` or ``FINAL``.
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 300,
+    ):
+        """
+        Initialize the cache policy.
+
+        Args:
+            ttls: TTL overrides in seconds, keyed by ``API_PATH`` route name.
+                Use 0 to disable caching for a route and ``FOREVER`` to never
+                expire it.
+            default_ttl: TTL for URLs that match no known route.
+        """
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self._routes = _compile_routes()
+
+    def route_for(self, url: str) -> Optional[str]:
+        """
+        Return the ``API_PATH`` route name matching a URL, if any.
+
+        Args:
+            url: Full request URL
+
+        Returns:
+            The route name, or None if the URL matches no known route
+        """
+        path = httpx.URL(url).path
+        for prefix in _PATH_PREFIXES:
+            if path.startswith(prefix):
+                path = path[len(prefix) :]
+                break
+        else:
+            return None
+
+        for name, regex in self._routes:
+            if regex.match(path):
+                return name
+        return None
+
+    def ttl_for(self, url: str, content: bytes = b"") -> float:
+        """
+        Return the TTL in seconds for a response.
+
+        Args:
+            url: Full request URL
+            content: Raw response body
+
+        Returns:
+            TTL in seconds; 0 means do not cache, ``FOREVER`` means never expire
+        """
+        route = self.route_for(url)
+        if route is None:
+            return self.default_ttl
+        if route in FINAL_GAME_ROUTES and is_final_game_payload(content):
+            return FOREVER
+        return self.ttls.get(route, self.default_ttl)
+
+
+class CachedResponse:
+    """A cached HTTP response that can be turned back into ``httpx.Response``."""
+
+    __slots__ = ("url", "status_code", "headers", "content", "expires_at")
+
+    def __init__(
+        self,
+        url: str,
+        status_code: int,
+        headers: Dict[str, str],
+        content: bytes,
+        expires_at: float,
+    ):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.expires_at = expires_at
+
+    @classmethod
+    def from_response(cls, response: httpx.Response, ttl: float) -> "CachedResponse":
+        """Snapshot an ``httpx.Response`` with the given TTL."""
+        headers = {
+            k: v
+            for k, v in response.headers.items()
+            if k.lower()
+            not in ("content-encoding", "content-length", "transfer-encoding")
+        }
+        return cls(
+            url=str(response.request.url),
+            status_code=response.status_code,
+            headers=headers,
+            content=response.content,
+            expires_at=time.time() + ttl,
+        )
+
+    @property
+    def expired(self) -> bool:
+        """Whether the entry is past its expiry time."""
+        return time.time() >= self.expires_at
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers built from the ETag/Last-Modified."""
+        headers = {k.lower(): v for k, v in self.headers.items()}
+        validators = {}
+        if "etag" in headers:
+            validators["If-None-Match"] = headers["etag"]
+        if "last-modified" in headers:
+            validators["If-Modified-Since"] = headers["last-modified"]
+        return validators
+
+    def revalidated(self, response: httpx.Response, ttl: float) -> "CachedResponse":
+        """
+        Refresh the entry from a ``304 Not Modified`` response.
+
+        Args:
+            response: The 304 response; its validators replace the stored ones
+            ttl: New TTL in seconds
+
+        Returns:
+            A copy of the entry with updated validators and expiry
+        """
+        headers = dict(self.headers)
+        for name in ("etag", "last-modified", "cache-control", "expires", "date"):
+            value = response.headers.get(name)
+            if value is not None:
+                for key in [k for k in headers if k.lower() == name]:
+                    del headers[key]
+                headers[name] = value
+        return CachedResponse(
+            url=self.url,
+            status_code=self.status_code,
+            headers=headers,
+            content=self.content,
+            expires_at=time.time() + ttl,
+        )
+
+    def to_response(self) -> httpx.Response:
+        """Rebuild an ``httpx.Response`` from the cached snapshot."""
+        return JSONResponse(
+            status_code=self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=httpx.Request("GET", self.url),
+        )
+
+
+class ResponseCache:
+    """Interface for response cache backends.
+
+    Subclasses implement ``_get``, ``_set``, ``delete`` and ``clear``; hit,
+    miss and revalidation counting is handled here. Expired entries that carry
+    an ETag or Last-Modified validator are kept so they can be revalidated
+    with a conditional request instead of downloaded again.
+    """
+
+    def __init__(self):
+        self.hits: int = 0
+        self.misses: int = 0
+        self.revalidations: int = 0
+        self._stats_lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Look up a fresh entry, counting the hit or miss.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached response, or None if absent or expired
+        """
+        entry = self._get(key)
+        if entry is not None and entry.expired:
+            if not entry.validators:
+                self.delete(key)
+            entry = None
+        with self._stats_lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry
+
+    def get_stale(self, key: str) -> Optional[CachedResponse]:
+        """
+        Look up an entry that can be revalidated, fresh or not.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached response if it has validators, otherwise None
+        """
+        entry = self._get(key)
+        if entry is None or not entry.validators:
+            return None
+        return entry
+
+    def revalidate(self, key: str, entry: CachedResponse) -> None:
+        """
+        Store an entry refreshed by a ``304 Not Modified`` response.
+
+        Args:
+            key: Cache key
+            entry: The refreshed entry
+        """
+        with self._stats_lock:
+            self.revalidations += 1
+        self._set(key, entry)
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """
+        Store an entry.
+
+        Args:
+            key: Cache key
+            entry: Response snapshot to store
+        """
+        self._set(key, entry)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/revalidation counters."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+        }
+
+    def _get(self, key: str) -> Optional[CachedResponse]:
+        raise NotImplementedError("_get() must be implemented in subclasses")
+
+    def _set(self, key: str, entry: CachedResponse) -> None:
+        raise NotImplementedError("_set() must be implemented in subclasses")
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        raise NotImplementedError("delete() must be implemented in subclasses")
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        raise NotImplementedError("clear() must be implemented in subclasses")
+
+
+class MemoryCache(ResponseCache):
+    """Thread-safe in-memory LRU cache bounded by entry count and body bytes."""
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize the memory cache.
+
+        Args:
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of cached response bodies
+        """
+        super().__init__()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Total bytes of cached response bodies."""
+        return self._size
+
+    def _get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _set(self, key: str, entry: CachedResponse) -> None:
+        size = len(entry.content)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old.content)
+            self._entries[key] = entry
+            self._size += size
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.content)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old.content)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+class DiskCache(ResponseCache):
+    """File-per-entry cache in a directory, surviving process restarts.
+
+    Each entry is a JSON metadata line followed by the raw response body.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Initialize the disk cache.
+
+        Args:
+            directory: Directory to store entries in; created if missing
+        """
+        super().__init__()
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.cache")
+
+    def _get(self, key: str) -> Optional[CachedResponse]:
+        try:
+            with open(self._path(key), "rb") as fh:
+                meta = json.loads(fh.readline())
+                content = fh.read()
+        except (OSError, ValueError):
+            return None
+        expires_at = meta["expires_at"]
+        return CachedResponse(
+            url=meta["url"],
+            status_code=meta["status_code"],
+            headers=meta["headers"],
+            content=content,
+            expires_at=FOREVER if expires_at is None else expires_at,
+        )
+
+    def _set(self, key: str, entry: CachedResponse) -> None:
+        meta = {
+            "url": entry.url,
+            "status_code": entry.status_code,
+            "headers": entry.headers,
+            "expires_at": None if entry.expires_at == FOREVER else entry.expires_at,
+        }
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as fh:
+            fh.write(json.dumps(meta).encode("utf-8") + b"\n")
+            fh.write(entry.content)
+        os.replace(tmp_path, path)
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        for name in os.listdir(self.directory):
+            if name.endswith(".cache"):
+                os.remove(os.path.join(self.directory, name))
+
+
+def cache_key(url: str, params: Optional[Dict] = None) -> str:
+    """
+    Build the cache key for a request from its resolved URL and params.
+
+    Args:
+        url: Full request URL, possibly with a query string
+        params: Optional query parameters merged into the URL
+
+    Returns:
+        The normalized URL string used as the cache key
+    """
+    resolved = httpx.URL(url)
+    if params:
+        resolved = resolved.copy_merge_params(params)
+    return str(resolved)
@@ -2,10 +2,94 @@
 
 from typing import Dict, List, Optional
 
-from edgework.http_client import HttpClient
+from edgework.http_client import AsyncHttpClient, HttpClient
 from edgework.models.draft import Draft, Draftee, DraftRanking
 
 
+def _season_id(season: str) -> str:
+    """Convert a "YYYY-YYYY" season string to the API's "YYYYYYYY" form."""
+    try:
+        start_year, end_year = season.split("-")
+        return f"{start_year}{end_year}"
+    except (ValueError, AttributeError):
+        raise ValueError(
+            f"Invalid season format: '{season}'. Expected format: 'YYYY-YYYY'"
+        )
+
+
+def _draft_picks_path(season: Optional[str], round_num: Optional[str]) -> str:
+    """Build the draft picks path for a season, or the current draft."""
+    if season:
+        return f"draft/picks/{_season_id(season)}/{round_num}"
+    return "draft/picks/now"
+
+
+def _draft_rankings_path(season: Optional[str], prospect_category: str) -> str:
+    """Build the draft rankings path for a season, or the current rankings."""
+    if season:
+        return f"draft/rankings/{_season_id(season)}/{prospect_category}"
+    return "draft/rankings/now"
+
+
+def _draft_from_response(client, data: dict) -> Draft:
+    """Build a Draft object from a draft picks response."""
+    return Draft(
+        edgework_client=client,
+        year=data.get("draftYear"),
+        rounds=data.get("rounds", []),
+        picks=data.get("picks", []),
+        _raw_data=data,
+    )
+
+
+def _draft_ranking_from_response(client, data: dict) -> DraftRanking:
+    """Build a DraftRanking object from a draft rankings response."""
+    return DraftRanking(
+        edgework_client=client,
+        rankings=data.get("rankings", []),
+        _raw_data=data,
+    )
+
+
+def _draftee_from_landing(client, player_id: int, data: dict) -> Optional[Draftee]:
+    """Build a Draftee from a player landing response, if it has draft details."""
+    draft_details = data.get("draftDetails")
+    if not draft_details:
+        return None
+
+    return Draftee(
+        edgework_client=client,
+        player_id=player_id,
+        first_name=data.get("firstName", {}).get("default", ""),
+        last_name=data.get("lastName", {}).get("default", ""),
+        year=draft_details.get("year"),
+        round=draft_details.get("round"),
+        overall_pick=draft_details.get("overallPick"),
+        pick_in_round=draft_details.get("pickInRound"),
+        team_abbrev=draft_details.get("teamAbbrev"),
+        _raw_data=draft_details,
+    )
+
+
+def _prospect_from_response(client, prospect_id: int, data: dict) -> Optional[Draftee]:
+    """Build a Draftee from a prospect response, or None when it is empty."""
+    if not data:
+        return None
+
+    return Draftee(
+        edgework_client=client,
+        prospect_id=prospect_id,
+        first_name=data.get("firstName", {}).get("default", ""),
+        last_name=data.get("lastName", {}).get("default", ""),
+        position=data.get("position", ""),
+        height=data.get("height"),
+        weight=data.get("weight"),
+        birth_date=data.get("birthDate"),
+        birth_country=data.get("birthCountry"),
+        _raw_data=data,
+    )
+
+
 class DraftClient:
     """Client for fetching NHL draft data."""
 
@@ -30,28 +114,9 @@ class DraftClient:
         Returns:
             Draft object containing draft picks data.
         """
-        if season:
-            try:
-                start_year, end_year = season.split("-")
-                season_id = f"{start_year}{end_year}"
-            except (ValueError, AttributeError):
-                raise ValueError(
-                    f"Invalid season format: '{season}'. Expected format: 'YYYY-YYYY'"
-                )
-            path = f"draft/picks/{season_id}/{round_num}"
-        else:
-            path = "draft/picks/now"
-
+        path = _draft_picks_path(season, round_num)
         response = self._client.get(path, web=True, params={})
-        data = response.json()
-
-        return Draft(
-            edgework_client=self._client,
-            year=data.get("draftYear"),
-            rounds=data.get("rounds", []),
-            picks=data.get("picks", []),
-            _raw_data=data,
-        )
+        return _draft_from_response(self._client, response.json())
 
     def get_draft_rankings(
         self, season: Optional[str] = None, prospect_category: str = "all"
@@ -66,26 +131,9 @@ class DraftClient:
         Returns:
             DraftRanking object containing draft rankings data.
         """
-        if season:
-            try:
-                start_year, end_year = season.split("-")
-                season_id = f"{start_year}{end_year}"
-            except (ValueError, AttributeError):
-                raise ValueError(
-                    f"Invalid season format: '{season}'. Expected format: 'YYYY-YYYY'"
-                )
-            path = f"draft/rankings/{season_id}/{prospect_category}"
-        else:
-            path = "draft/rankings/now"
-
+        path = _draft_rankings_path(season, prospect_category)
         response = self._client.get(path, web=True, params={})
-        data = response.json()
-
-        return DraftRanking(
-            edgework_client=self._client,
-            rankings=data.get("rankings", []),
-            _raw_data=data,
-        )
+        return _draft_ranking_from_response(self._client, response.json())
 
     def get_draft_tracker_picks(self) -> List[Dict]:
         """Fetch current draft tracker picks.
@@ -110,22 +158,7 @@ class DraftClient:
             response = self._client.get(
                 f"player/{player_id}/landing", web=True, params={}
             )
-            data = response.json()
-
-            draft_details = data.get("draftDetails")
-            if draft_details:
-                return Draftee(
-                    edgework_client=self._client,
-                    player_id=player_id,
-                    first_name=data.get("firstName", {}).get("default", ""),
-                    last_name=data.get("lastName", {}).get("default", ""),
-                    year=draft_details.get("year"),
-                    round=draft_details.get("round"),
-                    overall_pick=draft_details.get("overallPick"),
-                    pick_in_round=draft_details.get("pickInRound"),
-                    team_abbrev=draft_details.get("teamAbbrev"),
-                    _raw_data=draft_details,
-                )
+            return _draftee_from_landing(self._client, player_id, response.json())
         except Exception:
             pass
 
@@ -141,20 +174,95 @@ class DraftClient:
             Draftee object if found, None otherwise.
         """
         response = self._client.get(f"prospects/{prospect_id}", web=True, params={})
+        return _prospect_from_response(self._client, prospect_id, response.json())
+
+
+class AsyncDraftClient:
+    """Asynchronous client for fetching NHL draft data."""
+
+    def __init__(self, client: AsyncHttpClient):
+        """Initialize the async draft client.
+
+        Args:
+            client: Async HTTP client instance for making API requests.
+        """
+        self._client = client
+
+    async def get_draft_picks(
+        self, season: Optional[str] = None, round_num: Optional[str] = "all"
+    ) -> Draft:
+        """Fetch draft picks for a specific season or current draft.
+
+        Args:
+            season: Season in format "YYYY-YYYY" (e.g., "2023-2024").
+                If None, fetches current draft.
+            round_num: Round number to fetch (default: "all" for all rounds).
+
+        Returns:
+            Draft object containing draft picks data.
+        """
+        path = _draft_picks_path(season, round_num)
+        response = await self._client.get(path, web=True, params={})
+        return _draft_from_response(self._client, response.json())
+
+    async def get_draft_rankings(
+        self, season: Optional[str] = None, prospect_category: str = "all"
+    ) -> DraftRanking:
+        """Fetch draft rankings for a specific season or current rankings.
+
+        Args:
+            season: Season in format "YYYY-YYYY" (e.g., "2023-2024").
+                If None, fetches current rankings.
+            prospect_category: Category of prospects to fetch (default: "all").
+
+        Returns:
+            DraftRanking object containing draft rankings data.
+        """
+        path = _draft_rankings_path(season, prospect_category)
+        response = await self._client.get(path, web=True, params={})
+        return _draft_ranking_from_response(self._client, response.json())
+
+    async def get_draft_tracker_picks(self) -> List[Dict]:
+        """Fetch current draft tracker picks.
+
+        Returns:
+            List of draft picks from the tracker.
+        """
+        response = await self._client.get(
+            "draft-tracker/picks/now", web=True, params={}
+        )
         data = response.json()
+        return data.get("picks", [])
 
-        if data:
-            return Draftee(
-                edgework_client=self._client,
-                prospect_id=prospect_id,
-                first_name=data.get("firstName", {}).get("default", ""),
-                last_name=data.get("lastName", {}).get("default", ""),
-                position=data.get("position", ""),
-                height=data.get("height"),
-                weight=data.get("weight"),
-                birth_date=data.get("birthDate"),
-                birth_country=data.get("birthCountry"),
-                _raw_data=data,
+    async def get_draftee(self, player_id: int) -> Optional[Draftee]:
+        """Fetch draft information for a specific player.
+
+        Args:
+            player_id: The NHL player ID.
+
+        Returns:
+            Draftee object if found, None otherwise.
+        """
+        try:
+            response = await self._client.get(
+                f"player/{player_id}/landing", web=True, params={}
             )
+            return _draftee_from_landing(self._client, player_id, response.json())
+        except Exception:
+            pass
 
         return None
+
+    async def get_prospect_info(self, prospect_id: int) -> Optional[Draftee]:
+        """Fetch prospect information by prospect ID.
+
+        Args:
+            prospect_id: The NHL prospect ID.
+
+        Returns:
+            Draftee object if found, None otherwise.
+        """
+        response = await self._client.get(
+            f"prospects/{prospect_id}", web=True, params={}
+        )
+        return _prospect_from_response(self._client, prospect_id, response.json())
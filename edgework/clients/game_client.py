@@ -1,13 +1,92 @@
 """Game client for fetching NHL game data."""
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Union
 
-from edgework.http_client import HttpClient
+from edgework.http_client import AsyncHttpClient, HttpClient
 from edgework.models.game import Game
 from edgework.models.game_events import GameEvent
 from edgework.models.play_by_play import PlayByPlay
 from edgework.models.shift import Shift
+from edgework.models.shift_timeline import ShiftTimeline
+
+
+def boxscore_to_dict(data: dict) -> dict:
+    """Convert boxscore API response data to game dictionary format."""
+    return {
+        "game_id": data.get("id"),
+        "game_date": datetime.strptime(data.get("gameDate"), "%Y-%m-%d"),
+        "start_time_utc": datetime.strptime(
+            data.get("startTimeUTC"), "%Y-%m-%dT%H:%M:%SZ"
+        ),
+        "game_state": data.get("gameState"),
+        "away_team_abbrev": data.get("awayTeam").get("abbrev"),
+        "away_team_id": data.get("awayTeam").get("id"),
+        "away_team_score": data.get("awayTeam").get("score"),
+        "home_team_abbrev": data.get("homeTeam").get("abbrev"),
+        "home_team_id": data.get("homeTeam").get("id"),
+        "home_team_score": data.get("homeTeam").get("score"),
+        "season": data.get("season"),
+        "venue": data.get("venue").get("default"),
+    }
+
+
+def schedule_game_ids(data: dict) -> List[int]:
+    """Extract the game IDs from a schedule API response."""
+    return [
+        game.get("id")
+        for game_data in data.get("gameWeek", [])
+        for game in game_data.get("games", [])
+        if game.get("id")
+    ]
+
+
+def schedule_game_to_dict(game: dict, game_date: Optional[str] = None) -> dict:
+    """Convert a schedule game entry to game dictionary format.
+
+    Produces the same keys as :func:`boxscore_to_dict`, so games built from a
+    schedule page need no extra boxscore request.
+
+    Args:
+        game: A game entry from a schedule ``gameWeek`` day.
+        game_date: The ``date`` of the enclosing ``gameWeek`` day, if known.
+    """
+    start_time = game.get("startTimeUTC")
+    away_team = game.get("awayTeam") or {}
+    home_team = game.get("homeTeam") or {}
+    venue = game.get("venue") or {}
+    return {
+        "game_id": game.get("id"),
+        "game_date": datetime.strptime(game_date, "%Y-%m-%d") if game_date else None,
+        "start_time_utc": (
+            datetime.strptime(start_time, "%Y-%m-%dT%H:%M:%SZ") if start_time else None
+        ),
+        "game_state": game.get("gameState"),
+        "away_team_abbrev": away_team.get("abbrev"),
+        "away_team_id": away_team.get("id"),
+        "away_team_score": away_team.get("score"),
+        "home_team_abbrev": home_team.get("abbrev"),
+        "home_team_id": home_team.get("id"),
+        "home_team_score": home_team.get("score"),
+        "season": game.get("season"),
+        "venue": venue.get("default"),
+    }
+
+
+def schedule_to_games(data: dict, client) -> List[Game]:
+    """Build Game objects directly from a schedule API response."""
+    games = []
+    for game_data in data.get("gameWeek", []):
+        for game in game_data.get("games", []):
+            if game.get("id"):
+                game_obj = Game.from_dict(
+                    schedule_game_to_dict(game, game_data.get("date")), client
+                )
+                game_obj._fetched = True
+                games.append(game_obj)
+    return games
 
 
 class GameClient:
@@ -27,25 +106,7 @@ class GameClient:
         """
         response = self._client.get(f"gamecenter/{game_id}/boxscore", web=True)
         data = response.json()
-
-        game_dict = {
-            "game_id": data.get("id"),
-            "game_date": datetime.strptime(data.get("gameDate"), "%Y-%m-%d"),
-            "start_time_utc": datetime.strptime(
-                data.get("startTimeUTC"), "%Y-%m-%dT%H:%M:%SZ"
-            ),
-            "game_state": data.get("gameState"),
-            "away_team_abbrev": data.get("awayTeam").get("abbrev"),
-            "away_team_id": data.get("awayTeam").get("id"),
-            "away_team_score": data.get("awayTeam").get("score"),
-            "home_team_abbrev": data.get("homeTeam").get("abbrev"),
-            "home_team_id": data.get("homeTeam").get("id"),
-            "home_team_score": data.get("homeTeam").get("score"),
-            "season": data.get("season"),
-            "venue": data.get("venue").get("default"),
-        }
-
-        return Game.from_dict(game_dict, self._client)
+        return Game.from_dict(boxscore_to_dict(data), self._client)
 
     def get_play_by_play(self, game_id: int) -> PlayByPlay:
         """Fetch play-by-play data for a game.
@@ -162,11 +223,34 @@ class GameClient:
         data = response.json()["data"]
         return [Shift.from_api(d) for d in data]
 
-    def get_games_for_date(self, date: Union[datetime, str]) -> List[Game]:
+    def get_shift_timeline(self, game_id: int) -> ShiftTimeline:
+        """Fetch a game's shifts as a timeline indexed by game second.
+
+        Args:
+            game_id: The NHL game ID.
+
+        Returns:
+            ShiftTimeline for the game.
+        """
+        response = self._client.get(f"shiftcharts?cayenneExp=gameId={game_id}")
+        return ShiftTimeline.from_api(response.json()["data"])
+
+    def get_games_for_date(
+        self,
+        date: Union[datetime, str],
+        hydrate: bool = False,
+        max_workers: int = 8,
+    ) -> List[Game]:
         """Fetch all games for a specific date.
 
+        By default games are built from the schedule response alone, costing a
+        single request. With ``hydrate=True`` each game's boxscore is fetched
+        as well, on a thread pool of at most ``max_workers`` threads.
+
         Args:
             date: Date to fetch games for. Can be datetime or YYYY-MM-DD string.
+            hydrate: If True, fetch the full boxscore for every game.
+            max_workers: Maximum concurrent boxscore requests when hydrating.
 
         Returns:
             List of Game objects for that date.
@@ -178,30 +262,246 @@ class GameClient:
 
         response = self._client.get(f"schedule/{date_str}", web=True)
         data = response.json()
+        return self._games_from_schedule(data, hydrate, max_workers)
 
-        games = []
-        for game_data in data.get("gameWeek", []):
-            for game in game_data.get("games", []):
-                game_id = game.get("id")
-                if game_id:
-                    games.append(self.get_game(game_id))
-
-        return games
-
-    def get_current_games(self) -> List[Game]:
+    def get_current_games(
+        self, hydrate: bool = False, max_workers: int = 8
+    ) -> List[Game]:
         """Fetch all current/upcoming games.
 
+        Args:
+            hydrate: If True, fetch the full boxscore for every game.
+            max_workers: Maximum concurrent boxscore requests when hydrating.
+
         Returns:
             List of Game objects for current games.
         """
         response = self._client.get("schedule/now", web=True)
         data = response.json()
+        return self._games_from_schedule(data, hydrate, max_workers)
+
+    def _games_from_schedule(
+        self, data: dict, hydrate: bool, max_workers: int
+    ) -> List[Game]:
+        """Build games from a schedule page, optionally hydrating boxscores."""
+        if not hydrate:
+            return schedule_to_games(data, self._client)
+
+        game_ids = schedule_game_ids(data)
+        if not game_ids:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(game_ids))) as pool:
+            return list(pool.map(self.get_game, game_ids))
+
+
+class AsyncGameClient:
+    """Asynchronous client for fetching NHL game data."""
+
+    def __init__(self, client: AsyncHttpClient):
+        self._client = client
+
+    async def get_game(self, game_id: int) -> Game:
+        """Fetch game boxscore data.
+
+        Args:
+            game_id: The NHL game ID.
+
+        Returns:
+            Game object with boxscore data.
+        """
+        response = await self._client.get(f"gamecenter/{game_id}/boxscore", web=True)
+        data = response.json()
+        return Game.from_dict(boxscore_to_dict(data), self._client)
+
+    async def get_play_by_play(self, game_id: int) -> PlayByPlay:
+        """Fetch play-by-play data for a game.
+
+        Args:
+            game_id: The NHL game ID.
+
+        Returns:
+            PlayByPlay object with full play-by-play data.
+        """
+        response = await self._client.get(
+            f"gamecenter/{game_id}/play-by-play", web=True
+        )
+        data = response.json()
+        return PlayByPlay.from_api(data, self._client)
+
+    async def get_game_landing(self, game_id: int) -> Dict:
+        """Fetch game landing page data.
+
+        Args:
+            game_id: The NHL game ID.
+
+        Returns:
+            Dictionary with comprehensive game landing data.
+        """
+        response = await self._client.get(f"gamecenter/{game_id}/landing", web=True)
+        return response.json()
+
+    async def get_game_boxscore(self, game_id: int) -> Dict:
+        """Fetch game boxscore data as raw dictionary.
+
+        Args:
+            game_id: The NHL game ID.
+
+        Returns:
+            Dictionary with boxscore data.
+        """
+        response = await self._client.get(f"gamecenter/{game_id}/boxscore", web=True)
+        return response.json()
+
+    async def get_game_story(self, game_id: int) -> Dict:
+        """Fetch game story/narrative data.
+
+        Args:
+            game_id: The NHL game ID.
+
+        Returns:
+            Dictionary with game story data.
+        """
+        response = await self._client.get(f"wsc/game-story/{game_id}", web=True)
+        return response.json()
+
+    async def get_game_right_rail(self, game_id: int) -> Dict:
+        """Fetch game right rail data.
+
+        Args:
+            game_id: The NHL game ID.
+
+        Returns:
+            Dictionary with right rail game information.
+        """
+        response = await self._client.get(f"gamecenter/{game_id}/right-rail", web=True)
+        return response.json()
+
+    async def get_score(self, date: Optional[Union[datetime, str]] = None) -> Dict:
+        """Fetch score data for a specific date or current scores.
+
+        Args:
+            date: Date for scores. If None, fetches current scores.
+                  Can be datetime object or string in YYYY-MM-DD format.
+
+        Returns:
+            Dictionary with score data for the specified date.
+        """
+        if date is None:
+            response = await self._client.get("score/now", web=True)
+        else:
+            if isinstance(date, datetime):
+                date_str = date.strftime("%Y-%m-%d")
+            else:
+                date_str = date
+            response = await self._client.get(f"score/{date_str}", web=True)
+        return response.json()
+
+    async def get_scoreboard(self) -> Dict:
+        """Fetch current scoreboard data.
+
+        Returns:
+            Dictionary with current scoreboard information.
+        """
+        response = await self._client.get("scoreboard/now", web=True)
+        return response.json()
+
+    async def get_where_to_watch(self, country_code: str = "US") -> Dict:
+        """Fetch broadcast information for games.
+
+        Args:
+            country_code: Country code for broadcast info (default: "US").
+
+        Returns:
+            Dictionary with where to watch information.
+        """
+        response = await self._client.get(f"partner-game/{country_code}/now", web=True)
+        return response.json()
+
+    async def get_shifts(self, game_id: int) -> List[Shift]:
+        """Fetch shift data for a game.
+
+        Args:
+            game_id: The NHL game ID.
+
+        Returns:
+            List of Shift objects.
+        """
+        response = await self._client.get(f"shiftcharts?cayenneExp=gameId={game_id}")
+        data = response.json()["data"]
+        return [Shift.from_api(d) for d in data]
+
+    async def get_shift_timeline(self, game_id: int) -> ShiftTimeline:
+        """Fetch a game's shifts as a timeline indexed by game second.
+
+        Args:
+            game_id: The NHL game ID.
+
+        Returns:
+            ShiftTimeline for the game.
+        """
+        response = await self._client.get(f"shiftcharts?cayenneExp=gameId={game_id}")
+        return ShiftTimeline.from_api(response.json()["data"])
+
+    async def get_games_for_date(
+        self,
+        date: Union[datetime, str],
+        hydrate: bool = False,
+        max_workers: int = 8,
+    ) -> List[Game]:
+        """Fetch all games for a specific date.
+
+        By default games are built from the schedule response alone. With
+        ``hydrate=True`` boxscores are fetched concurrently, at most
+        ``max_workers`` at a time.
+
+        Args:
+            date: Date to fetch games for. Can be datetime or YYYY-MM-DD string.
+            hydrate: If True, fetch the full boxscore for every game.
+            max_workers: Maximum concurrent boxscore requests when hydrating.
+
+        Returns:
+            List of Game objects for that date.
+        """
+        if isinstance(date, datetime):
+            date_str = date.strftime("%Y-%m-%d")
+        else:
+            date_str = date
+
+        response = await self._client.get(f"schedule/{date_str}", web=True)
+        data = response.json()
+        return await self._games_from_schedule(data, hydrate, max_workers)
 
-        games = []
-        for game_data in data.get("gameWeek", []):
-            for game in game_data.get("games", []):
-                game_id = game.get("id")
-                if game_id:
-                    games.append(self.get_game(game_id))
+    async def get_current_games(
+        self, hydrate: bool = False, max_workers: int = 8
+    ) -> List[Game]:
+        """Fetch all current/upcoming games.
+
+        Args:
+            hydrate: If True, fetch the full boxscore for every game.
+            max_workers: Maximum concurrent boxscore requests when hydrating.
 
-        return games
+        Returns:
+            List of Game objects for current games.
+        """
+        response = await self._client.get("schedule/now", web=True)
+        data = response.json()
+        return await self._games_from_schedule(data, hydrate, max_workers)
+
+    async def _games_from_schedule(
+        self, data: dict, hydrate: bool, max_workers: int
+    ) -> List[Game]:
+        """Build games from a schedule page, optionally hydrating boxscores."""
+        if not hydrate:
+            return schedule_to_games(data, self._client)
+
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def fetch(game_id: int) -> Game:
+            async with semaphore:
+                return await self.get_game(game_id)
+
+        return list(
+            await asyncio.gather(
+                *(fetch(game_id) for game_id in schedule_game_ids(data))
+            )
+        )
@@ -3,7 +3,35 @@
 from datetime import datetime
 from typing import Dict, List, Optional, Union
 
-from edgework.http_client import HttpClient
+from edgework.http_client import AsyncHttpClient, HttpClient
+
+
+def _tv_schedule_path(date: Optional[Union[datetime, str]]) -> str:
+    """Build the TV schedule path for a date, or the current schedule."""
+    if date is None:
+        return "network/tv-schedule/now"
+    if isinstance(date, datetime):
+        date_str = date.strftime("%Y-%m-%d")
+    else:
+        date_str = date
+    return f"network/tv-schedule/{date_str}"
+
+
+def _broadcasts_from_landing(data: dict) -> List[Dict]:
+    """Extract broadcast information from a game landing response."""
+    broadcasts = []
+    tv_broadcasts = data.get("tvBroadcasts", [])
+
+    for broadcast in tv_broadcasts:
+        broadcasts.append(
+            {
+                "network": broadcast.get("network", ""),
+                "country": broadcast.get("countryCode", ""),
+                "type": broadcast.get("type", ""),
+            }
+        )
+
+    return broadcasts
 
 
 class NetworkClient:
@@ -32,14 +60,7 @@ class NetworkClient:
             - National and local TV networks
             - Streaming information
         """
-        if date is None:
-            response = self._client.get("network/tv-schedule/now", web=True)
-        else:
-            if isinstance(date, datetime):
-                date_str = date.strftime("%Y-%m-%d")
-            else:
-                date_str = date
-            response = self._client.get(f"network/tv-schedule/{date_str}", web=True)
+        response = self._client.get(_tv_schedule_path(date), web=True)
         return response.json()
 
     def get_tv_schedule_now(self) -> Dict:
@@ -77,24 +98,85 @@ class NetworkClient:
             - Streaming platforms
         """
         response = self._client.get(f"gamecenter/{game_id}/landing", web=True)
-        data = response.json()
+        return _broadcasts_from_landing(response.json())
+
+    def get_where_to_watch(self, country_code: str = "US") -> Dict:
+        """
+        Get broadcast information for current games.
+
+        Args:
+            country_code: Country code for broadcasts (default: "US")
+
+        Returns:
+            Dictionary with where to watch information for games.
+        """
+        response = self._client.get(f"partner-game/{country_code}/now", web=True)
+        return response.json()
 
-        # Extract broadcast information from game landing
-        broadcasts = []
-        tv_broadcasts = data.get("tvBroadcasts", [])
 
-        for broadcast in tv_broadcasts:
-            broadcasts.append(
-                {
-                    "network": broadcast.get("network", ""),
-                    "country": broadcast.get("countryCode", ""),
-                    "type": broadcast.get("type", ""),
-                }
-            )
+class AsyncNetworkClient:
+    """Asynchronous client for fetching NHL TV and broadcast data."""
 
-        return broadcasts
+    def __init__(self, client: AsyncHttpClient):
+        """
+        Initialize the async network client.
 
-    def get_where_to_watch(self, country_code: str = "US") -> Dict:
+        Args:
+            client: Async HTTP client instance for making API requests
+        """
+        self._client = client
+
+    async def get_tv_schedule(
+        self, date: Optional[Union[datetime, str]] = None
+    ) -> Dict:
+        """
+        Fetch TV schedule for games.
+
+        Args:
+            date: Date for TV schedule. If None, fetches current schedule.
+                  Can be datetime object or string in YYYY-MM-DD format.
+
+        Returns:
+            Dictionary with TV schedule information.
+        """
+        response = await self._client.get(_tv_schedule_path(date), web=True)
+        return response.json()
+
+    async def get_tv_schedule_now(self) -> Dict:
+        """
+        Fetch current TV schedule.
+
+        Returns:
+            Dictionary with current TV schedule.
+        """
+        return await self.get_tv_schedule()
+
+    async def get_tv_schedule_for_date(self, date: Union[datetime, str]) -> Dict:
+        """
+        Fetch TV schedule for a specific date.
+
+        Args:
+            date: Date for schedule (datetime or YYYY-MM-DD string)
+
+        Returns:
+            Dictionary with TV schedule for that date.
+        """
+        return await self.get_tv_schedule(date)
+
+    async def get_broadcasts_for_game(self, game_id: int) -> List[Dict]:
+        """
+        Get broadcast information for a specific game.
+
+        Args:
+            game_id: The NHL game ID
+
+        Returns:
+            List of broadcast dictionaries.
+        """
+        response = await self._client.get(f"gamecenter/{game_id}/landing", web=True)
+        return _broadcasts_from_landing(response.json())
+
+    async def get_where_to_watch(self, country_code: str = "US") -> Dict:
         """
         Get broadcast information for current games.
 
@@ -104,5 +186,5 @@ class NetworkClient:
         Returns:
             Dictionary with where to watch information for games.
         """
-        response = self._client.get(f"partner-game/{country_code}/now", web=True)
+        response = await self._client.get(f"partner-game/{country_code}/now", web=True)
         return response.json()
@@ -1,10 +1,13 @@
 """Player client for fetching player data from NHL APIs."""
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-from edgework.http_client import HttpClient
+from edgework.http_client import AsyncHttpClient, HttpClient
 from edgework.models.player import Player
+from edgework.utilities import PayloadFlattener, flatten_value
 
 
 def api_to_dict(data: dict) -> dict:
@@ -48,6 +51,22 @@ def api_to_dict(data: dict) -> dict:
     }
 
 
+def _draft_year(value):
+    """Convert a draft year to a datetime on 1 January of that year."""
+    if not value:
+        return flatten_value(value)
+    try:
+        return datetime(value, 1, 1)
+    except (ValueError, TypeError):
+        return value
+
+
+_LANDING_FLATTENER = PayloadFlattener(
+    prefixed={"draftDetails": "draft"},
+    transforms={"draft_year": _draft_year},
+)
+
+
 def landing_to_dict(data: dict) -> dict:
     """
     Convert API response data to player dictionary format with snake_case keys.
@@ -62,84 +81,45 @@ def landing_to_dict(data: dict) -> dict:
     Returns:
         Dictionary with snake_case field names and processed values
     """
+    return _LANDING_FLATTENER.flatten(data)
 
-    def camel_to_snake(name: str) -> str:
-        """Convert camelCase to snake_case."""
-        import re
 
-        # Insert underscores before uppercase letters (except at start)
-        s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-        # Insert underscores between lowercase/digit and uppercase
-        return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+def search_to_players(data) -> List[Player]:
+    """Convert a player search API response to Player objects."""
+    # The API returns a list directly, not a dict with "results"
+    if isinstance(data, list):
+        players_data = data
+    else:
+        # Fallback in case the API structure changes
+        players_data = data.get("results", [])
 
-    def process_value(value):
-        """Process a value, handling nested dictionaries and special cases."""
-        if value is None:
-            return None
+    return [Player(**api_to_dict(player)) for player in players_data]
+
+
+def spotlight_to_list(data) -> List[Dict]:
+    """Normalize a player spotlight API response to a list of players."""
+    if isinstance(data, list):
+        return data
+    elif isinstance(data, dict) and "spotlight" in data:
+        return data["spotlight"]
+    else:
+        return [data] if data else []
+
+
+def _unique_ids(player_ids: Iterable[int]) -> List[int]:
+    """Deduplicate player IDs, keeping first-seen order."""
+    return list(dict.fromkeys(player_ids))
 
-        # Handle nested dictionaries
-        if isinstance(value, dict):
-            # If it has a 'default' key, extract that value
-            if "default" in value:
-                return value["default"]
-            # Otherwise, recursively process the nested dictionary
-            return {camel_to_snake(k): process_value(v) for k, v in value.items()}
-
-        # Handle lists
-        elif isinstance(value, list):
-            return [process_value(item) for item in value]
-
-        # Handle date strings
-        elif isinstance(value, str):
-            # Try to parse common date formats
-            date_formats = ["%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M:%SZ"]
-            for fmt in date_formats:
-                try:
-                    return datetime.strptime(value, fmt)
-                except ValueError:
-                    continue
-            # If not a date, return as-is
-            return value
-
-        # Return primitive types as-is
-        else:
-            return value
-
-    def flatten_nested_objects(data: dict, result: dict, parent_key: str = "") -> None:
-        """Flatten nested objects with special handling for known structures."""
-        for key, value in data.items():
-            snake_key = camel_to_snake(key)
-
-            # Special handling for draft details
-            if key == "draftDetails" and isinstance(value, dict):
-                for draft_key, draft_value in value.items():
-                    draft_snake_key = f"draft_{camel_to_snake(draft_key)}"
-                    if draft_key == "year" and draft_value:
-                        try:
-                            result[draft_snake_key] = datetime(draft_value, 1, 1)
-                        except (ValueError, TypeError):
-                            result[draft_snake_key] = draft_value
-                    else:
-                        result[draft_snake_key] = process_value(draft_value)
-
-            # For other nested objects, process normally
-            elif isinstance(value, dict) and "default" not in value:
-                # If it's a complex nested object, flatten it with prefix
-                if parent_key:
-                    new_key = f"{parent_key}_{snake_key}"
-                else:
-                    new_key = snake_key
-                flatten_nested_objects(value, result, new_key)
-
-            else:
-                # Process the value (will handle 'default' extraction)
-                final_key = f"{parent_key}_{snake_key}" if parent_key else snake_key
-                result[final_key] = process_value(value)
-
-    result = {}
-    flatten_nested_objects(data, result)
-
-    return result
+
+def _season_id(season: str) -> str:
+    """Convert a "YYYY-YYYY" season string to the API's "YYYYYYYY" form."""
+    try:
+        start_year, end_year = season.split("-")
+        return f"{start_year}{end_year}"
+    except (ValueError, AttributeError):
+        raise ValueError(
+            f"Invalid season format: '{season}'. Expected format: 'YYYY-YYYY'"
+        )
 
 
 class PlayerClient:
@@ -173,16 +153,7 @@ class PlayerClient:
             params["active"] = str(active).lower()
 
         response = self.client.get_raw(self.base_url, params=params)
-        data = response.json()
-
-        # The API returns a list directly, not a dict with "results"
-        if isinstance(data, list):
-            players_data = data
-        else:
-            # Fallback in case the API structure changes
-            players_data = data.get("results", [])
-
-        return [Player(**api_to_dict(player)) for player in players_data]
+        return search_to_players(response.json())
 
     def get_active_players(self, limit: int = 10000) -> List[Player]:
         """
@@ -254,13 +225,7 @@ class PlayerClient:
             - Monthly splits
         """
         # Convert season format (e.g., "2023-2024" -> "20232024")
-        try:
-            start_year, end_year = season.split("-")
-            season_id = f"{start_year}{end_year}"
-        except (ValueError, AttributeError):
-            raise ValueError(
-                f"Invalid season format: '{season}'. Expected format: 'YYYY-YYYY'"
-            )
+        season_id = _season_id(season)
 
         response = self.client.get(
             f"player/{player_id}/game-log/{season_id}/{game_type}", web=True
@@ -288,15 +253,7 @@ class PlayerClient:
             List of dictionaries with spotlight player information
         """
         response = self.client.get("player-spotlight", web=True)
-        data = response.json()
-
-        # Return list of spotlight players
-        if isinstance(data, list):
-            return data
-        elif isinstance(data, dict) and "spotlight" in data:
-            return data["spotlight"]
-        else:
-            return [data] if data else []
+        return spotlight_to_list(response.json())
 
     def get_player(self, player_id: int) -> Player:
         """
@@ -311,6 +268,36 @@ class PlayerClient:
         landing_data = self.get_player_landing(player_id)
         return Player(edgework_client=self.client, **landing_data)
 
+    def get_players(
+        self, player_ids: Iterable[int], concurrency: int = 8
+    ) -> Iterator[Tuple[int, Union[Player, Exception]]]:
+        """
+        Fetch many players in parallel, yielding each as soon as it arrives.
+
+        Duplicate IDs are fetched once. A failed lookup is yielded as its
+        exception instead of aborting the batch.
+
+        Args:
+            player_ids: NHL player IDs
+            concurrency: Maximum number of landing requests in flight
+
+        Yields:
+            ``(player_id, Player)`` on success or ``(player_id, exception)``
+            on failure, in completion order
+        """
+        ids = _unique_ids(player_ids)
+        if not ids:
+            return
+        pool = ThreadPoolExecutor(max_workers=min(concurrency, len(ids)))
+        try:
+            futures = {pool.submit(self.get_player, pid): pid for pid in ids}
+            for future in as_completed(futures):
+                error = future.exception()
+                yield futures[future], error if error is not None else future.result()
+        finally:
+            # Stop queued lookups if the caller abandons the iterator early.
+            pool.shutdown(wait=False, cancel_futures=True)
+
     def get_player_by_id(self, player_id: int) -> Optional[Player]:
         """
         Get a player by their NHL ID.
@@ -325,3 +312,182 @@ class PlayerClient:
             return self.get_player(player_id)
         except Exception:
             return None
+
+
+class AsyncPlayerClient:
+    """Asynchronous client for fetching player data."""
+
+    def __init__(self, http_client: AsyncHttpClient):
+        """
+        Initialize the async player client.
+
+        Args:
+            http_client: Async HTTP client instance
+        """
+        self.client = http_client
+        self.base_url = "https://search.d3.nhle.com/api/v1/search/player"
+
+    async def get_all_players(
+        self, active: Optional[bool] = None, limit: int = 10000
+    ) -> List[Player]:
+        """
+        Get all players from the NHL search API.
+
+        Args:
+            active: Filter by active status (True for active, False for inactive, None for all)
+            limit: Maximum number of players to return
+
+        Returns:
+            List of Player objects
+        """
+        params = {"culture": "en-us", "limit": limit, "q": "*"}
+        if active is not None:
+            params["active"] = str(active).lower()
+
+        response = await self.client.get_raw(self.base_url, params=params)
+        return search_to_players(response.json())
+
+    async def get_active_players(self, limit: int = 10000) -> List[Player]:
+        """
+        Get all active players.
+
+        Args:
+            limit: Maximum number of players to return
+
+        Returns:
+            List of active Player objects
+        """
+        return await self.get_all_players(active=True, limit=limit)
+
+    async def get_inactive_players(self, limit: int = 10000) -> List[Player]:
+        """
+        Get all inactive players.
+
+        Args:
+            limit: Maximum number of players to return
+
+        Returns:
+            List of inactive Player objects
+        """
+        return await self.get_all_players(active=False, limit=limit)
+
+    async def get_player_landing(self, player_id: int) -> Dict:
+        """
+        Fetch player landing page data with comprehensive player information.
+
+        Args:
+            player_id: The NHL player ID
+
+        Returns:
+            Dictionary with player landing data
+        """
+        response = await self.client.get(f"player/{player_id}/landing", web=True)
+        processed_data = landing_to_dict(response.json())
+        processed_data["player_id"] = player_id
+        return processed_data
+
+    async def get_player_game_logs(
+        self, player_id: int, season: str, game_type: int = 2
+    ) -> Dict:
+        """
+        Fetch game-by-game statistics for a player in a specific season.
+
+        Args:
+            player_id: The NHL player ID
+            season: Season in format "YYYY-YYYY" (e.g., "2023-2024")
+            game_type: Game type - 2 for Regular Season (default),
+                      3 for Playoffs, 1 for Pre-season
+
+        Returns:
+            Dictionary with game logs
+        """
+        season_id = _season_id(season)
+        response = await self.client.get(
+            f"player/{player_id}/game-log/{season_id}/{game_type}", web=True
+        )
+        return response.json()
+
+    async def get_player_game_log_now(self, player_id: int) -> Dict:
+        """
+        Fetch game-by-game statistics for the current season.
+
+        Args:
+            player_id: The NHL player ID
+
+        Returns:
+            Dictionary with current season game logs
+        """
+        response = await self.client.get(f"player/{player_id}/game-log/now", web=True)
+        return response.json()
+
+    async def get_player_spotlight(self) -> List[Dict]:
+        """
+        Fetch featured/spotlight players from the NHL.
+
+        Returns:
+            List of dictionaries with spotlight player information
+        """
+        response = await self.client.get("player-spotlight", web=True)
+        return spotlight_to_list(response.json())
+
+    async def get_player(self, player_id: int) -> Player:
+        """
+        Fetch player data by ID using the landing endpoint.
+
+        Args:
+            player_id: The NHL player ID
+
+        Returns:
+            Player object with comprehensive data
+        """
+        landing_data = await self.get_player_landing(player_id)
+        return Player(edgework_client=self.client, **landing_data)
+
+    async def get_players(
+        self, player_ids: Iterable[int], concurrency: int = 8
+    ) -> AsyncIterator[Tuple[int, Union[Player, Exception]]]:
+        """
+        Fetch many players concurrently, yielding each as soon as it arrives.
+
+        Duplicate IDs are fetched once. A failed lookup is yielded as its
+        exception instead of aborting the batch.
+
+        Args:
+            player_ids: NHL player IDs
+            concurrency: Maximum number of landing requests in flight
+
+        Yields:
+            ``(player_id, Player)`` on success or ``(player_id, exception)``
+            on failure, in completion order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(player_id: int) -> Tuple[int, Union[Player, Exception]]:
+            async with semaphore:
+                try:
+                    return player_id, await self.get_player(player_id)
+                except Exception as exc:
+                    return player_id, exc
+
+        tasks = [asyncio.ensure_future(fetch(pid)) for pid in _unique_ids(player_ids)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def get_player_by_id(self, player_id: int) -> Optional[Player]:
+        """
+        Get a player by their NHL ID.
+
+        Args:
+            player_id: The NHL player ID
+
+        Returns:
+            Player object if found, None otherwise
+        """
+        try:
+            return await self.get_player(player_id)
+        except Exception:
+            return None
@@ -2,7 +2,39 @@
 
 from typing import Dict, List, Optional
 
-from edgework.http_client import HttpClient
+from edgework.http_client import AsyncHttpClient, HttpClient
+
+
+def _season_id(season: str) -> str:
+    """Convert a "YYYY-YYYY" season string to the API's "YYYYYYYY" form."""
+    try:
+        start_year, end_year = season.split("-")
+        return f"{start_year}{end_year}"
+    except (ValueError, AttributeError):
+        raise ValueError(
+            f"Invalid season format: '{season}'. Expected format: 'YYYY-YYYY'"
+        )
+
+
+def _carousel_path(season: Optional[str]) -> str:
+    """Build the playoff series carousel path for a season, or the current one."""
+    if season:
+        return f"playoff-series/carousel/{_season_id(season)}/"
+    # Try to get current playoff series (no season specified)
+    return "playoff-series/carousel/"
+
+
+def _series_in_round(bracket: Dict, round_num: int) -> List[Dict]:
+    """Collect the series of one round from a playoff bracket response."""
+    series_list = []
+
+    # Navigate bracket structure based on round
+    rounds_data = bracket.get("rounds", [])
+    for round_data in rounds_data:
+        if round_data.get("roundNumber") == round_num:
+            series_list.extend(round_data.get("series", []))
+
+    return series_list
 
 
 class PlayoffClient:
@@ -47,20 +79,7 @@ class PlayoffClient:
             - Series summaries
             - Current playoff round
         """
-        if season:
-            try:
-                start_year, end_year = season.split("-")
-                season_id = f"{start_year}{end_year}"
-            except (ValueError, AttributeError):
-                raise ValueError(
-                    f"Invalid season format: '{season}'. Expected format: 'YYYY-YYYY'"
-                )
-            response = self._client.get(
-                f"playoff-series/carousel/{season_id}/", web=True
-            )
-        else:
-            # Try to get current playoff series (no season specified)
-            response = self._client.get("playoff-series/carousel/", web=True)
+        response = self._client.get(_carousel_path(season), web=True)
         return response.json()
 
     def get_playoff_series_schedule(self, season: str, series_letter: str) -> Dict:
@@ -78,13 +97,7 @@ class PlayoffClient:
             - Venue details
             - Series status
         """
-        try:
-            start_year, end_year = season.split("-")
-            season_id = f"{start_year}{end_year}"
-        except (ValueError, AttributeError):
-            raise ValueError(
-                f"Invalid season format: '{season}'. Expected format: 'YYYY-YYYY'"
-            )
+        season_id = _season_id(season)
 
         response = self._client.get(
             f"schedule/playoff-series/{season_id}/{series_letter}/", web=True
@@ -117,15 +130,7 @@ class PlayoffClient:
             List of series dictionaries for that round
         """
         bracket = self.get_playoff_bracket(int(season.split("-")[1]))
-        series_list = []
-
-        # Navigate bracket structure based on round
-        rounds_data = bracket.get("rounds", [])
-        for round_data in rounds_data:
-            if round_data.get("roundNumber") == round_num:
-                series_list.extend(round_data.get("series", []))
-
-        return series_list
+        return _series_in_round(bracket, round_num)
 
     def get_series_winner(self, season: str, series_letter: str) -> Optional[str]:
         """
@@ -143,3 +148,107 @@ class PlayoffClient:
             return schedule.get("seriesWinner", {}).get("abbrev")
         except Exception:
             return None
+
+
+class AsyncPlayoffClient:
+    """Asynchronous client for fetching NHL playoff data."""
+
+    def __init__(self, client: AsyncHttpClient):
+        """
+        Initialize the async playoff client.
+
+        Args:
+            client: Async HTTP client instance for making API requests
+        """
+        self._client = client
+
+    async def get_playoff_bracket(self, year: int) -> Dict:
+        """
+        Fetch the full playoff bracket for a specific year.
+
+        Args:
+            year: The year of the playoffs (e.g., 2024 for 2023-24 season)
+
+        Returns:
+            Dictionary with complete playoff bracket.
+        """
+        response = await self._client.get(f"playoff-bracket/{year}", web=True)
+        return response.json()
+
+    async def get_playoff_series_carousel(self, season: Optional[str] = None) -> Dict:
+        """
+        Fetch playoff series carousel data.
+
+        Args:
+            season: Season in format "YYYY-YYYY" (e.g., "2023-2024").
+                If None, fetches current playoff series.
+
+        Returns:
+            Dictionary with playoff series carousel data.
+        """
+        response = await self._client.get(_carousel_path(season), web=True)
+        return response.json()
+
+    async def get_playoff_series_schedule(
+        self, season: str, series_letter: str
+    ) -> Dict:
+        """
+        Fetch schedule for a specific playoff series.
+
+        Args:
+            season: Season in format "YYYY-YYYY" (e.g., "2023-2024")
+            series_letter: Series identifier (e.g., "A", "B", "C", etc.)
+
+        Returns:
+            Dictionary with series schedule.
+        """
+        season_id = _season_id(season)
+
+        response = await self._client.get(
+            f"schedule/playoff-series/{season_id}/{series_letter}/", web=True
+        )
+        return response.json()
+
+    async def get_current_playoff_bracket(self) -> Dict:
+        """
+        Fetch the current playoff bracket.
+
+        Returns:
+            Dictionary with current playoff bracket data.
+        """
+        from datetime import datetime
+
+        return await self.get_playoff_bracket(datetime.now().year)
+
+    async def get_playoff_series_by_round(
+        self, season: str, round_num: int
+    ) -> List[Dict]:
+        """
+        Get all series in a specific playoff round.
+
+        Args:
+            season: Season in format "YYYY-YYYY"
+            round_num: Playoff round number (1-4)
+
+        Returns:
+            List of series dictionaries for that round
+        """
+        bracket = await self.get_playoff_bracket(int(season.split("-")[1]))
+        return _series_in_round(bracket, round_num)
+
+    async def get_series_winner(self, season: str, series_letter: str) -> Optional[str]:
+        """
+        Get the winner of a specific playoff series.
+
+        Args:
+            season: Season in format "YYYY-YYYY"
+            series_letter: Series identifier
+
+        Returns:
+            Team abbreviation of the series winner, or None if series incomplete
+        """
+        try:
+            schedule = await self.get_playoff_series_schedule(season, series_letter)
+            return schedule.get("seriesWinner", {}).get("abbrev")
+        except Exception:
+            return None
@@ -1,8 +1,230 @@
+import asyncio
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from typing import AsyncIterator, Iterator, List, Optional, Tuple, Union
 
-from edgework.http_client import HttpClient
+from edgework.http_client import AsyncHttpClient, HttpClient
 from edgework.models.schedule import Schedule
+from edgework.models.season_schedule import SeasonSchedule
+
+
+def _validate_date_range(start_date: str, end_date: str) -> tuple[datetime, datetime]:
+    """Validate a schedule date range and return it as datetimes."""
+    # Validate the date format
+    if not re.match(r"\d{4}-\d{2}-\d{2}", start_date):
+        raise ValueError(
+            f"Invalid date format. Should be in the format of 'YYYY-MM-DD'. Start date given was {start_date}"
+        )
+    if not re.match(r"\d{4}-\d{2}-\d{2}", end_date):
+        raise ValueError(
+            f"Invalid date format. Should be in the format of 'YYYY-MM-DD'. End date given was {end_date}"
+        )
+
+    start_dt = datetime.fromisoformat(start_date)
+    end_dt = datetime.fromisoformat(end_date)
+
+    if start_dt > end_dt:
+        raise ValueError("Start date cannot be after end date.")
+
+    return start_dt, end_dt
+
+
+def _week_anchors(start_dt: datetime, end_dt: datetime) -> List[str]:
+    """
+    Predict the weekly page start dates covering a range.
+
+    Each ``schedule/{date}`` page covers seven days and points to the next one
+    via ``nextStartDate``, so the chain can be computed up front.
+    """
+    anchors = []
+    current = start_dt
+    while current.date() <= end_dt.date():
+        anchors.append(current.strftime("%Y-%m-%d"))
+        current += timedelta(days=7)
+    return anchors
+
+
+def _empty_range_schedule() -> dict:
+    """Return the metadata skeleton used to assemble a date-range schedule."""
+    return {
+        "previousStartDate": None,
+        "games": [],
+        "preSeasonStartDate": None,
+        "regularSeasonStartDate": None,
+        "regularSeasonEndDate": None,
+        "playoffEndDate": None,
+        "numberOfGames": 0,
+    }
+
+
+def _merge_schedule_page(
+    schedule_data: dict,
+    data: dict,
+    games: list,
+    seen_game_ids: set,
+    end_dt: datetime,
+) -> Optional[str]:
+    """
+    Merge one weekly schedule page into the accumulated range.
+
+    Returns:
+        The next week's start date (YYYY-MM-DD), or None when the range is done.
+    """
+    # Extract games from this page
+    page_games = [
+        game for day in data.get("gameWeek", []) for game in day.get("games", [])
+    ]
+
+    # Filter out duplicates
+    for game in page_games:
+        game_id = game.get("id")
+        if game_id not in seen_game_ids:
+            seen_game_ids.add(game_id)
+            games.append(game)
+
+    # Set metadata from first page
+    if not schedule_data["previousStartDate"]:
+        schedule_data["previousStartDate"] = data.get("previousStartDate")
+        schedule_data["preSeasonStartDate"] = data.get("preSeasonStartDate")
+
+    # Update season dates
+    if data.get("regularSeasonStartDate"):
+        schedule_data["regularSeasonStartDate"] = data.get("regularSeasonStartDate")
+    if data.get("regularSeasonEndDate"):
+        schedule_data["regularSeasonEndDate"] = data.get("regularSeasonEndDate")
+    if data.get("playoffEndDate"):
+        schedule_data["playoffEndDate"] = data.get("playoffEndDate")
+
+    return _next_page_date(data, end_dt)
+
+
+def _next_page_date(data: dict, end_dt: datetime) -> Optional[str]:
+    """Return the page's ``nextStartDate`` (YYYY-MM-DD), or None past the range."""
+    # Check if there's a next page
+    next_start_date = data.get("nextStartDate")
+    if not next_start_date:
+        return None
+    # Stop if we've gone past the requested end date
+    if datetime.fromisoformat(next_start_date).date() > end_dt.date():
+        return None
+    return next_start_date[:10]  # YYYY-MM-DD format
+
+
+def _predicted_pages(current: str, end_dt: datetime, count: int) -> List[str]:
+    """Return up to ``count`` weekly page dates from ``current`` within the range."""
+    return _week_anchors(datetime.fromisoformat(current), end_dt)[: max(1, count)]
+
+
+class _GameIdBitmap:
+    """Set of seen game IDs stored as one bit per game.
+
+    Game IDs are ``SSSSTTNNNN`` (season, game type, number), so each
+    season/type pair gets a 10,000-bit block: about 1.2 KB per season phase
+    regardless of how many pages repeat a game.
+    """
+
+    _BLOCK_BITS = 10_000
+
+    def __init__(self):
+        self._blocks = {}
+        self._other = set()
+
+    def add(self, game_id) -> bool:
+        """Mark a game ID as seen; return True if it was not seen before."""
+        if not isinstance(game_id, int) or game_id < 0:
+            # Unexpected IDs keep exact semantics in a plain set.
+            if game_id in self._other:
+                return False
+            self._other.add(game_id)
+            return True
+        prefix, number = divmod(game_id, self._BLOCK_BITS)
+        block = self._blocks.get(prefix)
+        if block is None:
+            block = self._blocks[prefix] = bytearray(self._BLOCK_BITS // 8)
+        byte, bit = divmod(number, 8)
+        mask = 1 << bit
+        if block[byte] & mask:
+            return False
+        block[byte] |= mask
+        return True
+
+
+def _page_games(
+    data: dict, first: str, last: str, seen: _GameIdBitmap, by_day: bool
+) -> list:
+    """Return a page's unseen games (or per-day batches) inside ``first..last``."""
+    items = []
+    for day in data.get("gameWeek", []):
+        date = day.get("date")
+        if date and not first <= date <= last:
+            continue
+        games = [game for game in day.get("games", []) if seen.add(game.get("id"))]
+        if not by_day:
+            items.extend(games)
+        elif games:
+            items.append((date, games))
+    return items
+
+
+def _build_range_schedule(
+    client, schedule_data: dict, games: list, start_dt: datetime, end_dt: datetime
+) -> Schedule:
+    """Filter accumulated games to the requested range and build the Schedule."""
+    filtered_games = []
+    for game in games:
+        try:
+            game_date = datetime.fromisoformat(
+                game.get("startTimeUTC", "").replace("Z", "+00:00")
+            ).date()
+            if start_dt.date() <= game_date <= end_dt.date():
+                filtered_games.append(game)
+        except (ValueError, AttributeError):
+            # If we can't parse the date, include the game to avoid losing data
+            filtered_games.append(game)
+
+    schedule_data["numberOfGames"] = len(filtered_games)
+    schedule_data["games"] = filtered_games
+    return Schedule.from_api(client, schedule_data)
+
+
+def _season_range(season: Union[int, str]) -> Tuple[str, str]:
+    """
+    Return a date range wide enough for a season like 20232024.
+
+    Runs from 1 Aug to 31 Oct of the following year so late or delayed
+    seasons (the 2019-20 playoffs ended on 28 Sep 2020) fit; games are then
+    kept by their ``season`` and the walk stops where the next season starts.
+    """
+    first_year = int(str(season)[:4])
+    return f"{first_year}-08-01", f"{first_year + 1}-10-31"
+
+
+def _season_day(day: str, games: List[dict], season: int) -> Optional[List[dict]]:
+    """
+    Keep the games of ``season`` played on ``day``.
+
+    Returns:
+        The day's games of the season with ``gameDate`` set, or None once a
+        game of a later season shows up; seasons never overlap, so nothing
+        after that day belongs to ``season``
+    """
+    kept = []
+    for game in games:
+        game_season = game.get("season")
+        if game_season is not None and game_season > season:
+            return None
+        if game_season in (None, season):
+            kept.append(dict(game, gameDate=day))
+    return kept
+
+
+def _validate_date(date: str) -> None:
+    """Raise ValueError unless ``date`` is a strict YYYY-MM-DD string."""
+    if not re.match(r"^\d{4}-\d{2}-\d{2}$", date):
+        raise ValueError(
+            "Invalid date format. Should be in the format of 'YYYY-MM-DD'."
+        )
 
 
 class ScheduleClient:
@@ -29,20 +251,21 @@ class ScheduleClient:
 
         """
         # Validate the date format
-        if not re.match(r"^\d{4}-\d{2}-\d{2}$", date):
-            raise ValueError(
-                "Invalid date format. Should be in the format of 'YYYY-MM-DD'."
-            )
+        _validate_date(date)
 
         response = self._client.get(f"schedule/{date}", web=True)
         data = response.json()
         return Schedule.from_api(self._client, data)
 
     def get_schedule_for_date_range(
-        self, start_date: str, end_date: str, web: bool = True
+        self, start_date: str, end_date: str, web: bool = True, max_workers: int = 8
     ) -> Schedule:
         """Get schedule for the given date range.
 
+        The weekly pages covering the range are fetched concurrently, then
+        merged by following ``nextStartDate``; a page the chain points to that
+        was not predicted is fetched on demand.
+
         Parameters
         ----------
         start_date : str
@@ -51,105 +274,134 @@ class ScheduleClient:
             The end date for which to get the schedule. Should be in the format of 'YYYY-MM-DD'.
         web : bool, optional
             Whether to use the web API endpoint. Defaults to True.
+        max_workers : int, optional
+            Maximum concurrent week requests. Defaults to 8.
 
         Returns
         -------
         Schedule
 
         """
-        # Validate the date format
-        if not re.match(r"\d{4}-\d{2}-\d{2}", start_date):
-            raise ValueError(
-                f"Invalid date format. Should be in the format of 'YYYY-MM-DD'. Start date given was {start_date}"
-            )
-        if not re.match(r"\d{4}-\d{2}-\d{2}", end_date):
-            raise ValueError(
-                f"Invalid date format. Should be in the format of 'YYYY-MM-DD'. End date given was {end_date}"
-            )
+        start_dt, end_dt = _validate_date_range(start_date, end_date)
 
-        start_dt = datetime.fromisoformat(start_date)
-        end_dt = datetime.fromisoformat(end_date)
+        def fetch(date: str) -> dict:
+            return self._client.get(f"schedule/{date}", web=web).json()
 
-        if start_dt > end_dt:
-            raise ValueError("Start date cannot be after end date.")
+        anchors = _week_anchors(start_dt, end_dt)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(anchors))) as pool:
+            pages = dict(zip(anchors, pool.map(fetch, anchors)))
 
         games = []
-        schedule_data = {
-            "previousStartDate": None,
-            "games": [],
-            "preSeasonStartDate": None,
-            "regularSeasonStartDate": None,
-            "regularSeasonEndDate": None,
-            "playoffEndDate": None,
-            "numberOfGames": 0,
-        }
+        schedule_data = _empty_range_schedule()
 
         # Track seen game IDs to avoid duplicates
         seen_game_ids = set()
 
         current_date = start_date
         while current_date:
-            response = self._client.get(f"schedule/{current_date}", web=web)
-            data = response.json()
-
-            # Extract games from this page
-            page_games = [
-                game
-                for day in data.get("gameWeek", [])
-                for game in day.get("games", [])
-            ]
-
-            # Filter out duplicates
-            for game in page_games:
-                game_id = game.get("id")
-                if game_id not in seen_game_ids:
-                    seen_game_ids.add(game_id)
-                    games.append(game)
-
-            # Set metadata from first page
-            if not schedule_data["previousStartDate"]:
-                schedule_data["previousStartDate"] = data.get("previousStartDate")
-                schedule_data["preSeasonStartDate"] = data.get("preSeasonStartDate")
-
-            # Update season dates
-            if data.get("regularSeasonStartDate"):
-                schedule_data["regularSeasonStartDate"] = data.get(
-                    "regularSeasonStartDate"
-                )
-            if data.get("regularSeasonEndDate"):
-                schedule_data["regularSeasonEndDate"] = data.get("regularSeasonEndDate")
-            if data.get("playoffEndDate"):
-                schedule_data["playoffEndDate"] = data.get("playoffEndDate")
-
-            # Check if there's a next page
-            next_start_date = data.get("nextStartDate")
-            if next_start_date:
-                # Parse the next start date
-                next_start_dt = datetime.fromisoformat(next_start_date)
-                # Stop if we've gone past the requested end date
-                if next_start_dt.date() > end_dt.date():
-                    current_date = None
-                else:
-                    current_date = next_start_date[:10]  # YYYY-MM-DD format
-            else:
-                current_date = None
-
-        # Filter games to ensure they're within the requested date range
-        filtered_games = []
-        for game in games:
-            try:
-                game_date = datetime.fromisoformat(
-                    game.get("startTimeUTC", "").replace("Z", "+00:00")
-                ).date()
-                if start_dt.date() <= game_date <= end_dt.date():
-                    filtered_games.append(game)
-            except (ValueError, AttributeError):
-                # If we can't parse the date, include the game to avoid losing data
-                filtered_games.append(game)
+            data = pages.pop(current_date, None)
+            if data is None:
+                data = fetch(current_date)
+            current_date = _merge_schedule_page(
+                schedule_data, data, games, seen_game_ids, end_dt
+            )
+
+        return _build_range_schedule(
+            self._client, schedule_data, games, start_dt, end_dt
+        )
+
+    def get_season_schedule(self, season: Union[int, str]) -> SeasonSchedule:
+        """Get a season's games indexed by date, team, game type and ID.
+
+        Parameters
+        ----------
+        season : int or str
+            The season, e.g. 20232024.
 
-        schedule_data["numberOfGames"] = len(filtered_games)
-        schedule_data["games"] = filtered_games
-        return Schedule.from_api(self._client, schedule_data)
+        Returns
+        -------
+        SeasonSchedule
+
+        """
+        start_date, end_date = _season_range(season)
+        days = self.iter_schedule(start_date, end_date, by_day=True)
+        games = []
+        try:
+            for day, batch in days:
+                kept = _season_day(day, batch, int(season))
+                if kept is None:
+                    break
+                games.extend(kept)
+        finally:
+            days.close()
+        return SeasonSchedule(games)
+
+    def iter_schedule(
+        self,
+        start_date: str,
+        end_date: str,
+        by_day: bool = False,
+        web: bool = True,
+        prefetch: int = 4,
+    ) -> Iterator[Union[dict, Tuple[str, List[dict]]]]:
+        """Stream the games of a date range as weekly pages arrive.
+
+        Pages are followed via ``nextStartDate`` while up to ``prefetch`` of
+        the predicted next weeks load in the background. Games repeated across
+        pages are dropped using a bitmap of game IDs, so memory stays constant
+        however long the range.
+
+        Parameters
+        ----------
+        start_date : str
+            First date of the range, 'YYYY-MM-DD'.
+        end_date : str
+            Last date of the range, 'YYYY-MM-DD'.
+        by_day : bool, optional
+            Yield ``(date, games)`` per schedule day instead of single games.
+        web : bool, optional
+            Whether to use the web API endpoint. Defaults to True.
+        prefetch : int, optional
+            Weekly pages to request ahead. Defaults to 4.
+
+        Yields
+        ------
+        dict or tuple
+            Raw game dicts, or ``(date, games)`` pairs with ``by_day=True``.
+
+        """
+        start_dt, end_dt = _validate_date_range(start_date, end_date)
+        first, last = start_dt.strftime("%Y-%m-%d"), end_dt.strftime("%Y-%m-%d")
+        seen = _GameIdBitmap()
+        for data in self._iter_pages(first, end_dt, web, prefetch):
+            yield from _page_games(data, first, last, seen, by_day)
+
+    def _iter_pages(
+        self, start_date: str, end_dt: datetime, web: bool, prefetch: int
+    ) -> Iterator[dict]:
+        """Yield weekly pages in ``nextStartDate`` order, prefetching ahead."""
+
+        def fetch(date: str) -> dict:
+            return self._client.get(f"schedule/{date}", web=web).json()
+
+        pending = {}
+        pool = ThreadPoolExecutor(max_workers=max(1, prefetch))
+        try:
+            current = start_date
+            while current:
+                for date in _predicted_pages(current, end_dt, prefetch):
+                    if date not in pending:
+                        pending[date] = pool.submit(fetch, date)
+                future = pending.pop(current, None)
+                data = future.result() if future is not None else fetch(current)
+                yield data
+                current = _next_page_date(data, end_dt)
+                for date in [d for d in pending if current is None or d < current]:
+                    pending.pop(date).cancel()
+        finally:
+            for future in pending.values():
+                future.cancel()
+            pool.shutdown(wait=False)
 
     def get_schedule_for_team(self, team_abbr: str) -> Schedule:
         """Get the schedule for the given team.
@@ -227,10 +479,271 @@ class ScheduleClient:
             Schedule calendar data for the specified date.
         """
         # Validate the date format
-        if not re.match(r"^\d{4}-\d{2}-\d{2}$", date):
-            raise ValueError(
-                "Invalid date format. Should be in the format of 'YYYY-MM-DD'."
-            )
+        _validate_date(date)
 
         response = self._client.get(f"schedule-calendar/{date}", web=True)
         return response.json()
+
+
+class AsyncScheduleClient:
+    def __init__(self, client: AsyncHttpClient):
+        self._client = client
+
+    async def get_schedule(self) -> Schedule:
+        """Get the current schedule."""
+        response = await self._client.get("schedule/now", web=True)
+        data = response.json()
+        return Schedule.from_api(self._client, data)
+
+    async def get_schedule_for_date(self, date: str) -> Schedule:
+        """Get the schedule for the given date.
+
+        Parameters
+        ----------
+        date : str
+            The date for which to get the schedule. Should be in the format of 'YYYY-MM-DD'.
+
+        Returns
+        -------
+        Schedule
+
+        """
+        _validate_date(date)
+
+        response = await self._client.get(f"schedule/{date}", web=True)
+        data = response.json()
+        return Schedule.from_api(self._client, data)
+
+    async def get_schedule_for_date_range(
+        self, start_date: str, end_date: str, web: bool = True, max_workers: int = 8
+    ) -> Schedule:
+        """Get schedule for the given date range.
+
+        The weekly pages covering the range are fetched concurrently, then
+        merged by following ``nextStartDate``; a page the chain points to that
+        was not predicted is fetched on demand.
+
+        Parameters
+        ----------
+        start_date : str
+            The start date for which to get the schedule. Should be in the format of 'YYYY-MM-DD'.
+        end_date : str
+            The end date for which to get the schedule. Should be in the format of 'YYYY-MM-DD'.
+        web : bool, optional
+            Whether to use the web API endpoint. Defaults to True.
+        max_workers : int, optional
+            Maximum concurrent week requests. Defaults to 8.
+
+        Returns
+        -------
+        Schedule
+
+        """
+        start_dt, end_dt = _validate_date_range(start_date, end_date)
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def fetch(date: str) -> dict:
+            async with semaphore:
+                response = await self._client.get(f"schedule/{date}", web=web)
+            return response.json()
+
+        anchors = _week_anchors(start_dt, end_dt)
+        pages = dict(
+            zip(anchors, await asyncio.gather(*(fetch(date) for date in anchors)))
+        )
+
+        games = []
+        schedule_data = _empty_range_schedule()
+        seen_game_ids = set()
+
+        current_date = start_date
+        while current_date:
+            data = pages.pop(current_date, None)
+            if data is None:
+                data = await fetch(current_date)
+            current_date = _merge_schedule_page(
+                schedule_data, data, games, seen_game_ids, end_dt
+            )
+
+        return _build_range_schedule(
+            self._client, schedule_data, games, start_dt, end_dt
+        )
+
+    async def get_season_schedule(self, season: Union[int, str]) -> SeasonSchedule:
+        """Get a season's games indexed by date, team, game type and ID.
+
+        Parameters
+        ----------
+        season : int or str
+            The season, e.g. 20232024.
+
+        Returns
+        -------
+        SeasonSchedule
+
+        """
+        start_date, end_date = _season_range(season)
+        days = self.iter_schedule(start_date, end_date, by_day=True)
+        games = []
+        try:
+            async for day, batch in days:
+                kept = _season_day(day, batch, int(season))
+                if kept is None:
+                    break
+                games.extend(kept)
+        finally:
+            await days.aclose()
+        return SeasonSchedule(games)
+
+    async def iter_schedule(
+        self,
+        start_date: str,
+        end_date: str,
+        by_day: bool = False,
+        web: bool = True,
+        prefetch: int = 4,
+    ) -> AsyncIterator[Union[dict, Tuple[str, List[dict]]]]:
+        """Stream the games of a date range as weekly pages arrive.
+
+        Pages are followed via ``nextStartDate`` while up to ``prefetch`` of
+        the predicted next weeks load in the background. Games repeated across
+        pages are dropped using a bitmap of game IDs, so memory stays constant
+        however long the range.
+
+        Parameters
+        ----------
+        start_date : str
+            First date of the range, 'YYYY-MM-DD'.
+        end_date : str
+            Last date of the range, 'YYYY-MM-DD'.
+        by_day : bool, optional
+            Yield ``(date, games)`` per schedule day instead of single games.
+        web : bool, optional
+            Whether to use the web API endpoint. Defaults to True.
+        prefetch : int, optional
+            Weekly pages to request ahead. Defaults to 4.
+
+        Yields
+        ------
+        dict or tuple
+            Raw game dicts, or ``(date, games)`` pairs with ``by_day=True``.
+
+        """
+        start_dt, end_dt = _validate_date_range(start_date, end_date)
+        first, last = start_dt.strftime("%Y-%m-%d"), end_dt.strftime("%Y-%m-%d")
+        seen = _GameIdBitmap()
+        async for data in self._iter_pages(first, end_dt, web, prefetch):
+            for item in _page_games(data, first, last, seen, by_day):
+                yield item
+
+    async def _iter_pages(
+        self, start_date: str, end_dt: datetime, web: bool, prefetch: int
+    ) -> AsyncIterator[dict]:
+        """Yield weekly pages in ``nextStartDate`` order, prefetching ahead."""
+
+        async def fetch(date: str) -> dict:
+            response = await self._client.get(f"schedule/{date}", web=web)
+            return response.json()
+
+        pending = {}
+        try:
+            current = start_date
+            while current:
+                for date in _predicted_pages(current, end_dt, prefetch):
+                    if date not in pending:
+                        pending[date] = asyncio.ensure_future(fetch(date))
+                task = pending.pop(current, None)
+                data = await task if task is not None else await fetch(current)
+                yield data
+                current = _next_page_date(data, end_dt)
+                for date in [d for d in pending if current is None or d < current]:
+                    pending.pop(date).cancel()
+        finally:
+            for task in pending.values():
+                task.cancel()
+
+    async def get_schedule_for_team(self, team_abbr: str) -> Schedule:
+        """Get the schedule for the given team.
+
+        Parameters
+        ----------
+        team_abbr : str
+            The abbreviation of the team for which to get the schedule.
+
+        Returns
+        -------
+        Schedule
+
+        """
+        response = await self._client.get(
+            f"club-schedule-season/{team_abbr}/now", web=True
+        )
+        data = response.json()
+        return Schedule.from_api(self._client, data)
+
+    async def get_schedule_for_team_for_week(self, team_abbr: str) -> Schedule:
+        """Get the schedule for the given team for the current week.
+
+        Parameters
+        ----------
+        team_abbr : str
+            The abbreviation of the team for which to get the schedule.
+
+        Returns
+        -------
+        Schedule
+
+        """
+        response = await self._client.get(
+            f"club-schedule/{team_abbr}/week/now", web=True
+        )
+        data = response.json()
+        return Schedule.from_api(self._client, data)
+
+    async def get_schedule_for_team_for_month(self, team_abbr: str) -> Schedule:
+        """Get the schedule for the given team for the current month.
+
+        Parameters
+        ----------
+        team_abbr : str
+            The abbreviation of the team for which to get the schedule.
+
+        Returns
+        -------
+        Schedule
+
+        """
+        response = await self._client.get(
+            f"club-schedule/{team_abbr}/month/now", web=True
+        )
+        data = response.json()
+        return Schedule.from_api(self._client, data)
+
+    async def get_schedule_calendar(self) -> dict:
+        """Get the current schedule calendar.
+
+        Returns
+        -------
+        dict
+            Schedule calendar data showing available dates with games.
+        """
+        response = await self._client.get("schedule-calendar/now", web=True)
+        return response.json()
+
+    async def get_schedule_calendar_for_date(self, date: str) -> dict:
+        """Get the schedule calendar for a specific date.
+
+        Parameters
+        ----------
+        date : str
+            The date for which to get the schedule calendar. Should be in the format of 'YYYY-MM-DD'.
+
+        Returns
+        -------
+        dict
+            Schedule calendar data for the specified date.
+        """
+        _validate_date(date)
+
+        response = await self._client.get(f"schedule-calendar/{date}", web=True)
+        return response.json()
@@ -4,10 +4,52 @@ from datetime import datetime
 from typing import Union
 
 import edgework.utilities as utilities
-from edgework.http_client import HttpClient
+from edgework.http_client import AsyncHttpClient, HttpClient
 from edgework.models.standings import Seeding, Standings
 
 
+def _seedings_from_raw(raw_standings: list) -> list[Seeding]:
+    """Convert raw standings rows to Seeding objects."""
+    seedings_dict = utilities.rows_camel_to_snake(raw_standings)
+
+    seedings = []
+    for seed_data in seedings_dict:
+        seedings.append(Seeding(**seed_data))
+    return seedings
+
+
+def _standings_from_response(data: dict, date_str: str) -> Standings:
+    """Build a Standings object from a standings-by-date response."""
+    if date_str == "now":
+        dt_date = datetime.now()
+    else:
+        dt_date = datetime.strptime(date_str, "%Y-%m-%d")
+
+    seedings = _seedings_from_raw(data.get("standings", []))
+    return Standings(date=dt_date, seedings=seedings)
+
+
+def _season_standings_from_response(data: dict, season_id: int) -> Standings:
+    """Build a Standings object from a standings-season response."""
+    seedings = _seedings_from_raw(data.get("data", []))
+    return Standings(
+        date=datetime.now(),
+        seedings=seedings,
+        season=season_id,
+    )
+
+
+def _season_id(season: str) -> int:
+    """Convert a "YYYY-YYYY" season string to the API's integer season ID."""
+    try:
+        start_year, end_year = season.split("-")
+        return int(f"{start_year}{end_year}")
+    except (ValueError, AttributeError):
+        raise ValueError(
+            f"Invalid season format: '{season}'. Expected format: 'YYYY-YYYY'"
+        )
+
+
 class StandingClient:
     """Client for fetching NHL standings data."""
 
@@ -89,19 +131,7 @@ class StandingClient:
         date_str = self._validate_date(date)
 
         response = self._client.get(f"standings/{date_str}", web=True, params={})
-        raw_standings = response.json().get("standings", [])
-        seedings_dict = [utilities.dict_camel_to_snake(seed) for seed in raw_standings]
-
-        if date_str == "now":
-            dt_date = datetime.now()
-        else:
-            dt_date = datetime.strptime(date_str, "%Y-%m-%d")
-
-        seedings = []
-        for seed_data in seedings_dict:
-            seedings.append(Seeding(**seed_data))
-
-        return Standings(date=dt_date, seedings=seedings)
+        return _standings_from_response(response.json(), date_str)
 
     def get_standings_for_season(self, season: str) -> Standings:
         """Fetch NHL standings for a specific season.
@@ -112,30 +142,63 @@ class StandingClient:
         Returns:
             Standings object containing season standings data.
         """
-        try:
-            start_year, end_year = season.split("-")
-            season_id = int(f"{start_year}{end_year}")
-        except (ValueError, AttributeError):
-            raise ValueError(
-                f"Invalid season format: '{season}'. Expected format: 'YYYY-YYYY'"
-            )
+        season_id = _season_id(season)
 
         response = self._client.get(
             "standings-season",
             web=True,
             params={"seasonId": season_id},
         )
+        return _season_standings_from_response(response.json(), season_id)
+
+
+class AsyncStandingClient:
+    """Asynchronous client for fetching NHL standings data."""
+
+    _validate_date = StandingClient._validate_date
+
+    def __init__(self, client: AsyncHttpClient):
+        """Initialize the async standings client.
+
+        Args:
+            client: Async HTTP client instance for making API requests.
+        """
+        self._client = client
 
-        data = response.json()
-        raw_standings = data.get("data", [])
-        seedings_dict = [utilities.dict_camel_to_snake(seed) for seed in raw_standings]
+    async def get_standings(
+        self, date: Union[datetime, str, None] = "now"
+    ) -> Standings:
+        """Fetch NHL standings for a specific date or current standings.
+
+        Args:
+            date: Date to fetch standings for. Can be "now" (default),
+                a datetime object, a YYYY-MM-DD string, or None.
+
+        Returns:
+            Standings object containing league standings data.
 
-        seedings = []
-        for seed_data in seedings_dict:
-            seedings.append(Seeding(**seed_data))
+        Raises:
+            ValueError: If date format is invalid.
+        """
+        date_str = self._validate_date(date)
+
+        response = await self._client.get(f"standings/{date_str}", web=True, params={})
+        return _standings_from_response(response.json(), date_str)
 
-        return Standings(
-            date=datetime.now(),
-            seedings=seedings,
-            season=season_id,
+    async def get_standings_for_season(self, season: str) -> Standings:
+        """Fetch NHL standings for a specific season.
+
+        Args:
+            season: Season in format "YYYY-YYYY" (e.g., "2023-2024").
+
+        Returns:
+            Standings object containing season standings data.
+        """
+        season_id = _season_id(season)
+
+        response = await self._client.get(
+            "standings-season",
+            web=True,
+            params={"seasonId": season_id},
         )
+        return _season_standings_from_response(response.json(), season_id)
@@ -1,8 +1,114 @@
-from typing import Dict, List
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
-from edgework.http_client import HttpClient
+from edgework.http_client import AsyncHttpClient, HttpClient
 from edgework.models.stats import GoalieStats, SkaterStats, TeamStats
-from edgework.utilities import dict_camel_to_snake
+from edgework.utilities import rows_camel_to_snake
+
+
+def _season_id(season: str) -> str:
+    """Convert a "YYYY-YYYY" season string to the API's "YYYYYYYY" form."""
+    try:
+        start_year, end_year = season.split("-")
+        return f"{start_year}{end_year}"
+    except (ValueError, AttributeError):
+        raise ValueError(
+            f"Invalid season format: '{season}'. Expected format: 'YYYY-YYYY'"
+        )
+
+
+# Row ID columns per report entity, used to make paging order stable.
+_REPORT_ID_KEYS = {"skater": "playerId", "goalie": "playerId", "team": "teamId"}
+
+# Default sort column per report entity.
+_REPORT_SORTS = {"skater": "points", "goalie": "wins", "team": "wins"}
+
+
+def _report_params(
+    entity: str,
+    season: Union[int, Tuple[int, int]],
+    aggregate: bool,
+    game: bool,
+    sort: Optional[str],
+    start: int,
+    limit: int,
+) -> dict:
+    """Build the query parameters for one page of a stats report."""
+    if isinstance(season, tuple):
+        first, last = season
+        cayenne_exp = f"seasonId>={first} and seasonId<={last}"
+    else:
+        cayenne_exp = f"seasonId={season}"
+    # Tie-break on the row IDs so rows don't move between pages; unaggregated
+    # season ranges have one row per player (or team) and season.
+    tie_breaks = [_REPORT_ID_KEYS[entity]]
+    if isinstance(season, tuple) and not aggregate:
+        tie_breaks.append("seasonId")
+    if game:
+        tie_breaks.append("gameId")
+    order = [{"property": sort or _REPORT_SORTS[entity], "direction": "DESC"}]
+    order += [
+        {"property": key, "direction": "ASC"}
+        for key in tie_breaks
+        if key != order[0]["property"]
+    ]
+    return {
+        "isAggregate": aggregate,
+        "isGame": game,
+        "start": start,
+        "limit": limit,
+        "sort": json.dumps(order, separators=(",", ":")),
+        "cayenneExp": cayenne_exp,
+    }
+
+
+def _page_done(payload: dict, start: int, page_size: int) -> bool:
+    """Whether a report page is the last one."""
+    rows = len(payload.get("data") or [])
+    total = payload.get("total")
+    return rows < page_size or (total is not None and start + rows >= total)
+
+
+def _join_reports(
+    tables: Sequence[List[dict]], aggregate: bool, game: bool
+) -> List[dict]:
+    """
+    Hash-join report rows on ``player_id`` (plus ``game_id`` for game rows).
+
+    Unless the rows are aggregated, reports that have a ``season_id`` column
+    are also joined on it, giving one row per player and season; rows of a
+    report without it are merged into every season row of their player.
+    Rows are extended in place; a column already present (names, team, games
+    played...) keeps its first value. Rows missing from earlier tables are
+    appended, so the result is a full outer join.
+    """
+
+    def by_season(rows: List[dict]) -> bool:
+        return not aggregate and bool(rows) and "season_id" in rows[0]
+
+    joined: Dict[tuple, dict] = {}
+    players: Dict[tuple, List[dict]] = {}
+    # Season-keyed reports go first so season-less rows find every season.
+    for rows in sorted(tables, key=lambda rows: not by_season(rows)):
+        seasonal = by_season(rows)
+        for row in rows:
+            player = (row.get("player_id"), row.get("game_id") if game else None)
+            key = player + (row.get("season_id"),) if seasonal else player
+            if seasonal:
+                bases = [joined[key]] if key in joined else []
+            else:
+                bases = players.get(player, [])
+            if not bases:
+                joined[key] = row
+                players.setdefault(player, []).append(row)
+                continue
+            for base in bases:
+                for column, value in row.items():
+                    if column not in base:
+                        base[column] = value
+    return list(joined.values())
 
 
 class StatsClient:
@@ -84,7 +190,7 @@ class StatsClient:
         )
 
         data = response.json()["data"]
-        skater_stats_dict = [dict_camel_to_snake(d) for d in data]
+        skater_stats_dict = rows_camel_to_snake(data)
 
         return [SkaterStats(**d) for d in skater_stats_dict]
 
@@ -111,7 +217,7 @@ class StatsClient:
         response = self._client.get(path=url_path, params=None, web=False)
         data = response.json()["data"]
 
-        skater_stats_dict = [dict_camel_to_snake(d) for d in data]
+        skater_stats_dict = rows_camel_to_snake(data)
         return [GoalieStats(**d) for d in skater_stats_dict]
 
     def get_team_stats(
@@ -137,9 +243,120 @@ class StatsClient:
         response = self._client.get(path=url_path, params=None, web=False)
         data = response.json()["data"]
 
-        team_stats_dict = [dict_camel_to_snake(d) for d in data]
+        team_stats_dict = rows_camel_to_snake(data)
         return [TeamStats(**d) for d in team_stats_dict]
 
+    def _report_names(self, entity: str) -> List[str]:
+        reports = {
+            "skater": self.skate_reports,
+            "goalie": self.goalie_reports,
+            "team": self.team_reports,
+        }
+        if entity not in reports:
+            raise ValueError(
+                f"Invalid entity: {entity}, must be one of {', '.join(reports)}"
+            )
+        return reports[entity]
+
+    def iter_report(
+        self,
+        entity: str,
+        report: str,
+        season: Union[int, Tuple[int, int]],
+        aggregate: bool = False,
+        game: bool = False,
+        sort: Optional[str] = None,
+        page_size: int = 1000,
+    ) -> Iterator[dict]:
+        """Stream the rows of a stats report page by page.
+
+        Pages are requested with ``start``/``limit``; the next page is fetched
+        in the background while the current one is consumed, so only two pages
+        are held at a time.
+
+        Args:
+            entity: "skater", "goalie" or "team".
+            report: Report name, e.g. "summary" (see ``skate_reports`` etc.).
+            season: Season ID such as 20232024, or a ``(first, last)`` range.
+            aggregate: Aggregate rows across seasons.
+            game: Game-level rows (``isGame=true``).
+            sort: Column to sort by, descending; defaults to points for
+                skaters and wins for goalies and teams.
+            page_size: Rows per request.
+
+        Yields:
+            Report rows with snake_case keys.
+        """
+        if report not in self._report_names(entity):
+            raise ValueError(f"Invalid report: {report}")
+
+        def fetch(start: int) -> dict:
+            params = _report_params(
+                entity, season, aggregate, game, sort, start, page_size
+            )
+            return self._client.get(f"en/{entity}/{report}", params=params).json()
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            start = 0
+            page = pool.submit(fetch, start)
+            try:
+                while page is not None:
+                    payload = page.result()
+                    page = None
+                    if not _page_done(payload, start, page_size):
+                        start += page_size
+                        page = pool.submit(fetch, start)
+                    yield from rows_camel_to_snake(payload.get("data") or [])
+            finally:
+                if page is not None:
+                    page.cancel()
+
+    def get_skater_table(
+        self,
+        season: Union[int, Tuple[int, int]],
+        reports: Optional[Sequence[str]] = None,
+        aggregate: bool = False,
+        game: bool = False,
+        max_workers: int = 8,
+    ) -> List[dict]:
+        """Fetch several skater reports and join them into one row per player.
+
+        The reports are streamed concurrently with ``iter_report`` and
+        hash-joined on ``player_id``, plus ``season_id`` unless ``aggregate``
+        and ``game_id`` for game-level rows, so a season range yields one row
+        per player and season. Columns shared between reports appear once.
+
+        Args:
+            season: Season ID such as 20232024, or a ``(first, last)`` range.
+            reports: Skater reports to join; defaults to all ``skate_reports``.
+            aggregate: Aggregate rows across seasons.
+            game: Game-level rows (``isGame=true``).
+            max_workers: Maximum reports fetched at once.
+
+        Returns:
+            Joined rows with snake_case keys.
+        """
+        reports = list(reports or self.skate_reports)
+        for report in reports:
+            if report not in self.skate_reports:
+                raise ValueError(f"Invalid report: {report}")
+
+        def fetch(report: str) -> List[dict]:
+            return list(
+                self.iter_report(
+                    "skater",
+                    report,
+                    season,
+                    aggregate=aggregate,
+                    game=game,
+                    sort="playerId",
+                )
+            )
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(reports))) as pool:
+            tables = list(pool.map(fetch, reports))
+        return _join_reports(tables, aggregate, game)
+
     def get_skater_stats_leaders(self, game_type: int = 2) -> Dict:
         """Fetch current skater statistics leaders.
 
@@ -182,13 +399,7 @@ class StatsClient:
         Returns:
             Dictionary with skater leaders for the specified season.
         """
-        try:
-            start_year, end_year = season.split("-")
-            season_id = f"{start_year}{end_year}"
-        except (ValueError, AttributeError):
-            raise ValueError(
-                f"Invalid season format: '{season}'. Expected format: 'YYYY-YYYY'"
-            )
+        season_id = _season_id(season)
 
         response = self._client.get(
             f"skater-stats-leaders/{season_id}/{game_type}", web=True
@@ -207,15 +418,259 @@ class StatsClient:
         Returns:
             Dictionary with goalie leaders for the specified season.
         """
-        try:
-            start_year, end_year = season.split("-")
-            season_id = f"{start_year}{end_year}"
-        except (ValueError, AttributeError):
+        season_id = _season_id(season)
+
+        response = self._client.get(
+            f"goalie-stats-leaders/{season_id}/{game_type}", web=True
+        )
+        return response.json()
+
+
+class AsyncStatsClient:
+    """Asynchronous client for the NHL stats report and leader endpoints."""
+
+    skate_reports = StatsClient.skate_reports
+    goalie_reports = StatsClient.goalie_reports
+    team_reports = StatsClient.team_reports
+
+    def __init__(self, client: AsyncHttpClient):
+        self._client = client
+
+    async def get_skaters_stats(
+        self,
+        report: str,
+        aggregate: bool,
+        game: bool,
+        limit: int,
+        start: int,
+        sort: str,
+        season: int,
+    ) -> list[SkaterStats]:
+        if report not in self.skate_reports:
+            raise ValueError(f"Invalid report: {report}")
+
+        response = await self._client.get(
+            f"en/skater/{report}?isAggregate={aggregate}&isGame={game}&limit="
+            f"{limit}&start={start}&sort={sort}&cayenneExp=seasonId={season}"
+        )
+
+        data = response.json()["data"]
+        skater_stats_dict = rows_camel_to_snake(data)
+
+        return [SkaterStats(**d) for d in skater_stats_dict]
+
+    async def get_goalies_stats(
+        self,
+        season: int,
+        report: str = "summary",
+        aggregate: bool = False,
+        game: bool = True,
+        limit: int = -1,
+        start: int = 0,
+        sort: str = "wins",
+    ) -> list[GoalieStats]:
+        if report not in self.goalie_reports:
             raise ValueError(
-                f"Invalid season format: '{season}'. Expected format: 'YYYY-YYYY'"
+                f"Invalid report: {report}, must be one of "
+                f"{', '.join(self.goalie_reports)}"
             )
 
-        response = self._client.get(
+        url_path = (
+            f"en/goalie/{report}?isAggregate={aggregate}&isGame={game}&limit="
+            f"{limit}&start={start}&sort={sort}&cayenneExp=seasonId={season}"
+        )
+        response = await self._client.get(path=url_path, params=None, web=False)
+        data = response.json()["data"]
+
+        goalie_stats_dict = rows_camel_to_snake(data)
+        return [GoalieStats(**d) for d in goalie_stats_dict]
+
+    async def get_team_stats(
+        self,
+        season: int,
+        report: str = "summary",
+        aggregate: bool = False,
+        game: bool = True,
+        limit: int = -1,
+        start: int = 0,
+        sort: str = "wins",
+    ) -> list[TeamStats]:
+        if report not in self.team_reports:
+            raise ValueError(
+                f"Invalid report: {report}, must be one of "
+                f"{', '.join(self.team_reports)}"
+            )
+
+        url_path = (
+            f"en/team/{report}?isAggregate={aggregate}&isGame={game}&limit="
+            f"{limit}&start={start}&sort={sort}&cayenneExp=seasonId={season}"
+        )
+        response = await self._client.get(path=url_path, params=None, web=False)
+        data = response.json()["data"]
+
+        team_stats_dict = rows_camel_to_snake(data)
+        return [TeamStats(**d) for d in team_stats_dict]
+
+    _report_names = StatsClient._report_names
+
+    async def iter_report(
+        self,
+        entity: str,
+        report: str,
+        season: Union[int, Tuple[int, int]],
+        aggregate: bool = False,
+        game: bool = False,
+        sort: Optional[str] = None,
+        page_size: int = 1000,
+    ) -> AsyncIterator[dict]:
+        """Stream the rows of a stats report page by page.
+
+        Pages are requested with ``start``/``limit``; the next page is fetched
+        in the background while the current one is consumed, so only two pages
+        are held at a time.
+
+        Args:
+            entity: "skater", "goalie" or "team".
+            report: Report name, e.g. "summary" (see ``skate_reports`` etc.).
+            season: Season ID such as 20232024, or a ``(first, last)`` range.
+            aggregate: Aggregate rows across seasons.
+            game: Game-level rows (``isGame=true``).
+            sort: Column to sort by, descending; defaults to points for
+                skaters and wins for goalies and teams.
+            page_size: Rows per request.
+
+        Yields:
+            Report rows with snake_case keys.
+        """
+        if report not in self._report_names(entity):
+            raise ValueError(f"Invalid report: {report}")
+
+        async def fetch(start: int) -> dict:
+            params = _report_params(
+                entity, season, aggregate, game, sort, start, page_size
+            )
+            response = await self._client.get(f"en/{entity}/{report}", params=params)
+            return response.json()
+
+        start = 0
+        page = asyncio.ensure_future(fetch(start))
+        try:
+            while page is not None:
+                payload = await page
+                page = None
+                if not _page_done(payload, start, page_size):
+                    start += page_size
+                    page = asyncio.ensure_future(fetch(start))
+                for row in rows_camel_to_snake(payload.get("data") or []):
+                    yield row
+        finally:
+            if page is not None:
+                page.cancel()
+
+    async def get_skater_table(
+        self,
+        season: Union[int, Tuple[int, int]],
+        reports: Optional[Sequence[str]] = None,
+        aggregate: bool = False,
+        game: bool = False,
+        max_workers: int = 8,
+    ) -> List[dict]:
+        """Fetch several skater reports and join them into one row per player.
+
+        The reports are streamed concurrently with ``iter_report`` and
+        hash-joined on ``player_id``, plus ``season_id`` unless ``aggregate``
+        and ``game_id`` for game-level rows, so a season range yields one row
+        per player and season. Columns shared between reports appear once.
+
+        Args:
+            season: Season ID such as 20232024, or a ``(first, last)`` range.
+            reports: Skater reports to join; defaults to all ``skate_reports``.
+            aggregate: Aggregate rows across seasons.
+            game: Game-level rows (``isGame=true``).
+            max_workers: Maximum reports fetched at once.
+
+        Returns:
+            Joined rows with snake_case keys.
+        """
+        reports = list(reports or self.skate_reports)
+        for report in reports:
+            if report not in self.skate_reports:
+                raise ValueError(f"Invalid report: {report}")
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def fetch(report: str) -> List[dict]:
+            async with semaphore:
+                return [
+                    row
+                    async for row in self.iter_report(
+                        "skater",
+                        report,
+                        season,
+                        aggregate=aggregate,
+                        game=game,
+                        sort="playerId",
+                    )
+                ]
+
+        tables = await asyncio.gather(*(fetch(report) for report in reports))
+        return _join_reports(tables, aggregate, game)
+
+    async def get_skater_stats_leaders(self, game_type: int = 2) -> Dict:
+        """Fetch current skater statistics leaders.
+
+        Args:
+            game_type: Game type ID (2=Regular Season, 3=Playoffs)
+
+        Returns:
+            Dictionary with current skater leaders.
+        """
+        response = await self._client.get("skater-stats-leaders/current", web=True)
+        return response.json()
+
+    async def get_goalie_stats_leaders(self, game_type: int = 2) -> Dict:
+        """Fetch current goalie statistics leaders.
+
+        Args:
+            game_type: Game type ID (2=Regular Season, 3=Playoffs)
+
+        Returns:
+            Dictionary with current goalie leaders.
+        """
+        response = await self._client.get("goalie-stats-leaders/current", web=True)
+        return response.json()
+
+    async def get_skater_stats_leaders_by_season(
+        self, season: str, game_type: int = 2
+    ) -> Dict:
+        """Fetch skater statistics leaders for a specific season.
+
+        Args:
+            season: Season in format "YYYY-YYYY" (e.g., "2023-2024")
+            game_type: Game type ID (2=Regular Season, 3=Playoffs)
+
+        Returns:
+            Dictionary with skater leaders for the specified season.
+        """
+        season_id = _season_id(season)
+        response = await self._client.get(
+            f"skater-stats-leaders/{season_id}/{game_type}", web=True
+        )
+        return response.json()
+
+    async def get_goalie_stats_leaders_by_season(
+        self, season: str, game_type: int = 2
+    ) -> Dict:
+        """Fetch goalie statistics leaders for a specific season.
+
+        Args:
+            season: Season in format "YYYY-YYYY" (e.g., "2023-2024")
+            game_type: Game type ID (2=Regular Season, 3=Playoffs)
+
+        Returns:
+            Dictionary with goalie leaders for the specified season.
+        """
+        season_id = _season_id(season)
+        response = await self._client.get(
             f"goalie-stats-leaders/{season_id}/{game_type}", web=True
         )
         return response.json()
@@ -2,9 +2,48 @@ from typing import List, Optional
 
 from httpx import Client
 
+from edgework.http_client import AsyncHttpClient
 from edgework.models.team import Roster, Team, roster_api_to_dict, team_api_to_dict
 
 
+def _teams_from_response(client, data: dict) -> List[Team]:
+    """Build Team objects from a stats API team list response."""
+    teams = []
+
+    # The response should have a 'data' array containing team objects
+    teams_data = data.get("data", [])
+
+    for team_data in teams_data:
+        processed_team_data = team_api_to_dict(team_data)
+        team = Team(client, processed_team_data.get("team_id"), **processed_team_data)
+        teams.append(team)
+
+    return teams
+
+
+def _team_from_response(client, data: dict) -> Team:
+    """Build a single Team object from a stats API team response."""
+    # The response should have the team data directly or in a 'data' field
+    team_data = data.get("data", [])
+    if isinstance(team_data, list) and len(team_data) > 0:
+        team_data = team_data[0]
+    elif not isinstance(team_data, dict):
+        team_data = data
+
+    processed_team_data = team_api_to_dict(team_data)
+    return Team(client, processed_team_data.get("team_id"), **processed_team_data)
+
+
+def _roster_from_response(client, data: dict) -> Roster:
+    """Build a Roster object from a roster API response."""
+    roster_data = roster_api_to_dict(data)
+
+    # Extract team_id if available, otherwise use team_code
+    team_id = roster_data.get("team_id")
+
+    return Roster(client, team_id, **roster_data)
+
+
 class TeamClient:
     """Client for team-related API operations."""
 
@@ -28,20 +67,7 @@ class TeamClient:
                 f"Failed to fetch teams: {response.status_code} {response.text}"
             )
 
-        data = response.json()
-        teams = []
-
-        # The response should have a 'data' array containing team objects
-        teams_data = data.get("data", [])
-
-        for team_data in teams_data:
-            processed_team_data = team_api_to_dict(team_data)
-            team = Team(
-                self.client, processed_team_data.get("team_id"), **processed_team_data
-            )
-            teams.append(team)
-
-        return teams
+        return _teams_from_response(self.client, response.json())
 
     def get_team(self, team_id: int) -> Team:
         """
@@ -65,19 +91,7 @@ class TeamClient:
                 f"Failed to fetch team {team_id}: {response.status_code} {response.text}"
             )
 
-        data = response.json()
-
-        # The response should have the team data directly or in a 'data' field
-        team_data = data.get("data", [])
-        if isinstance(team_data, list) and len(team_data) > 0:
-            team_data = team_data[0]
-        elif not isinstance(team_data, dict):
-            team_data = data
-
-        processed_team_data = team_api_to_dict(team_data)
-        return Team(
-            self.client, processed_team_data.get("team_id"), **processed_team_data
-        )
+        return _team_from_response(self.client, response.json())
 
     def get_roster(self, team_code: str, season: Optional[int] = None) -> Roster:
         """
@@ -107,13 +121,7 @@ class TeamClient:
                 f"Failed to fetch roster: {response.status_code} {response.text}"
             )
 
-        data = response.json()
-        roster_data = roster_api_to_dict(data)
-
-        # Extract team_id if available, otherwise use team_code
-        team_id = roster_data.get("team_id")
-
-        return Roster(self.client, team_id, **roster_data)
+        return _roster_from_response(self.client, response.json())
 
     def get_team_stats(
         self, team_code: str, season: Optional[int] = None, game_type: int = 2
@@ -226,3 +234,156 @@ class TeamClient:
             )
 
         return response.json()
+
+
+class AsyncTeamClient:
+    """Asynchronous client for team-related API operations."""
+
+    def __init__(self, client: AsyncHttpClient):
+        self.client = client
+
+    async def _get_json(self, endpoint: str, what: str, web: bool = True):
+        """Fetch an endpoint and return its JSON, raising on non-200 responses."""
+        response = await self.client.get(endpoint, web=web)
+
+        if response.status_code != 200:
+            raise Exception(
+                f"Failed to fetch {what}: {response.status_code} {response.text}"
+            )
+
+        return response.json()
+
+    async def get_teams(self) -> List[Team]:
+        """
+        Fetch a list of teams from NHL Stats API.
+
+        Returns
+        -------
+        List[Team]
+            A list of teams.
+        """
+        data = await self._get_json("team", "teams", web=False)
+        return _teams_from_response(self.client, data)
+
+    async def get_team(self, team_id: int) -> Team:
+        """
+        Fetch a single team by ID from NHL Stats API.
+
+        Parameters
+        ----------
+        team_id : int
+            The team ID
+
+        Returns
+        -------
+        Team
+            A Team object.
+        """
+        data = await self._get_json(f"team/{team_id}", f"team {team_id}", web=False)
+        return _team_from_response(self.client, data)
+
+    async def get_roster(self, team_code: str, season: Optional[int] = None) -> Roster:
+        """
+        Fetch a roster for a team from NHL.
+
+        Parameters
+        ----------
+        team_code : str
+            The team code for the team (e.g., 'TOR', 'NYR')
+        season : Optional[int]
+            The season in YYYYYYYY format (e.g., 20232024). If None, gets current roster.
+
+        Returns
+        -------
+        Roster
+            A roster for the team.
+        """
+        if season:
+            endpoint = f"roster/{team_code}/{season}"
+        else:
+            endpoint = f"roster/{team_code}/current"
+
+        data = await self._get_json(endpoint, "roster")
+        return _roster_from_response(self.client, data)
+
+    async def get_team_stats(
+        self, team_code: str, season: Optional[int] = None, game_type: int = 2
+    ):
+        """
+        Get team statistics.
+
+        Parameters
+        ----------
+        team_code : str
+            The team code for the team (e.g., 'TOR', 'NYR')
+        season : Optional[int]
+            The season in YYYYYYYY format (e.g., 20232024). If None, gets current stats.
+        game_type : int
+            Game type (2 for regular season, 3 for playoffs). Default is 2.
+
+        Returns
+        -------
+        dict
+            Team statistics data.
+        """
+        if season:
+            endpoint = f"club-stats/{team_code}/{season}/{game_type}"
+        else:
+            endpoint = f"club-stats/{team_code}/now"
+
+        return await self._get_json(endpoint, "team stats")
+
+    async def get_team_schedule(self, team_code: str, season: Optional[int] = None):
+        """
+        Get team schedule.
+
+        Parameters
+        ----------
+        team_code : str
+            The team code for the team (e.g., 'TOR', 'NYR')
+        season : Optional[int]
+            The season in YYYYYYYY format (e.g., 20232024). If None, gets current schedule.
+
+        Returns
+        -------
+        dict
+            Team schedule data.
+        """
+        if season:
+            endpoint = f"club-schedule-season/{team_code}/{season}"
+        else:
+            endpoint = f"club-schedule-season/{team_code}/now"
+
+        return await self._get_json(endpoint, "team schedule")
+
+    async def get_team_prospects(self, team_code: str):
+        """
+        Get team prospects.
+
+        Parameters
+        ----------
+        team_code : str
+            The team code for the team (e.g., 'TOR', 'NYR')
+
+        Returns
+        -------
+        dict
+            Team prospects data.
+        """
+        return await self._get_json(f"prospects/{team_code}", "team prospects")
+
+    async def get_scoreboard(self, team_code: str):
+        """
+        Get team scoreboard.
+
+        Parameters
+        ----------
+        team_code : str
+            The team code for the team (e.g., 'TOR', 'NYR')
+
+        Returns
+        -------
+        dict
+            Team scoreboard data.
+        """
+        return await self._get_json(f"scoreboard/{team_code}/now", "team scoreboard")
@@ -2,7 +2,7 @@
 
 from typing import Dict, Optional
 
-from edgework.http_client import HttpClient
+from edgework.http_client import AsyncHttpClient, HttpClient
 
 
 class UtilityClient:
@@ -95,3 +95,88 @@ class UtilityClient:
         """
         response = self._client.get(f"postal-lookup/{postal_code}", web=True)
         return response.json()
+
+
+class AsyncUtilityClient:
+    """Asynchronous client for fetching NHL metadata and utility data."""
+
+    def __init__(self, client: AsyncHttpClient):
+        """
+        Initialize the async utility client.
+
+        Args:
+            client: Async HTTP client instance for making API requests
+        """
+        self._client = client
+
+    async def get_season(self) -> Dict:
+        """
+        Fetch current season metadata.
+
+        Returns:
+            Dictionary with season information.
+        """
+        response = await self._client.get("season", web=True)
+        return response.json()
+
+    async def get_meta(self) -> Dict:
+        """
+        Fetch API metadata.
+
+        Returns:
+            Dictionary with API metadata.
+        """
+        response = await self._client.get("meta", web=True)
+        return response.json()
+
+    async def get_meta_game(self, game_id: int) -> Dict:
+        """
+        Fetch metadata for a specific game.
+
+        Args:
+            game_id: The NHL game ID
+
+        Returns:
+            Dictionary with game metadata.
+        """
+        response = await self._client.get(f"meta/game/{game_id}", web=True)
+        return response.json()
+
+    async def get_meta_playoff_series(self, year: int, series_letter: str) -> Dict:
+        """
+        Fetch metadata for a playoff series.
+
+        Args:
+            year: The playoff year
+            series_letter: Series identifier (e.g., "A", "B")
+
+        Returns:
+            Dictionary with playoff series metadata.
+        """
+        response = await self._client.get(
+            f"meta/playoff-series/{year}/{series_letter}", web=True
+        )
+        return response.json()
+
+    async def get_location(self) -> Dict:
+        """
+        Fetch location data.
+
+        Returns:
+            Dictionary with location information.
+        """
+        response = await self._client.get("location", web=True)
+        return response.json()
+
+    async def get_postal_lookup(self, postal_code: str) -> Dict:
+        """
+        Fetch location data for a postal code.
+
+        Args:
+            postal_code: Postal/ZIP code to look up
+
+        Returns:
+            Dictionary with location data for the postal code.
+        """
+        response = await self._client.get(f"postal-lookup/{postal_code}", web=True)
+        return response.json()
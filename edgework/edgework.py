@@ -1,16 +1,17 @@
 import re
-
-from edgework.clients.draft_client import DraftClient
-from edgework.clients.game_client import GameClient
-from edgework.clients.network_client import NetworkClient
-from edgework.clients.player_client import PlayerClient
-from edgework.clients.playoff_client import PlayoffClient
-from edgework.clients.schedule_client import ScheduleClient
-from edgework.clients.standings_client import StandingClient
-from edgework.clients.stats_client import StatsClient
-from edgework.clients.team_client import TeamClient
-from edgework.clients.utility_client import UtilityClient
-from edgework.http_client import HttpClient
+from typing import AsyncIterator, Iterable, Iterator, Tuple, Union
+
+from edgework.clients.draft_client import AsyncDraftClient, DraftClient
+from edgework.clients.game_client import AsyncGameClient, GameClient
+from edgework.clients.network_client import AsyncNetworkClient, NetworkClient
+from edgework.clients.player_client import AsyncPlayerClient, PlayerClient
+from edgework.clients.playoff_client import AsyncPlayoffClient, PlayoffClient
+from edgework.clients.schedule_client import AsyncScheduleClient, ScheduleClient
+from edgework.clients.standings_client import AsyncStandingClient, StandingClient
+from edgework.clients.stats_client import AsyncStatsClient, StatsClient
+from edgework.clients.team_client import AsyncTeamClient, TeamClient
+from edgework.clients.utility_client import AsyncUtilityClient, UtilityClient
+from edgework.http_client import AsyncHttpClient, HttpClient
 
 from edgework.models.player import Player
 from edgework.models.schedule import Schedule
@@ -67,15 +68,19 @@ class Edgework:
         >>> player = client.players.get_player(8478402)
     """
 
-    def __init__(self, user_agent: str = "EdgeworkClient/0.10.0"):
+    def __init__(self, user_agent: str = "EdgeworkClient/0.10.0", **http_options):
         """
         Initializes the Edgework API client with all sub-clients.
 
         Args:
             user_agent (str, optional): The User-Agent string for requests.
                 Defaults to "EdgeworkClient/0.10.0".
+            **http_options: Extra keyword arguments forwarded to
+                :class:`~edgework.http_client.HttpClient`, e.g. ``cache``,
+                ``retry``, ``max_connections``, ``max_keepalive_connections``,
+                ``keepalive_expiry``, ``timeout`` and ``http2``.
         """
-        self._client = HttpClient(user_agent=user_agent)
+        self._client = HttpClient(user_agent=user_agent, **http_options)
 
         # Expose all clients as public attributes
         self.players = PlayerClient(http_client=self._client)
@@ -122,6 +127,22 @@ class Edgework:
         """
         return self.players.get_player(player_id)
 
+    def get_players(
+        self, player_ids: Iterable[int], concurrency: int = 8
+    ) -> Iterator[Tuple[int, Union[Player, Exception]]]:
+        """
+        Get many players by ID in parallel.
+
+        Args:
+            player_ids (Iterable[int]): NHL player IDs; duplicates are fetched once.
+            concurrency (int): Maximum number of requests in flight. Defaults to 8.
+
+        Yields:
+            tuple: ``(player_id, Player)`` as each lookup completes, or
+                ``(player_id, exception)`` if that lookup failed.
+        """
+        return self.players.get_players(player_ids, concurrency=concurrency)
+
     def get_teams(self) -> list[Team]:
         """
         Fetch a list of all NHL teams.
@@ -179,3 +200,156 @@ class Edgework:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
+
+
+class AsyncEdgework:
+    """Asynchronous Edgework NHL API client.
+
+    Mirrors :class:`Edgework`, but every sub-client shares a single
+    :class:`~edgework.http_client.AsyncHttpClient` and its methods are
+    coroutines, so many requests can be awaited concurrently on one event loop.
+
+    Models returned by the async clients are fully populated from their
+    response. Lazy-loading properties that would issue a further request
+    (e.g. ``Game.play_by_play``) need a synchronous client; use the matching
+    async client method instead.
+
+    Usage:
+        >>> import asyncio
+        >>> import edgework
+        >>>
+        >>> async def main():
+        ...     async with edgework.AsyncEdgework() as client:
+        ...         games = await client.games.get_current_games()
+        ...         return await asyncio.gather(
+        ...             *(client.games.get_play_by_play(g.game_id) for g in games)
+        ...         )
+    """
+
+    def __init__(self, user_agent: str = "EdgeworkClient/0.10.0", **http_options):
+        """
+        Initializes the async Edgework API client with all sub-clients.
+
+        Args:
+            user_agent (str, optional): The User-Agent string for requests.
+                Defaults to "EdgeworkClient/0.10.0".
+            **http_options: Extra keyword arguments forwarded to
+                :class:`~edgework.http_client.AsyncHttpClient`, e.g.
+                ``max_connections``, ``timeout`` and ``http2``.
+        """
+        self._client = AsyncHttpClient(user_agent=user_agent, **http_options)
+
+        self.players = AsyncPlayerClient(http_client=self._client)
+        self.teams = AsyncTeamClient(client=self._client)
+        self.schedule = AsyncScheduleClient(client=self._client)
+        self.games = AsyncGameClient(client=self._client)
+        self.standings = AsyncStandingClient(client=self._client)
+        self.draft = AsyncDraftClient(client=self._client)
+        self.stats = AsyncStatsClient(client=self._client)
+        self.playoffs = AsyncPlayoffClient(client=self._client)
+        self.network = AsyncNetworkClient(client=self._client)
+        self.utility = AsyncUtilityClient(client=self._client)
+
+    async def get_all_players(self, active_only: bool = True) -> list[Player]:
+        """
+        Fetch a list of players.
+
+        Args:
+            active_only (bool): If True, fetch only active players.
+                If False, fetch all players. Defaults to True.
+
+        Returns:
+            list[Player]: A list of Player objects.
+        """
+        if active_only:
+            return await self.players.get_active_players()
+        else:
+            return await self.players.get_all_players()
+
+    async def get_player(self, player_id: int) -> Player:
+        """
+        Get a player by ID.
+
+        Args:
+            player_id (int): The NHL player ID.
+
+        Returns:
+            Player: A Player object with full details.
+        """
+        return await self.players.get_player(player_id)
+
+    async def get_players(
+        self, player_ids: Iterable[int], concurrency: int = 8
+    ) -> AsyncIterator[Tuple[int, Union[Player, Exception]]]:
+        """
+        Get many players by ID concurrently.
+
+        Args:
+            player_ids (Iterable[int]): NHL player IDs; duplicates are fetched once.
+            concurrency (int): Maximum number of requests in flight. Defaults to 8.
+
+        Yields:
+            tuple: ``(player_id, Player)`` as each lookup completes, or
+                ``(player_id, exception)`` if that lookup failed.
+        """
+        async for result in self.players.get_players(
+            player_ids, concurrency=concurrency
+        ):
+            yield result
+
+    async def get_teams(self) -> list[Team]:
+        """
+        Fetch a list of all NHL teams.
+
+        Returns:
+            list[Team]: A list of Team objects.
+        """
+        return await self.teams.get_teams()
+
+    async def get_roster(self, team_code: str, season: str = None) -> Roster:
+        """
+        Fetch a roster for a specific team.
+
+        Args:
+            team_code (str): The team code (e.g., 'TOR', 'NYR').
+            season (str, optional): The season in format "YYYY-YYYY".
+                If None, gets current roster.
+
+        Returns:
+            Roster: A Roster object containing the team's players.
+        """
+        converted_season = None
+        if season:
+            converted_season = _validate_season_format(season)
+        return await self.teams.get_roster(team_code, converted_season)
+
+    async def get_schedule_now(self) -> Schedule:
+        """
+        Get the current NHL schedule.
+
+        Returns:
+            Schedule: Current NHL schedule.
+        """
+        return await self.schedule.get_schedule()
+
+    async def get_schedule_for_date(self, date: str) -> Schedule:
+        """
+        Get the NHL schedule for a specific date.
+
+        Args:
+            date (str): The date in format 'YYYY-MM-DD'.
+
+        Returns:
+            Schedule: NHL schedule for the specified date.
+        """
+        return await self.schedule.get_schedule_for_date(date)
+
+    async def close(self):
+        """Closes the underlying async HTTP client session."""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -1,26 +1,309 @@
 """HTTP client for making requests to NHL APIs."""
 
-from typing import Any, Dict, Optional
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, Optional, Tuple, Union
 
 import httpx
+from httpx._utils import get_environment_proxies
 
 from . import __version__
+from .archive import GameArchive
+from .cache import CachedResponse, CachePolicy, ResponseCache, cache_key
 from .const import BASE_API_URL, BASE_WEB_URL, STATS_API_URL
+from .jsonlib import AsyncJSONTransport, JSONTransport
+from .ratelimit import RateLimiter, RetryPolicy
 
 
-class HttpClient:
+class _BaseHttpClient:
+    """URL resolution and caching shared by the sync and async HTTP clients."""
+
+    def __init__(
+        self,
+        user_agent: str = f"EdgeworkClient/{__version__}",
+        cache: Optional[ResponseCache] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        archive: Optional[GameArchive] = None,
+        coalesce: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        timeout: Union[float, httpx.Timeout, None] = 5.0,
+        http2: bool = False,
+    ):
+        """
+        Initialize the shared client state.
+
+        Args:
+            user_agent: User agent string for requests
+            cache: Optional response cache backend
+            cache_policy: TTL policy for cached responses. Defaults to
+                ``CachePolicy()`` when a cache is given.
+            archive: Optional durable archive for final-game payloads
+            coalesce: If True, concurrent identical GETs share one request
+            rate_limiter: Optional global/per-host request rate limits
+            retry: Optional retry policy for failed GETs
+            max_connections: Maximum concurrent connections, None for no limit
+            max_keepalive_connections: Idle connections kept open for reuse
+            keepalive_expiry: Seconds an idle connection is kept open
+            timeout: Request timeout in seconds, or an ``httpx.Timeout``
+            http2: If True, negotiate HTTP/2 (requires ``httpx[http2]``)
+        """
+        self._user_agent = user_agent
+        self._cache = cache
+        self._cache_policy = cache_policy or CachePolicy()
+        self._archive = archive
+        self._coalesce = coalesce
+        self._inflight: Dict[str, Any] = {}
+        self.coalesced: int = 0
+        self._rate_limiter = rate_limiter
+        self._retry = retry
+        self._transport_options = {
+            "limits": httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            "http2": http2,
+        }
+        self._timeout = timeout
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                raise ImportError(
+                    "http2=True requires the 'h2' package; install it with "
+                    "`pip install edgework[http2]`."
+                ) from None
+
+    def _proxy_mounts(self, transport_class, wrapper) -> Dict[str, Any]:
+        """
+        Build transports for the proxies set in the environment.
+
+        httpx only honours HTTP_PROXY, HTTPS_PROXY, ALL_PROXY and NO_PROXY
+        when no custom transport is given, so they are mounted here with the
+        same pool options and JSON wrapper as the default transport.
+        """
+        return {
+            pattern: (
+                None
+                if proxy is None
+                else wrapper(transport_class(proxy=proxy, **self._transport_options))
+            )
+            for pattern, proxy in get_environment_proxies().items()
+        }
+
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        """The response cache backend, if caching is enabled."""
+        return self._cache
+
+    @property
+    def archive(self) -> Optional[GameArchive]:
+        """The final-game archive, if one is configured."""
+        return self._archive
+
+    def _cache_lookup(
+        self, url: str, params: Optional[Dict[str, Any]]
+    ) -> Tuple[Optional[str], Optional[httpx.Response]]:
+        """
+        Look up a request in the game archive and the response cache.
+
+        Returns:
+            The cache key (None when caching is disabled) and the stored
+            response, if there is a fresh one
+        """
+        if self._cache is None and self._archive is None:
+            return None, None
+        key = cache_key(url, params)
+        if self._archive is not None:
+            archived = self._archive.lookup(key)
+            if archived is not None:
+                return key, archived
+        if self._cache is None:
+            return key, None
+        entry = self._cache.get(key)
+        return key, entry.to_response() if entry is not None else None
+
+    def _cache_stale(
+        self, key: Optional[str]
+    ) -> Tuple[Optional[CachedResponse], Optional[Dict[str, str]]]:
+        """
+        Find a cached entry to revalidate with a conditional request.
+
+        Returns:
+            The stale entry and its ``If-None-Match``/``If-Modified-Since``
+            headers, or ``(None, None)``
+        """
+        if key is None or self._cache is None:
+            return None, None
+        stale = self._cache.get_stale(key)
+        if stale is None:
+            return None, None
+        return stale, stale.validators
+
+    def _cache_revalidated(
+        self, key: str, stale: CachedResponse, response: httpx.Response
+    ) -> httpx.Response:
+        """Refresh a stale entry from a 304 response and return its body."""
+        ttl = self._cache_policy.ttl_for(stale.url, stale.content)
+        entry = stale.revalidated(response, ttl)
+        self._cache.revalidate(key, entry)
+        return entry.to_response()
+
+    def _cache_store(self, key: Optional[str], response: httpx.Response) -> None:
+        """Store a successful response in the archive and cache, per policy."""
+        if key is None:
+            return
+        if self._archive is not None:
+            self._archive.store(key, response)
+        if self._cache is None:
+            return
+        ttl = self._cache_policy.ttl_for(str(response.request.url), response.content)
+        entry = CachedResponse.from_response(response, ttl)
+        # Keep zero-TTL responses that carry validators: they are always
+        # revalidated, which costs headers rather than a full body.
+        if ttl > 0 or entry.validators:
+            self._cache.set(key, entry)
+
+    def _throttle(self, url: str) -> float:
+        """Reserve a rate limiter slot, returning the seconds to wait."""
+        if self._rate_limiter is None:
+            return 0.0
+        return self._rate_limiter.reserve(httpx.URL(url).host)
+
+    def _retry_delay(
+        self, url: str, attempt: int, response: Optional[httpx.Response] = None
+    ) -> Optional[float]:
+        """
+        Decide whether to retry a failed attempt.
+
+        Args:
+            url: Request URL
+            attempt: Zero-based number of the attempt that failed
+            response: The response, or None for a transport error
+
+        Returns:
+            Seconds to wait before retrying, or None to give up
+        """
+        if self._retry is None or not self._retry.should_retry(attempt, response):
+            return None
+        delay = self._retry.delay(attempt, response)
+        if (
+            self._rate_limiter is not None
+            and response is not None
+            and "Retry-After" in response.headers
+        ):
+            # The server asked every client on this host to back off, not just
+            # this request.
+            self._rate_limiter.pause(httpx.URL(url).host, delay)
+        return delay
+
+    def _build_url(
+        self, endpoint: str, path: Optional[str] = None, web: bool = False
+    ) -> str:
+        """
+        Resolve an endpoint or path to a full NHL API URL.
+
+        Args:
+            endpoint: API endpoint (without base URL)
+            path: Optional full path to override endpoint
+            web: If True, use the web API base URL
+
+        Returns:
+            The full request URL
+        """
+        target = path or endpoint
+
+        if web:
+            return f"{BASE_WEB_URL}/v1/{target}"
+
+        target = target.lstrip("/")
+        if target.startswith("rest/"):
+            target = target[5:]
+        if target.startswith("en/"):
+            target = target[3:]
+        return f"{STATS_API_URL}en/{target}"
+
+    def _build_path_url(self, path: str, web: bool = False) -> str:
+        """
+        Resolve a full path against the API or stats base URL.
+
+        Args:
+            path: Full path including query parameters
+            web: If True, use the API base URL
+
+        Returns:
+            The full request URL
+        """
+        return f"{BASE_API_URL if web else STATS_API_URL}{path}"
+
+
+class HttpClient(_BaseHttpClient):
     """Base HTTP client for NHL API requests."""
 
-    def __init__(self, user_agent: str = f"EdgeworkClient/{__version__}"):
+    def __init__(
+        self,
+        user_agent: str = f"EdgeworkClient/{__version__}",
+        cache: Optional[ResponseCache] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        archive: Optional[GameArchive] = None,
+        coalesce: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        timeout: Union[float, httpx.Timeout, None] = 5.0,
+        http2: bool = False,
+    ):
         """
         Initialize the HTTP client.
 
         Args:
             user_agent: User agent string for requests
+            cache: Optional response cache backend (e.g. ``MemoryCache()``)
+            cache_policy: TTL policy for cached responses
+            archive: Optional durable archive for final-game payloads
+                (e.g. ``GameArchive("games.sqlite3")``)
+            coalesce: If True, identical GETs issued concurrently from several
+                threads share a single network request and response
+            rate_limiter: Optional global/per-host request rate limits
+                (e.g. ``RateLimiter.per_nhl_host(10)``)
+            retry: Optional retry policy for 429/5xx responses and transport
+                errors (e.g. ``RetryPolicy()``)
+            max_connections: Maximum concurrent connections, None for no limit
+            max_keepalive_connections: Idle connections kept open for reuse
+            keepalive_expiry: Seconds an idle connection is kept open
+            timeout: Request timeout in seconds, or an ``httpx.Timeout``
+            http2: If True, multiplex requests over HTTP/2 connections
+                (requires the ``http2`` extra)
         """
-        self._user_agent = user_agent
+        super().__init__(
+            user_agent,
+            cache,
+            cache_policy,
+            archive,
+            coalesce,
+            rate_limiter,
+            retry,
+            max_connections,
+            max_keepalive_connections,
+            keepalive_expiry,
+            timeout,
+            http2,
+        )
+        self._inflight_lock = threading.Lock()
         self._client = httpx.Client(
-            headers={"User-Agent": self._user_agent}, follow_redirects=True
+            headers={"User-Agent": self._user_agent},
+            follow_redirects=True,
+            timeout=self._timeout,
+            transport=JSONTransport(httpx.HTTPTransport(**self._transport_options)),
+            mounts=self._proxy_mounts(httpx.HTTPTransport, JSONTransport),
         )
 
     def get(
@@ -42,21 +325,9 @@ class HttpClient:
         Returns:
             httpx.Response object
         """
-        target = path or endpoint
+        url = self._build_url(endpoint, path, web)
 
-        if web:
-            url = f"{BASE_WEB_URL}/v1/{target}"
-        else:
-            target = target.lstrip("/")
-            if target.startswith("rest/"):
-                target = target[5:]
-            if target.startswith("en/"):
-                target = target[3:]
-            url = f"{STATS_API_URL}en/{target}"
-
-        response = self._client.get(url, params=params)
-        response.raise_for_status()
-        return response
+        return self._send(url, params)
 
     def get_raw(
         self, url: str, params: Optional[Dict[str, Any]] = None
@@ -71,9 +342,7 @@ class HttpClient:
         Returns:
             httpx.Response object
         """
-        response = self._client.get(url, params=params)
-        response.raise_for_status()
-        return response
+        return self._send(url, params)
 
     def get_with_path(
         self, path: str, params: Optional[Dict[str, Any]] = None, web: bool = False
@@ -89,12 +358,77 @@ class HttpClient:
         Returns:
             httpx.Response object
         """
-        url = f"{BASE_API_URL if web else STATS_API_URL}{path}"
+        url = self._build_path_url(path, web)
+
+        return self._send(url, params)
 
-        response = self._client.get(url, params=params)
+    def _send(self, url: str, params: Optional[Dict[str, Any]]) -> httpx.Response:
+        """Send a GET request, joining an identical request already in flight."""
+        if not self._coalesce:
+            return self._fetch(url, params)
+
+        flight_key = cache_key(url, params)
+        with self._inflight_lock:
+            future = self._inflight.get(flight_key)
+            leader = future is None
+            if leader:
+                future = self._inflight[flight_key] = Future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            return future.result()
+
+        try:
+            response = self._fetch(url, params)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(response)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[flight_key]
+        return response
+
+    def _fetch(self, url: str, params: Optional[Dict[str, Any]]) -> httpx.Response:
+        """Send a GET request, serving, revalidating and populating the cache."""
+        key, cached = self._cache_lookup(url, params)
+        if cached is not None:
+            return cached
+
+        stale, headers = self._cache_stale(key)
+        response = self._request(url, params, headers)
+        if stale is not None and response.status_code == 304:
+            return self._cache_revalidated(key, stale, response)
         response.raise_for_status()
+        self._cache_store(key, response)
         return response
 
+    def _request(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+    ) -> httpx.Response:
+        """Send a GET request under the rate limiter, retrying per policy."""
+        attempt = 0
+        while True:
+            wait = self._throttle(url)
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                response = self._client.get(url, params=params, headers=headers)
+            except httpx.TransportError:
+                delay = self._retry_delay(url, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(url, attempt, response)
+                if delay is None:
+                    return response
+            attempt += 1
+            time.sleep(delay)
+
     def close(self):
         """Close the HTTP client."""
         self._client.close()
@@ -104,3 +438,219 @@ class HttpClient:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
+
+
+class _Flight:
+    """A request in flight and the number of callers awaiting it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Future[httpx.Response]"):
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncHttpClient(_BaseHttpClient):
+    """Asynchronous HTTP client for NHL API requests.
+
+    Mirrors :class:`HttpClient` on top of ``httpx.AsyncClient`` so that many
+    requests can be in flight on a single event loop. One instance is meant to
+    be shared by every async sub-client.
+    """
+
+    def __init__(
+        self,
+        user_agent: str = f"EdgeworkClient/{__version__}",
+        cache: Optional[ResponseCache] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        archive: Optional[GameArchive] = None,
+        coalesce: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        timeout: Union[float, httpx.Timeout, None] = 5.0,
+        http2: bool = False,
+    ):
+        """
+        Initialize the async HTTP client.
+
+        Args:
+            user_agent: User agent string for requests
+            cache: Optional response cache backend (e.g. ``MemoryCache()``)
+            cache_policy: TTL policy for cached responses
+            archive: Optional durable archive for final-game payloads
+            coalesce: If True, identical GETs awaited concurrently share a
+                single network request and response
+            rate_limiter: Optional global/per-host request rate limits
+            retry: Optional retry policy for 429/5xx responses and transport
+                errors
+            max_connections: Maximum concurrent connections, None for no limit
+            max_keepalive_connections: Idle connections kept open for reuse
+            keepalive_expiry: Seconds an idle connection is kept open
+            timeout: Request timeout in seconds, or an ``httpx.Timeout``
+            http2: If True, multiplex requests over HTTP/2 connections
+                (requires the ``http2`` extra)
+        """
+        super().__init__(
+            user_agent,
+            cache,
+            cache_policy,
+            archive,
+            coalesce,
+            rate_limiter,
+            retry,
+            max_connections,
+            max_keepalive_connections,
+            keepalive_expiry,
+            timeout,
+            http2,
+        )
+        self._client = httpx.AsyncClient(
+            headers={"User-Agent": self._user_agent},
+            follow_redirects=True,
+            timeout=self._timeout,
+            transport=AsyncJSONTransport(
+                httpx.AsyncHTTPTransport(**self._transport_options)
+            ),
+            mounts=self._proxy_mounts(httpx.AsyncHTTPTransport, AsyncJSONTransport),
+        )
+
+    async def get(
+        self,
+        endpoint: str,
+        path: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        web: bool = False,
+    ) -> httpx.Response:
+        """
+        Make a GET request to an NHL API endpoint.
+
+        Args:
+            endpoint: API endpoint (without base URL)
+            path: Optional full path to override endpoint
+            params: Optional query parameters
+            web: If True, use the web API base URL
+
+        Returns:
+            httpx.Response object
+        """
+        url = self._build_url(endpoint, path, web)
+
+        return await self._send(url, params)
+
+    async def get_raw(
+        self, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> httpx.Response:
+        """
+        Make a GET request to a raw URL.
+
+        Args:
+            url: Full URL to request
+            params: Optional query parameters
+
+        Returns:
+            httpx.Response object
+        """
+        return await self._send(url, params)
+
+    async def get_with_path(
+        self, path: str, params: Optional[Dict[str, Any]] = None, web: bool = False
+    ) -> httpx.Response:
+        """
+        Make a GET request using a full path.
+
+        Args:
+            path: Full path including query parameters
+            params: Optional query parameters
+            web: If True, use the web API base URL
+
+        Returns:
+            httpx.Response object
+        """
+        url = self._build_path_url(path, web)
+
+        return await self._send(url, params)
+
+    async def _send(self, url: str, params: Optional[Dict[str, Any]]) -> httpx.Response:
+        """Send a GET request, joining an identical request already in flight."""
+        if not self._coalesce:
+            return await self._fetch(url, params)
+
+        flight_key = cache_key(url, params)
+        flight = self._inflight.get(flight_key)
+        if flight is not None:
+            self.coalesced += 1
+        else:
+            # The request runs in its own task so cancelling whichever caller
+            # started it does not cancel it for the others.
+            flight = self._inflight[flight_key] = _Flight(
+                asyncio.ensure_future(self._fetch(url, params))
+            )
+            flight.task.add_done_callback(lambda _: self._land(flight_key, flight))
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.task.done():
+                # Nobody is left waiting; drop the request.
+                self._land(flight_key, flight)
+                flight.task.cancel()
+
+    def _land(self, flight_key: str, flight: _Flight) -> None:
+        """Forget a flight unless a newer one has replaced it."""
+        if self._inflight.get(flight_key) is flight:
+            del self._inflight[flight_key]
+
+    async def _fetch(
+        self, url: str, params: Optional[Dict[str, Any]]
+    ) -> httpx.Response:
+        """Send a GET request, serving, revalidating and populating the cache."""
+        key, cached = self._cache_lookup(url, params)
+        if cached is not None:
+            return cached
+
+        stale, headers = self._cache_stale(key)
+        response = await self._request(url, params, headers)
+        if stale is not None and response.status_code == 304:
+            return self._cache_revalidated(key, stale, response)
+        response.raise_for_status()
+        self._cache_store(key, response)
+        return response
+
+    async def _request(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+    ) -> httpx.Response:
+        """Send a GET request under the rate limiter, retrying per policy."""
+        attempt = 0
+        while True:
+            wait = self._throttle(url)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                response = await self._client.get(url, params=params, headers=headers)
+            except httpx.TransportError:
+                delay = self._retry_delay(url, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(url, attempt, response)
+                if delay is None:
+                    return response
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def aclose(self):
+        """Close the async HTTP client."""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
@@ -0,0 +1,109 @@
+"""JSON decoding for API responses, using the fastest available backend.
+
+``orjson`` is used when installed, then ``msgspec``, falling back to the
+standard library. Install one with the ``fast-json`` extra.
+"""
+
+import json
+from typing import Any, Union
+
+import httpx
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - depends on the environment
+    msgspec = None
+
+
+def _msgspec_loads(content: Union[bytes, str]) -> Any:
+    try:
+        return _msgspec_decoder.decode(content)
+    except msgspec.DecodeError as exc:
+        # Match the stdlib/orjson error type so callers catch one exception.
+        doc = (
+            content if isinstance(content, str) else content.decode("utf-8", "replace")
+        )
+        raise json.JSONDecodeError(str(exc), doc, 0) from exc
+
+
+if orjson is not None:
+    BACKEND = "orjson"
+    _loads = orjson.loads
+elif msgspec is not None:  # pragma: no cover - depends on the environment
+    BACKEND = "msgspec"
+    _msgspec_decoder = msgspec.json.Decoder()
+    _loads = _msgspec_loads
+else:  # pragma: no cover - depends on the environment
+    BACKEND = "json"
+    _loads = json.loads
+
+
+def loads(content: Union[bytes, str]) -> Any:
+    """
+    Decode a JSON document with the configured backend.
+
+    Args:
+        content: UTF-8 encoded bytes or a string
+
+    Returns:
+        The decoded Python object
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    return _loads(content)
+
+
+class JSONResponse(httpx.Response):
+    """``httpx.Response`` whose ``json()`` uses the fast decoder."""
+
+    def json(self, **kwargs: Any) -> Any:
+        if kwargs:
+            # Decoder options (object_hook etc.) are stdlib-only.
+            return super().json(**kwargs)
+        return loads(self.content)
+
+
+class JSONTransport(httpx.BaseTransport):
+    """Transport wrapper that returns :class:`JSONResponse` objects."""
+
+    def __init__(self, transport: httpx.BaseTransport):
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = self._transport.handle_request(request)
+        return JSONResponse(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=response.stream,
+            extensions=response.extensions,
+            request=request,
+        )
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncJSONTransport(httpx.AsyncBaseTransport):
+    """Async transport wrapper that returns :class:`JSONResponse` objects."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self._transport.handle_async_request(request)
+        return JSONResponse(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=response.stream,
+            extensions=response.extensions,
+            request=request,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
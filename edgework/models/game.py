@@ -1,10 +1,24 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
 
 from edgework.http_client import HttpClient
 from edgework.models.base import BaseNHLModel
-from edgework.models.shift import Shift
+from edgework.models.play import Play
 from edgework.models.play_by_play import PlayByPlay
+from edgework.models.shift import Shift
+from edgework.models.shift_timeline import ShiftTimeline
+
+# Events that end the shifts running when they happen, so players whose shift
+# ends on the event's second were on ice for it.
+SHIFT_ENDING_TYPES = frozenset({"goal", "period-end", "game-end"})
+
+
+class OnIce(NamedTuple):
+    """Players on ice for one play-by-play event."""
+
+    play: Play
+    home: FrozenSet[int]
+    away: FrozenSet[int]
 
 
 class Game(BaseNHLModel):
@@ -22,6 +36,8 @@ class Game(BaseNHLModel):
         super().__init__(edgework_client, obj_id)
         self._data = kwargs
         self._shifts: Optional[List[Shift]] = None
+        self._shift_data: Optional[List[dict]] = None
+        self._shift_timeline: Optional[ShiftTimeline] = None
         self._play_by_play: Optional[PlayByPlay] = None
 
     @property
@@ -51,12 +67,49 @@ class Game(BaseNHLModel):
             self._shifts = self._get_shifts()
         return self._shifts
 
+    @property
+    def shift_timeline(self) -> ShiftTimeline:
+        if self._shift_timeline is None:
+            self._shift_timeline = ShiftTimeline.from_api(self._get_shift_data())
+        return self._shift_timeline
+
     @property
     def play_by_play(self) -> PlayByPlay:
         if not self._play_by_play:
             self._play_by_play = self._get_play_by_play()
         return self._play_by_play
 
+    def on_ice(self) -> List[OnIce]:
+        """Resolve the home and away players on ice for every event.
+
+        The play-by-play events are matched against the shift timeline in a
+        single sweep, so a game costs O(events + shifts).
+
+        Returns:
+            One OnIce per play, in game order.
+        """
+        play_by_play = self.play_by_play
+        timeline = self.shift_timeline
+        home_id = self.home_team_id
+        away_id = self.away_team_id
+        plays = play_by_play.plays
+        positions = timeline.sweep(
+            (play.seconds_elapsed, play.type_desc_key in SHIFT_ENDING_TYPES)
+            for play in plays
+        )
+
+        sides: Dict[int, Tuple[FrozenSet[int], FrozenSet[int]]] = {}
+        result = []
+        for play, position in zip(plays, positions):
+            if position not in sides:
+                sides[position] = (
+                    timeline.players_at(position, home_id),
+                    timeline.players_at(position, away_id),
+                )
+            home, away = sides[position]
+            result.append(OnIce(play, home, away))
+        return result
+
     @classmethod
     def from_dict(cls, data: dict, client: HttpClient):
         game = cls(edgework_client=client, **data)
@@ -125,15 +178,20 @@ class Game(BaseNHLModel):
         self._data.update(game_dict)
         self._fetched = True
 
+    def _get_shift_data(self) -> List[dict]:
+        """Get the raw shift chart rows for the game, fetching them once."""
+        if self._shift_data is None:
+            response = self._client.get(
+                "rest/en/shiftcharts",
+                params={"cayenneExp": f"gameId={self.game_id}"},
+                web=False,
+            )
+            self._shift_data = response.json()["data"]
+        return self._shift_data
+
     def _get_shifts(self):
         """Get the shifts for the game."""
-        response = self._client.get(
-            "rest/en/shiftcharts",
-            params={"cayenneExp": f"gameId={self.game_id}"},
-            web=False,
-        )
-        data = response.json()["data"]
-        shifts = [Shift.from_api(d) for d in data]
+        shifts = [Shift.from_api(d) for d in self._get_shift_data()]
         self._shifts = shifts
         return shifts
 
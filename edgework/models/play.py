@@ -1,92 +1,200 @@
-from datetime import datetime
-from typing import TYPE_CHECKING, Dict, List, Optional
-
-from edgework.models.base import BaseNHLModel
-
+from typing import Dict, List, Optional, Tuple
+
+PERIOD_SECONDS = 20 * 60
+
+SHOT_TYPES = frozenset({"shot-on-goal", "missed-shot", "blocked-shot"})
+
+# Detail keys naming the players involved in an event, primary actor first.
+PLAYER_ID_KEYS = (
+    "scoringPlayerId",
+    "shootingPlayerId",
+    "hittingPlayerId",
+    "winningPlayerId",
+    "committedByPlayerId",
+    "playerId",
+    "blockingPlayerId",
+    "assist1PlayerId",
+    "assist2PlayerId",
+    "hitteePlayerId",
+    "losingPlayerId",
+    "drawnByPlayerId",
+    "servedByPlayerId",
+    "goalieInNetId",
+)
+
+
+def clock_to_seconds(clock: Optional[str]) -> Optional[int]:
+    """Convert an ``MM:SS`` game clock string to seconds."""
+    if not clock:
+        return None
+    minutes, _, seconds = clock.partition(":")
+    try:
+        return int(minutes) * 60 + int(seconds)
+    except ValueError:
+        return None
 
-class Play(BaseNHLModel):
-    """Play model to store individual play event information."""
 
-    def __init__(self, edgework_client, obj_id=None, **kwargs):
+class Play:
+    """Play model to store individual play event information.
+
+    Plays are compact slotted records: a full season is ~500k of them, so they
+    carry no client reference or per-instance ``__dict__``. The raw ``details``
+    object from the API is kept as-is, and the commonly queried values are
+    lifted into typed fields.
+
+    Attributes:
+        event_id: Event ID, unique within the game
+        period_number: Period number (4+ is overtime)
+        period_type: ``REG``, ``OT`` or ``SO``
+        time_in_period: Elapsed period clock as ``MM:SS``
+        time_remaining: Remaining period clock as ``MM:SS``
+        seconds_elapsed: Game seconds elapsed, counting 20 minutes per
+            completed period
+        situation_code: Four-digit on-ice situation code
+        home_team_defending_side: ``left`` or ``right``
+        type_code: Numeric event type code
+        type_desc_key: Event type, e.g. ``goal`` or ``shot-on-goal``
+        sort_order: Order of the event within the game
+        team_id: ID of the team that owns the event
+        x_coord: Rink x coordinate
+        y_coord: Rink y coordinate
+        zone_code: ``O``, ``D`` or ``N``
+        details: Raw event details from the API
+        ppt_replay_url: Replay data URL
+    """
+
+    __slots__ = (
+        "event_id",
+        "period_number",
+        "period_type",
+        "time_in_period",
+        "time_remaining",
+        "seconds_elapsed",
+        "situation_code",
+        "home_team_defending_side",
+        "type_code",
+        "type_desc_key",
+        "sort_order",
+        "team_id",
+        "x_coord",
+        "y_coord",
+        "zone_code",
+        "details",
+        "ppt_replay_url",
+    )
+
+    # Plays are always built from loaded data; kept for BaseNHLModel parity.
+    _fetched = True
+
+    def __init__(self, edgework_client=None, obj_id=None, **kwargs):
         """
-        Initialize a Play object with dynamic attributes.
+        Initialize a Play object.
 
         Args:
-            edgework_client: The Edgework client
-            obj_id: The ID of the play object
-            **kwargs: Dynamic attributes for play properties
+            edgework_client: Unused; accepted for compatibility with other
+                models
+            obj_id: Unused; the event ID identifies a play
+            **kwargs: Field values, see the class attributes
+
+        Raises:
+            TypeError: If a keyword is not a Play field
         """
-        super().__init__(edgework_client, obj_id)
-        self._data = kwargs
+        for name in self.__slots__:
+            setattr(self, name, kwargs.pop(name, None))
+        if kwargs:
+            raise TypeError(f"Unknown Play field(s): {', '.join(sorted(kwargs))}")
 
     @classmethod
-    def from_dict(cls, data: dict, client) -> "Play":
+    def from_dict(cls, data: dict, client=None) -> "Play":
         """
         Create a Play object from a dictionary.
 
         Args:
             data: Dictionary containing play data
-            client: The HttpClient
+            client: Unused; accepted for compatibility with other models
 
         Returns:
             Play: A Play object
         """
-        return cls(edgework_client=client, **data)
+        return cls(**data)
 
     @classmethod
-    def from_api(cls, data: dict, client) -> "Play":
+    def from_api(cls, data: dict, client=None) -> "Play":
         """
         Create a Play object from raw API response data.
 
         Args:
             data: Raw API response data
-            client: The HttpClient
+            client: Unused; accepted for compatibility with other models
 
         Returns:
             Play: A Play object
         """
-        play_dict = {
-            "event_id": data.get("eventId"),
-            "period_number": data.get("periodDescriptor", {}).get("number"),
-            "period_type": data.get("periodDescriptor", {}).get("periodType"),
-            "time_in_period": data.get("timeInPeriod"),
-            "time_remaining": data.get("timeRemaining"),
-            "situation_code": data.get("situationCode"),
-            "home_team_defending_side": data.get("homeTeamDefendingSide"),
-            "type_code": data.get("typeCode"),
-            "type_desc_key": data.get("typeDescKey"),
-            "sort_order": data.get("sortOrder"),
-            "details": data.get("details", {}),
-            "ppt_replay_url": data.get("pptReplayUrl"),
-        }
-        play = cls.from_dict(play_dict, client)
-        play._fetched = True
+        play = cls.__new__(cls)
+        period = data.get("periodDescriptor") or {}
+        details = data.get("details") or {}
+        period_number = period.get("number")
+        time_in_period = data.get("timeInPeriod")
+        period_seconds = clock_to_seconds(time_in_period)
+
+        play.event_id = data.get("eventId")
+        play.period_number = period_number
+        play.period_type = period.get("periodType")
+        play.time_in_period = time_in_period
+        play.time_remaining = data.get("timeRemaining")
+        play.seconds_elapsed = (
+            (period_number - 1) * PERIOD_SECONDS + period_seconds
+            if period_number and period_seconds is not None
+            else None
+        )
+        play.situation_code = data.get("situationCode")
+        play.home_team_defending_side = data.get("homeTeamDefendingSide")
+        play.type_code = data.get("typeCode")
+        play.type_desc_key = data.get("typeDescKey")
+        play.sort_order = data.get("sortOrder")
+        play.team_id = details.get("eventOwnerTeamId")
+        play.x_coord = details.get("xCoord")
+        play.y_coord = details.get("yCoord")
+        play.zone_code = details.get("zoneCode")
+        play.details = details
+        play.ppt_replay_url = data.get("pptReplayUrl")
         return play
 
+    @property
+    def _data(self) -> Dict:
+        """Field values as a dictionary, for code written against ``_data``."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @property
+    def player_ids(self) -> Tuple[int, ...]:
+        """IDs of the players involved in the event, primary actor first."""
+        details = self.details
+        if not details:
+            return ()
+        return tuple(
+            details[key] for key in PLAYER_ID_KEYS if details.get(key) is not None
+        )
+
     @property
     def is_goal(self) -> bool:
         """Check if this play is a goal."""
-        return self._data.get("type_desc_key") == "goal"
+        return self.type_desc_key == "goal"
 
     @property
     def is_penalty(self) -> bool:
         """Check if this play is a penalty."""
-        return self._data.get("type_desc_key") == "penalty"
+        return self.type_desc_key == "penalty"
 
     @property
     def is_shot(self) -> bool:
         """Check if this play is a shot."""
-        return self._data.get("type_desc_key") in [
-            "shot-on-goal",
-            "missed-shot",
-            "blocked-shot",
-        ]
+        return self.type_desc_key in SHOT_TYPES
 
     @property
     def goal_details(self) -> Optional[Dict]:
         """Get goal-specific details if this is a goal."""
-        if self.is_goal and self._data.get("details"):
-            return self._data["details"]
+        if self.is_goal and self.details:
+            return self.details
         return None
 
     @property
@@ -109,15 +217,20 @@ class Play(BaseNHLModel):
                 assists.append(details["assist2PlayerId"])
         return assists
 
+    @property
+    def coordinates(self) -> Optional[Tuple[int, int]]:
+        """Get the ``(x, y)`` rink coordinates, if the event has them."""
+        if self.x_coord is None or self.y_coord is None:
+            return None
+        return self.x_coord, self.y_coord
+
     def __str__(self) -> str:
         """Return a human-readable string representation of the play."""
-        event_id = self._data.get("event_id")
-        period = self._data.get("period_number")
-        time = self._data.get("time_in_period")
-        play_type = self._data.get("type_desc_key")
-
-        return f"Period {period} @ {time}: {play_type} (ID: {event_id})"
+        return (
+            f"Period {self.period_number} @ {self.time_in_period}: "
+            f"{self.type_desc_key} (ID: {self.event_id})"
+        )
 
     def __repr__(self) -> str:
         """Return a detailed string representation of the play."""
-        return f"Play(event_id={self._data.get('event_id')}, type={self._data.get('type_desc_key')})"
+        return f"Play(event_id={self.event_id}, type={self.type_desc_key})"
@@ -1,10 +1,56 @@
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Union
 
 from edgework.models.base import BaseNHLModel
-from edgework.models.play import Play
+from edgework.models.play import PLAYER_ID_KEYS, SHOT_TYPES, Play
 
 if TYPE_CHECKING:
     from edgework.http_client import HttpClient
+    from edgework.models.play_columns import PlayColumns
+
+
+class PlayIndex:
+    """Inverted indexes from player, team, period and event type to plays.
+
+    Each index maps a key to the ascending positions of the matching events in
+    the game's ``plays`` list, so a query costs O(result) once built.
+    """
+
+    __slots__ = ("players", "teams", "periods", "types")
+
+    def __init__(self, plays: List[dict]):
+        """
+        Build the indexes in a single pass over raw API plays.
+
+        Args:
+            plays: The ``plays`` list of a play-by-play response
+        """
+        self.players: Dict[int, List[int]] = {}
+        self.teams: Dict[int, List[int]] = {}
+        self.periods: Dict[int, List[int]] = {}
+        self.types: Dict[str, List[int]] = {}
+        for position, play in enumerate(plays):
+            details = play.get("details") or {}
+            period = (play.get("periodDescriptor") or {}).get("number")
+            team_id = details.get("eventOwnerTeamId")
+            self.types.setdefault(play.get("typeDescKey"), []).append(position)
+            if period is not None:
+                self.periods.setdefault(period, []).append(position)
+            if team_id is not None:
+                self.teams.setdefault(team_id, []).append(position)
+            for key in PLAYER_ID_KEYS:
+                player_id = details.get(key)
+                if player_id is None:
+                    continue
+                positions = self.players.setdefault(player_id, [])
+                if not positions or positions[-1] != position:
+                    positions.append(position)
+
+    def positions_of_types(self, types) -> List[int]:
+        """Positions of events with any of the given ``typeDescKey`` values."""
+        found = [self.types.get(type_key, ()) for type_key in types]
+        if len(found) == 1:
+            return list(found[0])
+        return sorted(position for positions in found for position in positions)
 
 
 def play_by_play_api_to_dict(data: dict) -> dict:
@@ -53,7 +99,12 @@ class PlayByPlay(BaseNHLModel):
         """
         super().__init__(http_client, obj_id)
         self._data = kwargs.copy()
+        # None until every play has been parsed; single plays parsed on
+        # demand by iter_plays are kept in _parsed until then.
         self._plays_objects: Optional[List[Play]] = None
+        self._parsed: Dict[int, Play] = {}
+        self._columns: Optional["PlayColumns"] = None
+        self._index: Optional[PlayIndex] = None
 
         if kwargs:
             self._fetched = True
@@ -103,13 +154,86 @@ class PlayByPlay(BaseNHLModel):
         Returns:
             List[Play]: List of Play objects
         """
-        if not self._plays_objects and self._data.get("plays"):
-            plays_data = self._data["plays"]
+        if self._plays_objects is None:
+            plays_data = self._data.get("plays") or []
             self._plays_objects = [
-                Play.from_api(play_data, self._client) for play_data in plays_data
+                self._play_at(position) for position in range(len(plays_data))
             ]
+            self._parsed = {}
         return self._plays_objects
 
+    def iter_plays(
+        self, types: Union[str, Iterable[str], None] = None
+    ) -> Iterator[Play]:
+        """
+        Iterate over plays, parsing each one only when it is reached.
+
+        Only matching raw events are turned into Play objects, so asking for
+        goals and penalties in a large game builds a handful of objects.
+        Parsed plays are cached and shared with ``plays``.
+
+        Args:
+            types: Event type(s) (``typeDescKey``) to include, e.g.
+                ``("goal", "penalty")``; None for every play
+
+        Yields:
+            Play: Matching plays in game order
+        """
+        if types is None:
+            positions = range(len(self._data.get("plays") or []))
+        else:
+            if isinstance(types, str):
+                types = (types,)
+            positions = self.index.positions_of_types(types)
+        for position in positions:
+            yield self._play_at(position)
+
+    @property
+    def index(self) -> PlayIndex:
+        """
+        Get the player, team, period and event type indexes, built on first use.
+
+        Returns:
+            PlayIndex: Positions of matching events in ``plays``
+        """
+        if self._index is None:
+            self._index = PlayIndex(self._data.get("plays") or [])
+        return self._index
+
+    def _play_at(self, position: int) -> Play:
+        """Play object at a position of ``plays``, parsed on first access."""
+        if self._plays_objects is not None:
+            return self._plays_objects[position]
+        play = self._parsed.get(position)
+        if play is None:
+            play = Play.from_api(self._data["plays"][position], self._client)
+            self._parsed[position] = play
+        return play
+
+    def _plays_at(self, positions) -> List[Play]:
+        """Play objects at the given positions of ``plays``."""
+        return [self._play_at(position) for position in positions]
+
+    def to_columns(self) -> "PlayColumns":
+        """
+        Get the plays as NumPy columns for vectorized filtering.
+
+        The columns are built once from the raw plays and cached. Combine
+        several games with ``PlayColumns.concat``. Requires numpy.
+
+        Returns:
+            PlayColumns: One row per play, in the order of ``plays``
+        """
+        if self._columns is None:
+            from edgework.models.play_columns import PlayColumns
+
+            self._columns = PlayColumns.from_api(
+                self._data.get("plays") or [],
+                game_id=self._data.get("game_id") or 0,
+                home_team_id=(self._data.get("home_team") or {}).get("id") or 0,
+            )
+        return self._columns
+
     @property
     def goals(self) -> List[Play]:
         """
@@ -118,7 +242,7 @@ class PlayByPlay(BaseNHLModel):
         Returns:
             List[Play]: List of goal plays
         """
-        return [play for play in self.plays if play.is_goal]
+        return list(self.iter_plays("goal"))
 
     @property
     def penalties(self) -> List[Play]:
@@ -128,7 +252,7 @@ class PlayByPlay(BaseNHLModel):
         Returns:
             List[Play]: List of penalty plays
         """
-        return [play for play in self.plays if play.is_penalty]
+        return list(self.iter_plays("penalty"))
 
     @property
     def shots(self) -> List[Play]:
@@ -138,7 +262,7 @@ class PlayByPlay(BaseNHLModel):
         Returns:
             List[Play]: List of shot plays
         """
-        return [play for play in self.plays if play.is_shot]
+        return list(self.iter_plays(SHOT_TYPES))
 
     @property
     def total_plays(self) -> int:
@@ -161,11 +285,7 @@ class PlayByPlay(BaseNHLModel):
         Returns:
             List[Play]: List of plays from the specified period
         """
-        return [
-            play
-            for play in self.plays
-            if play._data.get("period_number") == period_number
-        ]
+        return self._plays_at(self.index.periods.get(period_number, ()))
 
     def get_plays_by_team(self, team_id: int) -> List[Play]:
         """
@@ -177,11 +297,7 @@ class PlayByPlay(BaseNHLModel):
         Returns:
             List[Play]: List of plays involving the specified team
         """
-        return [
-            play
-            for play in self.plays
-            if play._data.get("details", {}).get("eventOwnerTeamId") == team_id
-        ]
+        return self._plays_at(self.index.teams.get(team_id, ()))
 
     def get_plays_by_player(self, player_id: int) -> List[Play]:
         """
@@ -193,19 +309,7 @@ class PlayByPlay(BaseNHLModel):
         Returns:
             List[Play]: List of plays involving the specified player
         """
-        result = []
-        for play in self.plays:
-            details = play._data.get("details", {})
-            if (
-                details.get("scoringPlayerId") == player_id
-                or details.get("assist1PlayerId") == player_id
-                or details.get("assist2PlayerId") == player_id
-                or details.get("playerId") == player_id
-                or details.get("penaltyOnPlayerId") == player_id
-                or details.get("drewByPlayerId") == player_id
-            ):
-                result.append(play)
-        return result
+        return self._plays_at(self.index.players.get(player_id, ()))
 
     def __str__(self) -> str:
         """
@@ -0,0 +1,329 @@
+"""Columnar, NumPy-backed view of play-by-play events."""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+from edgework.models.play import PERIOD_SECONDS, PLAYER_ID_KEYS, clock_to_seconds
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+# NHL event type codes, keyed by ``typeDescKey``.
+TYPE_CODES: Dict[str, int] = {
+    "faceoff": 502,
+    "hit": 503,
+    "giveaway": 504,
+    "goal": 505,
+    "shot-on-goal": 506,
+    "missed-shot": 507,
+    "blocked-shot": 508,
+    "penalty": 509,
+    "stoppage": 516,
+    "period-start": 520,
+    "period-end": 521,
+    "shootout-complete": 523,
+    "game-end": 524,
+    "takeaway": 525,
+    "delayed-penalty": 535,
+    "failed-shot-attempt": 537,
+}
+
+# Strength states from the event owner's point of view; ``strength`` codes are
+# positions in this tuple, -1 when unknown. "EV" is any even strength but 5v5,
+# "EN" means the opponent's net is empty and "EA" that the owner pulled its own
+# goalie for an extra attacker.
+STRENGTH_STATES = ("5v5", "EV", "PP", "SH", "EN", "EA")
+
+MAX_PLAYERS = 4
+"""Player ID columns kept per event (scorer, two assists and goalie fit)."""
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError(
+            "Columnar play-by-play requires numpy; install it with "
+            "`pip install edgework[columns]`."
+        )
+
+
+class PlayColumns:
+    """Play-by-play events stored as parallel NumPy arrays.
+
+    Each attribute is an array with one entry per event, so filters are
+    boolean masks and aggregations are array reductions. Missing integers are
+    stored as ``-1`` (``0`` for IDs) and missing coordinates as ``NaN``.
+
+    Attributes:
+        game_id: Game ID (int64)
+        row: Index of the event in its game's ``plays`` list (int32)
+        event_id: Event ID (int32)
+        period: Period number (int8)
+        seconds: Game seconds elapsed (int32)
+        type_code: Event type code, see ``TYPE_CODES`` (int16)
+        team_id: Owning team ID (int32)
+        home_team_id: Home team ID of the game (int32)
+        x_coord: Rink x coordinate (float32)
+        y_coord: Rink y coordinate (float32)
+        situation_code: Situation code as an integer, e.g. 1551 (int16)
+        player_ids: Involved player IDs, primary first, shape
+            ``(n, MAX_PLAYERS)`` (int64)
+    """
+
+    COLUMNS = (
+        "game_id",
+        "row",
+        "event_id",
+        "period",
+        "seconds",
+        "type_code",
+        "team_id",
+        "home_team_id",
+        "x_coord",
+        "y_coord",
+        "situation_code",
+        "player_ids",
+    )
+
+    def __init__(self, **columns):
+        """
+        Initialize from arrays.
+
+        Args:
+            **columns: One array per name in ``COLUMNS``, all the same length
+        """
+        _require_numpy()
+        for name in self.COLUMNS:
+            setattr(self, name, columns[name])
+
+    @classmethod
+    def from_api(
+        cls, plays: Sequence[dict], game_id: int = 0, home_team_id: int = 0
+    ) -> "PlayColumns":
+        """
+        Build columns from raw API ``plays``.
+
+        Args:
+            plays: The ``plays`` list of a play-by-play response
+            game_id: Game ID stored in the ``game_id`` column
+            home_team_id: Home team ID, used to decode strength states
+
+        Returns:
+            PlayColumns: One row per play, in the original order
+        """
+        _require_numpy()
+        n = len(plays)
+        event_id = np.full(n, -1, dtype=np.int32)
+        period = np.full(n, -1, dtype=np.int8)
+        seconds = np.full(n, -1, dtype=np.int32)
+        type_code = np.full(n, -1, dtype=np.int16)
+        team_id = np.zeros(n, dtype=np.int32)
+        x_coord = np.full(n, np.nan, dtype=np.float32)
+        y_coord = np.full(n, np.nan, dtype=np.float32)
+        situation_code = np.full(n, -1, dtype=np.int16)
+        player_ids = np.zeros((n, MAX_PLAYERS), dtype=np.int64)
+
+        for i, play in enumerate(plays):
+            descriptor = play.get("periodDescriptor") or {}
+            details = play.get("details") or {}
+            number = descriptor.get("number")
+            clock = clock_to_seconds(play.get("timeInPeriod"))
+
+            if play.get("eventId") is not None:
+                event_id[i] = play["eventId"]
+            if number is not None:
+                period[i] = number
+                if clock is not None:
+                    seconds[i] = (number - 1) * PERIOD_SECONDS + clock
+            code = play.get("typeCode")
+            if code is None:
+                code = TYPE_CODES.get(play.get("typeDescKey"))
+            if code is not None:
+                type_code[i] = code
+            if details.get("eventOwnerTeamId") is not None:
+                team_id[i] = details["eventOwnerTeamId"]
+            if details.get("xCoord") is not None:
+                x_coord[i] = details["xCoord"]
+            if details.get("yCoord") is not None:
+                y_coord[i] = details["yCoord"]
+            situation = play.get("situationCode")
+            if situation and situation.isdigit():
+                situation_code[i] = int(situation)
+            slot = 0
+            for key in PLAYER_ID_KEYS:
+                player_id = details.get(key)
+                if player_id is not None:
+                    player_ids[i, slot] = player_id
+                    slot += 1
+                    if slot == MAX_PLAYERS:
+                        break
+
+        return cls(
+            game_id=np.full(n, game_id, dtype=np.int64),
+            row=np.arange(n, dtype=np.int32),
+            event_id=event_id,
+            period=period,
+            seconds=seconds,
+            type_code=type_code,
+            team_id=team_id,
+            home_team_id=np.full(n, home_team_id, dtype=np.int32),
+            x_coord=x_coord,
+            y_coord=y_coord,
+            situation_code=situation_code,
+            player_ids=player_ids,
+        )
+
+    @classmethod
+    def concat(cls, parts: Iterable["PlayColumns"]) -> "PlayColumns":
+        """
+        Stack columns from several games into one.
+
+        Args:
+            parts: Columns to combine, e.g. one per game of a season
+
+        Returns:
+            PlayColumns: All rows, in order
+        """
+        _require_numpy()
+        parts = list(parts)
+        if not parts:
+            return cls.from_api([])
+        return cls(
+            **{
+                name: np.concatenate([getattr(part, name) for part in parts])
+                for name in cls.COLUMNS
+            }
+        )
+
+    def __len__(self) -> int:
+        return len(self.event_id)
+
+    def mask(
+        self,
+        period: Optional[int] = None,
+        team_id: Optional[int] = None,
+        player_id: Optional[int] = None,
+        type_code: Union[int, str, None] = None,
+        game_id: Optional[int] = None,
+        strength: Optional[str] = None,
+    ):
+        """
+        Build a boolean mask selecting events that match every given filter.
+
+        Args:
+            period: Period number
+            team_id: Owning team ID
+            player_id: Player involved in the event
+            type_code: Event type code, or a ``typeDescKey`` such as ``"goal"``
+            game_id: Game ID
+            strength: Strength state, one of ``STRENGTH_STATES``
+
+        Returns:
+            numpy.ndarray: Boolean array, one entry per event
+        """
+        selected = np.ones(len(self), dtype=bool)
+        if period is not None:
+            selected &= self.period == period
+        if team_id is not None:
+            selected &= self.team_id == team_id
+        if player_id is not None:
+            selected &= (self.player_ids == player_id).any(axis=1)
+        if type_code is not None:
+            if isinstance(type_code, str):
+                type_code = TYPE_CODES[type_code]
+            selected &= self.type_code == type_code
+        if game_id is not None:
+            selected &= self.game_id == game_id
+        if strength is not None:
+            selected &= self.strength() == STRENGTH_STATES.index(strength)
+        return selected
+
+    def situations(self) -> Dict[str, "np.ndarray"]:
+        """
+        Decode every situation code at once.
+
+        The four digits of a code are away goalie, away skaters, home skaters
+        and home goalie, e.g. 1451 is a home power play. Events without a code
+        decode to -1 counts and no empty nets.
+
+        Returns:
+            Dict of arrays: ``away_skaters`` and ``home_skaters`` (int8),
+            ``away_empty_net`` and ``home_empty_net`` (bool)
+        """
+        code = self.situation_code
+        known = code >= 0
+        return {
+            "away_skaters": np.where(known, code // 100 % 10, -1).astype(np.int8),
+            "home_skaters": np.where(known, code // 10 % 10, -1).astype(np.int8),
+            "away_empty_net": known & (code // 1000 == 0),
+            "home_empty_net": known & (code % 10 == 0),
+        }
+
+    def strength(self):
+        """
+        Get each event's strength state from the owning team's point of view.
+
+        Returns:
+            numpy.ndarray: int8 positions in ``STRENGTH_STATES``, -1 when the
+            situation or owning team is unknown
+        """
+        situations = self.situations()
+        is_home = self.team_id == self.home_team_id
+        own = np.where(is_home, situations["home_skaters"], situations["away_skaters"])
+        other = np.where(
+            is_home, situations["away_skaters"], situations["home_skaters"]
+        )
+        own_net_empty = np.where(
+            is_home, situations["home_empty_net"], situations["away_empty_net"]
+        )
+        other_net_empty = np.where(
+            is_home, situations["away_empty_net"], situations["home_empty_net"]
+        )
+        state = np.select(
+            [
+                other_net_empty,
+                own_net_empty,
+                own > other,
+                own < other,
+                (own == 5) & (other == 5),
+            ],
+            [STRENGTH_STATES.index(state) for state in ("EN", "EA", "PP", "SH", "5v5")],
+            default=STRENGTH_STATES.index("EV"),
+        ).astype(np.int8)
+        unknown = (self.situation_code < 0) | (self.team_id == 0)
+        unknown |= self.home_team_id == 0
+        state[unknown] = -1
+        return state
+
+    def select(self, mask) -> "PlayColumns":
+        """
+        Keep only the rows selected by a boolean mask or index array.
+
+        Args:
+            mask: Boolean mask or integer indices
+
+        Returns:
+            PlayColumns: The selected rows
+        """
+        return PlayColumns(**{name: getattr(self, name)[mask] for name in self.COLUMNS})
+
+    def filter(self, **filters) -> "PlayColumns":
+        """Select rows matching every filter; see :meth:`mask` for arguments."""
+        return self.select(self.mask(**filters))
+
+    def counts(self, column: str) -> Dict[int, int]:
+        """
+        Count events per distinct value of a column.
+
+        Args:
+            column: Column name, e.g. ``"type_code"`` or ``"team_id"``
+
+        Returns:
+            Dict mapping each value to its number of events
+        """
+        values, counts = np.unique(getattr(self, column), return_counts=True)
+        return dict(zip(values.tolist(), counts.tolist()))
+
+    def rows(self) -> List[int]:
+        """Row indices into the source ``plays`` list, for a single game."""
+        return self.row.tolist()
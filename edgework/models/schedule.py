@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Dict, List, Optional
 
 from edgework.models.base import BaseNHLModel
+from edgework.models.season_schedule import SeasonSchedule
 
 if TYPE_CHECKING:
     from edgework.models.game import Game
@@ -42,6 +43,7 @@ class Schedule(BaseNHLModel):
         super().__init__(http_client, obj_id)
         self._data = kwargs.copy()  # Create a copy to avoid modifying original kwargs
         self._games_objects: List[Game] = []
+        self._index: Optional["SeasonSchedule"] = None
 
         # Initialize empty games list if not provided
         if "games" not in self._data:
@@ -194,6 +196,20 @@ class Schedule(BaseNHLModel):
                     self._games_objects.append(game)
         return self._games_objects
 
+    @property
+    def index(self) -> SeasonSchedule:
+        """
+        Get the raw games indexed by date, team, game type and ID.
+
+        Built on first access; use it instead of filtering ``games`` repeatedly.
+
+        Returns:
+            SeasonSchedule: Index over this schedule's games
+        """
+        if self._index is None:
+            self._index = SeasonSchedule(self._data.get("games") or [])
+        return self._index
+
     @property
     def games_today(self) -> List["Game"]:
         """
@@ -0,0 +1,275 @@
+"""Season-level schedule index over raw schedule games."""
+
+from array import array
+from bisect import bisect_right
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+COMPLETED_STATES = frozenset({"OFF", "FINAL"})
+
+
+def game_local_date(game: dict) -> Optional[str]:
+    """
+    Get the local (venue) date of a schedule game as ``YYYY-MM-DD``.
+
+    Uses ``gameDate`` when present, otherwise shifts ``startTimeUTC`` by
+    ``venueUTCOffset`` so late west-coast games keep their local date.
+
+    Args:
+        game: Raw schedule game
+
+    Returns:
+        The game date, or None if the game has no usable time
+    """
+    if game.get("gameDate"):
+        return game["gameDate"][:10]
+    start = game.get("startTimeUTC")
+    if not start:
+        return None
+    try:
+        when = datetime.fromisoformat(start.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    offset = game.get("venueUTCOffset")
+    if offset:
+        sign = -1 if offset.startswith("-") else 1
+        hours, _, minutes = offset.lstrip("+-").partition(":")
+        when += sign * timedelta(hours=int(hours), minutes=int(minutes or 0))
+    return when.strftime("%Y-%m-%d")
+
+
+def _date_key(value: Union[str, date]) -> str:
+    return value.strftime("%Y-%m-%d") if isinstance(value, date) else value[:10]
+
+
+class SeasonSchedule:
+    """Index of a season's games by date, team, game type and ID.
+
+    Built once from raw schedule games (sorted by start time); every lookup
+    is a dict access or a binary search. Rest days are precomputed per game
+    for both teams: ``home_rest[i]`` and ``away_rest[i]`` hold the days since
+    that team's previous game, ``-1`` for its first game.
+
+    Example:
+        >>> season = client.schedule.get_season_schedule(20232024)
+        >>> season.for_team("TOR", home=True)
+        >>> season.back_to_backs("TOR")
+    """
+
+    def __init__(self, games: Iterable[dict]):
+        """
+        Index schedule games.
+
+        Args:
+            games: Raw schedule games, e.g. ``Schedule._data["games"]``; games
+                repeated by ID are kept once
+        """
+        unique = {}
+        for game in games:
+            unique.setdefault(game.get("id"), game)
+        self.games: List[dict] = sorted(
+            unique.values(), key=lambda game: game.get("startTimeUTC") or ""
+        )
+        self._start_times = [game.get("startTimeUTC") or "" for game in self.games]
+        self.dates: List[Optional[str]] = [game_local_date(g) for g in self.games]
+
+        self._by_id: Dict[int, int] = {}
+        self._by_date: Dict[str, List[int]] = {}
+        self._by_type: Dict[int, List[int]] = {}
+        self._home: Dict[int, List[int]] = {}
+        self._away: Dict[int, List[int]] = {}
+        self._by_team: Dict[int, List[int]] = {}
+        self._abbrevs: Dict[str, int] = {}
+        self._completed: List[int] = []
+        for position, game in enumerate(self.games):
+            self._by_id[game.get("id")] = position
+            if game.get("gameState") in COMPLETED_STATES:
+                self._completed.append(position)
+            if self.dates[position]:
+                self._by_date.setdefault(self.dates[position], []).append(position)
+            self._by_type.setdefault(game.get("gameType"), []).append(position)
+            for side, index in (("homeTeam", self._home), ("awayTeam", self._away)):
+                team = game.get(side) or {}
+                team_id = team.get("id")
+                if team_id is None:
+                    continue
+                index.setdefault(team_id, []).append(position)
+                self._by_team.setdefault(team_id, []).append(position)
+                if team.get("abbrev"):
+                    self._abbrevs[team["abbrev"]] = team_id
+
+        self.home_rest = array("h", [-1]) * len(self.games)
+        self.away_rest = array("h", [-1]) * len(self.games)
+        for team_id, positions in self._by_team.items():
+            previous = None
+            for position in positions:
+                day = self.dates[position]
+                current = date.fromisoformat(day) if day else None
+                if previous is not None and current is not None:
+                    rest = (current - previous).days
+                    if self._is_home(position, team_id):
+                        self.home_rest[position] = rest
+                    else:
+                        self.away_rest[position] = rest
+                previous = current
+
+    @classmethod
+    def from_api(cls, data: dict) -> "SeasonSchedule":
+        """
+        Index the games of a schedule response (``games`` or ``gameWeek``).
+
+        Args:
+            data: Raw schedule API response
+
+        Returns:
+            SeasonSchedule: The indexed games
+        """
+        if data.get("games"):
+            return cls(data["games"])
+        return cls(
+            dict(game, gameDate=game.get("gameDate") or day.get("date"))
+            for day in data.get("gameWeek", [])
+            for game in day.get("games", [])
+        )
+
+    def _is_home(self, position: int, team_id: int) -> bool:
+        return (self.games[position].get("homeTeam") or {}).get("id") == team_id
+
+    def _rest(self, position: int, team_id: int) -> int:
+        if self._is_home(position, team_id):
+            return self.home_rest[position]
+        return self.away_rest[position]
+
+    def _team_id(self, team: Union[int, str]) -> Optional[int]:
+        if isinstance(team, str):
+            return self._abbrevs.get(team.upper())
+        return team
+
+    def _games_at(self, positions: Iterable[int]) -> List[dict]:
+        return [self.games[position] for position in positions]
+
+    def __len__(self) -> int:
+        return len(self.games)
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self.games)
+
+    def __contains__(self, game_id: int) -> bool:
+        return game_id in self._by_id
+
+    def get(self, game_id: int) -> Optional[dict]:
+        """
+        Get a game by ID.
+
+        Args:
+            game_id: The NHL game ID
+
+        Returns:
+            The raw game, or None if it is not in the schedule
+        """
+        position = self._by_id.get(game_id)
+        return self.games[position] if position is not None else None
+
+    def on(self, day: Union[str, date]) -> List[dict]:
+        """
+        Get the games played on a (local) date.
+
+        Args:
+            day: Date or ``YYYY-MM-DD`` string
+
+        Returns:
+            Games on that date, by start time
+        """
+        return self._games_at(self._by_date.get(_date_key(day), ()))
+
+    def for_team(
+        self, team: Union[int, str], home: Optional[bool] = None
+    ) -> List[dict]:
+        """
+        Get a team's games.
+
+        Args:
+            team: Team ID or abbreviation
+            home: True for home games only, False for away games only
+
+        Returns:
+            The team's games, by start time
+        """
+        team_id = self._team_id(team)
+        index = {None: self._by_team, True: self._home, False: self._away}[home]
+        return self._games_at(index.get(team_id, ()))
+
+    def of_type(self, game_type: int) -> List[dict]:
+        """
+        Get games of one type.
+
+        Args:
+            game_type: 1 preseason, 2 regular season, 3 playoffs
+
+        Returns:
+            Games of that type, by start time
+        """
+        return self._games_at(self._by_type.get(game_type, ()))
+
+    def rest_days(self, game_id: int, team: Union[int, str]) -> Optional[int]:
+        """
+        Get a team's days of rest before a game.
+
+        Args:
+            game_id: The NHL game ID
+            team: Team ID or abbreviation playing in the game
+
+        Returns:
+            Days since the team's previous game (1 is a back-to-back), or
+            None for its first game or if it does not play in the game
+        """
+        position = self._by_id.get(game_id)
+        team_id = self._team_id(team)
+        if position is None:
+            return None
+        game = self.games[position]
+        teams = (
+            (game.get("homeTeam") or {}).get("id"),
+            (game.get("awayTeam") or {}).get("id"),
+        )
+        if team_id not in teams:
+            return None
+        rest = self._rest(position, team_id)
+        return rest if rest >= 0 else None
+
+    def back_to_backs(self, team: Union[int, str]) -> List[dict]:
+        """
+        Get the second games of a team's back-to-backs.
+
+        Args:
+            team: Team ID or abbreviation
+
+        Returns:
+            Games played the day after the team's previous game
+        """
+        team_id = self._team_id(team)
+        return [
+            self.games[position]
+            for position in self._by_team.get(team_id, ())
+            if self._rest(position, team_id) == 1
+        ]
+
+    def completed(self) -> List[dict]:
+        """Get games that were final when the schedule was indexed."""
+        return self._games_at(self._completed)
+
+    def upcoming(self, now: Optional[datetime] = None) -> List[dict]:
+        """
+        Get games starting after a time.
+
+        Args:
+            now: Aware or naive-UTC datetime; defaults to the current time
+
+        Returns:
+            Games starting after ``now``, by start time
+        """
+        now = now or datetime.now(timezone.utc)
+        if now.tzinfo is not None:
+            now = now.astimezone(timezone.utc)
+        key = now.strftime("%Y-%m-%dT%H:%M:%SZ")
+        return self.games[bisect_right(self._start_times, key) :]
@@ -109,6 +109,7 @@ class Shift(BaseNHLModel):
         """
         return cls(
             player_id=data.get("playerId"),
+            team_id=data.get("teamId"),
             shift_start=data.get("startTime"),
             shift_end=data.get("endTime"),
             duration=data.get("duration"),
@@ -120,6 +121,11 @@ class Shift(BaseNHLModel):
         """Return the player ID."""
         return self._data.get("player_id")
 
+    @property
+    def team_id(self) -> int:
+        """Return the team ID."""
+        return self._data.get("team_id")
+
     @property
     def shift_start(self) -> str:
         """Return the shift start time."""
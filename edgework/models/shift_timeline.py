@@ -0,0 +1,304 @@
+"""Per-game shift timeline with an interval index over game seconds."""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+from edgework.models.play import PERIOD_SECONDS, clock_to_seconds
+
+# ``typeCode`` of shift rows in the shift chart; goal rows use 505.
+SHIFT_TYPE_CODE = 517
+
+_EMPTY: FrozenSet[int] = frozenset()
+
+
+def game_seconds(period: Optional[int], clock: Optional[str]) -> Optional[int]:
+    """
+    Convert a period number and ``MM:SS`` period clock to game seconds.
+
+    Args:
+        period: Period number, 1-based
+        clock: Elapsed time in the period as ``MM:SS``
+
+    Returns:
+        Seconds since the start of the game, or None if either part is missing
+    """
+    seconds = clock_to_seconds(clock)
+    if not period or seconds is None:
+        return None
+    return (period - 1) * PERIOD_SECONDS + seconds
+
+
+def _merge(intervals: List[Tuple[int, int]]) -> Tuple[array, array]:
+    """Sort intervals and merge the ones that overlap or touch."""
+    starts, ends = array("i"), array("i")
+    for start, end in sorted(intervals):
+        if ends and start <= ends[-1]:
+            ends[-1] = max(ends[-1], end)
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+class ShiftTimeline:
+    """All shifts of a game as integer game-second intervals.
+
+    Shifts are parsed once into per-player interval arrays. The timeline is
+    cut at every shift start and end into segments with a fixed set of players
+    on ice, so ``on_ice(t)`` is a binary search over the segment boundaries.
+
+    A shift covers ``start <= t < end``. Events that end the shifts running
+    when they happen (goals, period and game ends) are better matched with
+    ``include_end=True``, which uses ``start < t <= end`` instead.
+
+    Example:
+        >>> timeline = client.games.get_shift_timeline(2023020001)
+        >>> timeline.on_ice(1530, team_id=7)
+        frozenset({8478403, 8479420, ...})
+        >>> timeline.overlap(8478403, 8479420)
+        812
+    """
+
+    def __init__(self, shifts: Iterable[Tuple[int, int, int, int]]):
+        """
+        Initialize the timeline.
+
+        Args:
+            shifts: ``(player_id, team_id, start, end)`` tuples in game seconds;
+                empty or negative shifts are ignored
+        """
+        intervals: Dict[int, List[Tuple[int, int]]] = {}
+        self.teams: Dict[int, int] = {}
+        for player_id, team_id, start, end in shifts:
+            if end <= start:
+                continue
+            intervals.setdefault(player_id, []).append((start, end))
+            self.teams[player_id] = team_id
+        self._shifts: Dict[int, Tuple[array, array]] = {
+            player_id: _merge(player_intervals)
+            for player_id, player_intervals in intervals.items()
+        }
+        # Time on ice before each shift, so partial sums need no walk.
+        self._toi: Dict[int, array] = {}
+        for player_id, (starts, ends) in self._shifts.items():
+            toi = self._toi[player_id] = array("i", [0])
+            for start, end in zip(starts, ends):
+                toi.append(toi[-1] + end - start)
+        self._build_segments()
+
+    @classmethod
+    def from_api(cls, data: List[dict]) -> "ShiftTimeline":
+        """
+        Build a timeline from the shift chart ``data`` rows.
+
+        Args:
+            data: Rows of the ``shiftcharts`` response
+
+        Returns:
+            ShiftTimeline: The game's shifts
+        """
+
+        def shifts():
+            for row in data:
+                type_code = row.get("typeCode")
+                if type_code is not None and type_code != SHIFT_TYPE_CODE:
+                    continue
+                player_id = row.get("playerId")
+                period = row.get("period")
+                start = game_seconds(period, row.get("startTime"))
+                end = game_seconds(period, row.get("endTime"))
+                if player_id is None or start is None or end is None:
+                    continue
+                yield player_id, row.get("teamId"), start, end
+
+        return cls(shifts())
+
+    def _build_segments(self) -> None:
+        """Sweep shift starts and ends into on-ice segments."""
+        changes: Dict[int, List[Tuple[int, int]]] = {}
+        for player_id, (starts, ends) in self._shifts.items():
+            for start, end in zip(starts, ends):
+                changes.setdefault(start, []).append((player_id, 1))
+                changes.setdefault(end, []).append((player_id, -1))
+
+        self._boundaries = array("i", sorted(changes))
+        self._segments: List[FrozenSet[int]] = []
+        on_ice = set()
+        for boundary in self._boundaries:
+            for player_id, delta in changes[boundary]:
+                if delta > 0:
+                    on_ice.add(player_id)
+                else:
+                    on_ice.discard(player_id)
+            self._segments.append(frozenset(on_ice))
+
+    def __len__(self) -> int:
+        """Number of merged shifts in the game."""
+        return sum(len(starts) for starts, _ in self._shifts.values())
+
+    @property
+    def player_ids(self) -> List[int]:
+        """IDs of every player with at least one shift."""
+        return list(self._shifts)
+
+    def shifts_of(self, player_id: int) -> List[Tuple[int, int]]:
+        """
+        Get a player's shifts, merged and in order.
+
+        Args:
+            player_id: The player ID
+
+        Returns:
+            ``(start, end)`` game-second pairs
+        """
+        starts, ends = self._shifts.get(player_id, ((), ()))
+        return list(zip(starts, ends))
+
+    def segment(self, t: int, include_end: bool = False) -> int:
+        """
+        Find the segment containing game second ``t``.
+
+        Args:
+            t: Game seconds
+            include_end: Match shifts as ``start < t <= end``
+
+        Returns:
+            Segment position, or -1 before the first shift
+        """
+        if include_end:
+            return bisect_left(self._boundaries, t) - 1
+        return bisect_right(self._boundaries, t) - 1
+
+    def sweep(self, times: Iterable[Tuple[Optional[int], bool]]) -> Iterator[int]:
+        """
+        Find the segments of many game seconds in one pass.
+
+        Sorted input is matched by walking the segment boundaries once, so a
+        whole game of events costs O(events + shifts); a time earlier than its
+        predecessor falls back to a binary search.
+
+        Args:
+            times: ``(t, include_end)`` pairs, ideally in game order; a None
+                time yields -1
+
+        Yields:
+            Segment position for each time, -1 if no shift covers it
+        """
+        boundaries = self._boundaries
+        count = len(boundaries)
+        position = -1
+        previous = None
+        for t, include_end in times:
+            if t is None:
+                yield -1
+                continue
+            if previous is not None and t < previous:
+                position = bisect_right(boundaries, t) - 1
+            previous = t
+            while position + 1 < count and boundaries[position + 1] <= t:
+                position += 1
+            if include_end and position >= 0 and boundaries[position] == t:
+                yield position - 1
+            else:
+                yield position
+
+    def players_at(
+        self, position: int, team_id: Optional[int] = None
+    ) -> FrozenSet[int]:
+        """
+        Get the players on ice in a segment.
+
+        Args:
+            position: Segment position from ``segment`` or ``sweep``
+            team_id: Only return players of this team
+
+        Returns:
+            IDs of the players on ice
+        """
+        players = self._segments[position] if position >= 0 else _EMPTY
+        if team_id is None:
+            return players
+        return frozenset(p for p in players if self.teams.get(p) == team_id)
+
+    def on_ice(
+        self, t: int, team_id: Optional[int] = None, include_end: bool = False
+    ) -> FrozenSet[int]:
+        """
+        Get the players on ice at a game second.
+
+        Args:
+            t: Game seconds
+            team_id: Only return players of this team
+            include_end: Match shifts as ``start < t <= end``
+
+        Returns:
+            IDs of the players on ice
+        """
+        return self.players_at(self.segment(t, include_end), team_id)
+
+    def is_on_ice(self, player_id: int, t: int, include_end: bool = False) -> bool:
+        """
+        Check whether a player is on ice at a game second.
+
+        Args:
+            player_id: The player ID
+            t: Game seconds
+            include_end: Match shifts as ``start < t <= end``
+
+        Returns:
+            True if one of the player's shifts covers ``t``
+        """
+        starts, ends = self._shifts.get(player_id, ((), ()))
+        if include_end:
+            position = bisect_left(starts, t) - 1
+            return position >= 0 and t <= ends[position]
+        position = bisect_right(starts, t) - 1
+        return position >= 0 and t < ends[position]
+
+    def time_on_ice(self, player_id: int) -> int:
+        """
+        Get a player's total time on ice.
+
+        Args:
+            player_id: The player ID
+
+        Returns:
+            Seconds on ice
+        """
+        toi = self._toi.get(player_id)
+        return toi[-1] if toi else 0
+
+    def _toi_before(self, player_id: int, t: int) -> int:
+        """A player's time on ice before game second ``t``, by binary search."""
+        starts, ends = self._shifts[player_id]
+        position = bisect_right(starts, t)
+        total = self._toi[player_id][position]
+        if position and ends[position - 1] > t:
+            total -= ends[position - 1] - t
+        return total
+
+    def overlap(self, player_a: int, player_b: int) -> int:
+        """
+        Get the time two players spent on ice together.
+
+        Each shift of the player with fewer shifts is measured against the
+        other's cumulative time on ice, so the cost is O(k log n) for k and n
+        shifts.
+
+        Args:
+            player_a: First player ID
+            player_b: Second player ID
+
+        Returns:
+            Seconds both players were on ice
+        """
+        if player_a not in self._shifts or player_b not in self._shifts:
+            return 0
+        if len(self._shifts[player_a][0]) > len(self._shifts[player_b][0]):
+            player_a, player_b = player_b, player_a
+        starts, ends = self._shifts[player_a]
+        return sum(
+            self._toi_before(player_b, end) - self._toi_before(player_b, start)
+            for start, end in zip(starts, ends)
+        )
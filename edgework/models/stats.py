@@ -3,7 +3,7 @@ from datetime import datetime
 from urllib.parse import urlencode
 
 from edgework.models.base import BaseNHLModel
-from edgework.utilities import dict_camel_to_snake
+from edgework.utilities import rows_camel_to_snake
 
 # Development imports
 
@@ -202,6 +202,10 @@ class SkaterStats(BaseNHLModel):
         """
         Fetch the data for the skater stats.
 
+        The whole report is loaded into ``players`` at once (one ``limit=-1``
+        request by default). For large game-level reports, stream the rows
+        page by page with ``StatsClient.iter_report("skater", ...)``.
+
         Args:
             report: The type of report to get (e.g. "summary", "bios", etc.)
             season: The season to get stats for (e.g. 20232024)
@@ -287,8 +291,8 @@ class SkaterStats(BaseNHLModel):
         if data:
             self._data = data
             self.players = [
-                StatEntity(self._client, data=dict_camel_to_snake(player))
-                for player in data
+                StatEntity(self._client, data=player)
+                for player in rows_camel_to_snake(data)
             ]
 
 
@@ -320,6 +324,10 @@ class GoalieStats(BaseNHLModel):
         """
         Fetch the data for the goalie stats.
 
+        The whole report is loaded into ``players`` at once (one ``limit=-1``
+        request by default). For large game-level reports, stream the rows
+        page by page with ``StatsClient.iter_report("goalie", ...)``.
+
         Args:
             report: The type of report to get (e.g. "summary", "advanced", etc.)
             season: The season to get stats for (e.g. 20232024)
@@ -393,8 +401,8 @@ class GoalieStats(BaseNHLModel):
         if data:
             self._data = data
             self.players = [
-                StatEntity(self._client, data=dict_camel_to_snake(player))
-                for player in data
+                StatEntity(self._client, data=player)
+                for player in rows_camel_to_snake(data)
             ]
 
 
@@ -424,6 +432,10 @@ class TeamStats(BaseNHLModel):
         """
         Fetch the data for the team stats.
 
+        The whole report is loaded into ``teams`` at once (one ``limit=-1``
+        request by default). For large game-level reports, stream the rows
+        page by page with ``StatsClient.iter_report("team", ...)``.
+
         Args:
             report: The type of report to get (e.g. "summary", "faceoffpercentages", etc.)
             season: The season to get stats for (e.g. 20232024)
@@ -500,6 +512,6 @@ class TeamStats(BaseNHLModel):
             raise KeyError("Missing 'data' key in API response")
 
         if data:
-            data = [dict_camel_to_snake(d) for d in data]
+            data = rows_camel_to_snake(data)
             self.teams = [StatEntity(self._client, data=team) for team in data]
             self._data = data
@@ -3,6 +3,7 @@ from typing import List, Optional, Union
 
 from edgework.models.base import BaseNHLModel
 from edgework.models.player import Player
+from edgework.utilities import PayloadFlattener
 
 
 def roster_api_to_dict(data: dict) -> dict:
@@ -22,6 +23,11 @@ def roster_api_to_dict(data: dict) -> dict:
     }
 
 
+_TEAM_FLATTENER = PayloadFlattener(
+    prefixed={"franchise": "franchise", "venue": "venue"}
+)
+
+
 def team_api_to_dict(data: dict) -> dict:
     """
     Convert team API response data to team dictionary format with snake_case keys.
@@ -36,84 +42,7 @@ def team_api_to_dict(data: dict) -> dict:
     Returns:
         Dictionary with snake_case field names and processed values
     """
-
-    def camel_to_snake(name: str) -> str:
-        """Convert camelCase to snake_case."""
-        import re
-
-        # Insert underscores before uppercase letters (except at start)
-        s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-        # Insert underscores between lowercase/digit and uppercase
-        return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
-
-    def process_value(value):
-        """Process a value, handling nested dictionaries and special cases."""
-        if value is None:
-            return None
-
-        # Handle nested dictionaries
-        if isinstance(value, dict):
-            # If it has a 'default' key, extract that value
-            if "default" in value:
-                return value["default"]
-            # Otherwise, recursively process the nested dictionary
-            return {camel_to_snake(k): process_value(v) for k, v in value.items()}
-
-        # Handle lists
-        elif isinstance(value, list):
-            return [process_value(item) for item in value]
-
-        # Handle date strings
-        elif isinstance(value, str):
-            # Try to parse common date formats
-            from datetime import datetime
-
-            date_formats = ["%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M:%SZ"]
-            for fmt in date_formats:
-                try:
-                    return datetime.strptime(value, fmt)
-                except ValueError:
-                    continue
-            # If not a date, return as-is
-            return value
-
-        # Return primitive types as-is
-        else:
-            return value
-
-    def flatten_nested_objects(data: dict, result: dict, parent_key: str = "") -> None:
-        """Flatten nested objects with special handling for known team structures."""
-        for key, value in data.items():
-            snake_key = camel_to_snake(key)
-
-            # Special handling for franchise details
-            if key == "franchise" and isinstance(value, dict):
-                for franchise_key, franchise_value in value.items():
-                    franchise_snake_key = f"franchise_{camel_to_snake(franchise_key)}"
-                    result[franchise_snake_key] = process_value(franchise_value)
-
-            # Special handling for venue details
-            elif key == "venue" and isinstance(value, dict):
-                for venue_key, venue_value in value.items():
-                    venue_snake_key = f"venue_{camel_to_snake(venue_key)}"
-                    result[venue_snake_key] = process_value(venue_value)
-
-            # For other nested objects, process normally
-            elif isinstance(value, dict) and "default" not in value:
-                # If it's a complex nested object, flatten it with prefix
-                if parent_key:
-                    new_key = f"{parent_key}_{snake_key}"
-                else:
-                    new_key = snake_key
-                flatten_nested_objects(value, result, new_key)
-
-            else:
-                # Process the value (will handle 'default' extraction)
-                final_key = f"{parent_key}_{snake_key}" if parent_key else snake_key
-                result[final_key] = process_value(value)
-
-    result = {}
-    flatten_nested_objects(data, result)
+    result = _TEAM_FLATTENER.flatten(data)
 
     # Ensure we have standard team fields with fallbacks
     result["team_id"] = result.get("team_id") or result.get("id")
@@ -0,0 +1,234 @@
+"""Client-side rate limiting and retry policies for the NHL API HTTP clients."""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, Optional
+
+import httpx
+
+# Hosts the NHL API clients talk to.
+NHL_HOSTS = ("api-web.nhle.com", "api.nhle.com", "search.d3.nhle.com")
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``. Callers
+    reserve a token and are told how long to wait for it, so the same bucket
+    serves both blocking and asyncio callers.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """
+        Initialize the bucket, full.
+
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity; defaults to ``max(1, rate)``
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token, possibly on credit.
+
+        Returns:
+            Seconds the caller must wait before sending its request
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class RateLimiter:
+    """Global and per-host request rate limits.
+
+    A request waits for a token from the global bucket (if any) and from the
+    bucket of its host (if any). ``Retry-After`` responses pause a host
+    entirely until the given time.
+
+    Example:
+        >>> limiter = RateLimiter(rate=20, per_host={"api-web.nhle.com": 10})
+        >>> client = Edgework(rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        per_host: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Global requests per second across all hosts, or None for no
+                global limit
+            burst: Burst size of the global bucket; defaults to ``rate``
+            per_host: Requests per second keyed by host name, e.g.
+                ``{"api-web.nhle.com": 10, "api.nhle.com": 5}``
+        """
+        self._global = TokenBucket(rate, burst) if rate else None
+        self._hosts = {
+            host: TokenBucket(host_rate) for host, host_rate in (per_host or {}).items()
+        }
+        self._paused_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_nhl_host(cls, rate: float, hosts: Iterable[str] = NHL_HOSTS):
+        """
+        Build a limiter with the same rate for each NHL API host.
+
+        Args:
+            rate: Requests per second allowed on each host
+            hosts: Host names to limit
+
+        Returns:
+            A RateLimiter with one bucket per host
+        """
+        return cls(per_host={host: rate for host in hosts})
+
+    def reserve(self, host: str) -> float:
+        """
+        Reserve a request slot for a host.
+
+        Args:
+            host: Host name of the request URL
+
+        Returns:
+            Seconds the caller must wait before sending its request
+        """
+        wait = 0.0
+        if self._global is not None:
+            wait = self._global.reserve()
+        bucket = self._hosts.get(host)
+        if bucket is not None:
+            wait = max(wait, bucket.reserve())
+        with self._lock:
+            paused_until = self._paused_until.get(host, 0.0)
+        return max(wait, paused_until - time.monotonic())
+
+    def pause(self, host: str, seconds: float) -> None:
+        """
+        Hold every request to a host for a while, e.g. after ``Retry-After``.
+
+        Args:
+            host: Host name to pause
+            seconds: How long to hold requests
+        """
+        until = time.monotonic() + seconds
+        with self._lock:
+            self._paused_until[host] = max(self._paused_until.get(host, 0.0), until)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if the header is missing or malformed
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """Retries for idempotent GETs with jittered exponential backoff.
+
+    Retries transport errors and responses whose status is in
+    ``retry_statuses``. A ``Retry-After`` header takes precedence over the
+    computed backoff.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        retry_statuses: Iterable[int] = (429, 500, 502, 503, 504),
+        jitter: bool = True,
+    ):
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_retries: Retries after the first attempt
+            backoff: Base delay in seconds, doubled on each retry
+            max_backoff: Upper bound for the computed delay
+            retry_statuses: HTTP status codes worth retrying
+            jitter: If True, randomize each delay within its upper half
+        """
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.jitter = jitter
+
+    def should_retry(
+        self, attempt: int, response: Optional[httpx.Response] = None
+    ) -> bool:
+        """
+        Whether a failed attempt should be retried.
+
+        Args:
+            attempt: Zero-based number of the attempt that failed
+            response: The response, or None for a transport error
+
+        Returns:
+            True if another attempt should be made
+        """
+        if attempt >= self.max_retries:
+            return False
+        return response is None or response.status_code in self.retry_statuses
+
+    def delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """
+        Seconds to wait before the next attempt.
+
+        Args:
+            attempt: Zero-based number of the attempt that failed
+            response: The response, or None for a transport error
+
+        Returns:
+            The ``Retry-After`` delay if the server sent one, otherwise the
+            jittered exponential backoff
+        """
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after
+        delay = min(self.max_backoff, self.backoff * 2**attempt)
+        if self.jitter:
+            delay = delay / 2 + random.uniform(0, delay / 2)
+        return delay
@@ -1,9 +1,17 @@
 import re
+from datetime import datetime
+from functools import lru_cache
 
+_FIRST_CAP_RE = re.compile("(.)([A-Z][a-z]+)")
+_ALL_CAP_RE = re.compile("([a-z0-9])([A-Z])")
 
+
+@lru_cache(maxsize=4096)
 def camel_to_snake(name):
-    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+    # API responses reuse a small set of keys, so conversions are memoized;
+    # the cache is bounded to keep memory flat on unexpected key sets.
+    s1 = _FIRST_CAP_RE.sub(r"\1_\2", name)
+    return _ALL_CAP_RE.sub(r"\1_\2", s1).lower()
 
 
 def dict_camel_to_snake(data):
@@ -19,3 +27,148 @@ def dict_camel_to_snake(data):
         return [dict_camel_to_snake(item) for item in data]
     else:
         return data
+
+
+def rows_camel_to_snake(rows):
+    """Convert a list of records with the same keys to snake_case keys.
+
+    Equivalent to ``[dict_camel_to_snake(row) for row in rows]``, but the key
+    translation is computed once per distinct key layout rather than once per
+    key of every row, which matters for report endpoints returning thousands
+    of homogeneous rows.
+    """
+    converted = []
+    layout = None
+    snake_keys = None
+    for row in rows:
+        if not isinstance(row, dict):
+            converted.append(dict_camel_to_snake(row))
+            continue
+        keys = tuple(row)
+        if keys != layout:
+            layout = keys
+            snake_keys = [camel_to_snake(k) for k in keys]
+        converted.append(
+            {
+                snake: (dict_camel_to_snake(v) if isinstance(v, (dict, list)) else v)
+                for snake, v in zip(snake_keys, row.values())
+            }
+        )
+    return converted
+
+
+def _looks_like_date(value):
+    # Cheap shape check for YYYY-MM-DD, YYYY-MM-DDTHH:MM:SS and the same with a
+    # trailing Z, so names, URLs and abbreviations never reach a parser.
+    length = len(value)
+    if length == 10:
+        pass
+    elif length == 19 or (length == 20 and value[19] == "Z"):
+        if value[10] != "T" or value[13] != ":" or value[16] != ":":
+            return False
+    else:
+        return False
+    return value[4] == "-" and value[7] == "-" and value[:4].isdigit()
+
+
+def parse_date_string(value):
+    """Parse an API date/datetime string, returning other strings unchanged.
+
+    Recognizes ``YYYY-MM-DD``, ``YYYY-MM-DDTHH:MM:SS`` and
+    ``YYYY-MM-DDTHH:MM:SSZ``; results are naive ``datetime`` objects.
+    """
+    if not _looks_like_date(value):
+        return value
+    try:
+        return datetime.fromisoformat(value[:19])
+    except ValueError:
+        return value
+
+
+def flatten_value(value):
+    """Normalize a payload value.
+
+    Localized ``{"default": ...}`` objects collapse to their default, nested
+    dicts get snake_case keys, lists are processed item by item and date
+    strings become ``datetime`` objects.
+    """
+    if value is None:
+        return None
+    if isinstance(value, dict):
+        if "default" in value:
+            return value["default"]
+        return {camel_to_snake(k): flatten_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [flatten_value(item) for item in value]
+    if isinstance(value, str):
+        return parse_date_string(value)
+    return value
+
+
+class PayloadFlattener:
+    """Flattens nested camelCase API payloads into one snake_case dict.
+
+    Nested objects are flattened with their parent's key as a prefix
+    (``{"birthCity": {"default": "Richmond Hill"}}`` stays ``birth_city``,
+    ``{"careerTotals": {"regularSeason": {...}}}`` becomes
+    ``career_totals_regular_season_*``). Keys listed in ``prefixed`` flatten
+    their children under a fixed prefix instead, and ``transforms`` override
+    the value processing for individual flattened keys.
+
+    Flattened key names are memoized per (parent, key) pair, so converting
+    many payloads of the same shape does no string work after the first.
+    Build one instance per payload type at module level and reuse it.
+    """
+
+    _MAX_KEYS = 8192
+
+    def __init__(self, prefixed=None, transforms=None):
+        """
+        Initialize the flattener.
+
+        Args:
+            prefixed: API key -> prefix for its children, e.g.
+                ``{"draftDetails": "draft"}``
+            transforms: Flattened key -> callable applied to the raw value in
+                place of ``flatten_value``, e.g. ``{"draft_year": ...}``
+        """
+        self.prefixed = dict(prefixed or {})
+        self.transforms = dict(transforms or {})
+        self._keys = {}
+
+    def flatten(self, data):
+        """
+        Flatten a payload.
+
+        Args:
+            data: Raw API response dictionary
+
+        Returns:
+            Dictionary with snake_case field names and processed values
+        """
+        result = {}
+        self._flatten(data, result, "")
+        return result
+
+    def _key(self, parent, key):
+        try:
+            return self._keys[parent, key]
+        except KeyError:
+            snake = camel_to_snake(key)
+            flat_key = f"{parent}_{snake}" if parent else snake
+            if len(self._keys) < self._MAX_KEYS:
+                self._keys[parent, key] = flat_key
+            return flat_key
+
+    def _flatten(self, data, result, parent):
+        for key, value in data.items():
+            prefix = self.prefixed.get(key)
+            if prefix is not None and isinstance(value, dict):
+                for sub_key, sub_value in value.items():
+                    flat_key = self._key(prefix, sub_key)
+                    transform = self.transforms.get(flat_key, flatten_value)
+                    result[flat_key] = transform(sub_value)
+            elif isinstance(value, dict) and "default" not in value:
+                self._flatten(value, result, self._key(parent, key))
+            else:
+                result[self._key(parent, key)] = flatten_value(value)
@@ -0,0 +1,136 @@
+"""Tests for the SQLite final-game archive."""
+
+from datetime import datetime
+
+import httpx
+import pytest
+
+from edgework.archive import GameArchive, archive_target, season_is_over
+from edgework.http_client import HttpClient
+
+BOXSCORE_URL = "https://api-web.nhle.com/v1/gamecenter/2023020001/boxscore"
+PBP_URL = "https://api-web.nhle.com/v1/gamecenter/2023020001/play-by-play"
+SHIFTS_URL = (
+    "https://api.nhle.com/stats/rest/en/shiftcharts?cayenneExp=gameId%3D2023020001"
+)
+
+
+def _response(url, content):
+    return httpx.Response(200, content=content, request=httpx.Request("GET", url))
+
+
+class TestArchiveTarget:
+    """Test class for archive_target."""
+
+    @pytest.mark.parametrize(
+        "url,target",
+        [
+            (BOXSCORE_URL, (2023020001, "boxscore")),
+            (PBP_URL, (2023020001, "play-by-play")),
+            (SHIFTS_URL, (2023020001, "shiftcharts")),
+            ("https://api-web.nhle.com/v1/gamecenter/2023020001/landing", None),
+            ("https://api.nhle.com/stats/rest/en/shiftcharts", None),
+            ("https://api-web.nhle.com/v1/score/now", None),
+        ],
+    )
+    def test_targets(self, url, target):
+        """Test that only final-game payload URLs are archivable."""
+        assert archive_target(url) == target
+
+
+class TestSeasonIsOver:
+    """Test class for season_is_over."""
+
+    def test_boundaries(self):
+        """Test that a season ends on 1 September of its second year."""
+        assert not season_is_over(2023020001, now=datetime(2024, 6, 30))
+        assert not season_is_over(2023020001, now=datetime(2024, 8, 31))
+        assert season_is_over(2023020001, now=datetime(2024, 9, 1))
+
+
+class TestGameArchive:
+    """Test class for GameArchive."""
+
+    def test_final_boxscore_archived(self):
+        """Test that final payloads are stored and replayed."""
+        archive = GameArchive(":memory:")
+        archive.store(BOXSCORE_URL, _response(BOXSCORE_URL, b'{"gameState":"OFF"}'))
+
+        response = archive.lookup(BOXSCORE_URL)
+
+        assert response.json() == {"gameState": "OFF"}
+        assert archive.hits == 1
+        assert archive.is_final(2023020001)
+
+    def test_live_payload_not_archived(self):
+        """Test that in-progress games are not archived."""
+        archive = GameArchive(":memory:")
+        archive.store(PBP_URL, _response(PBP_URL, b'{"gameState":"LIVE"}'))
+
+        assert archive.lookup(PBP_URL) is None
+        assert not archive.is_final(2023020001)
+
+    def test_shifts_require_final_game(self):
+        """Test that shift charts are archived once the game is final."""
+        archive = GameArchive(":memory:")
+        url = SHIFTS_URL.replace("2023020001", "2999020001")
+        shifts = _response(url, b'{"data":[{"id":1}],"total":1}')
+
+        archive.store(url, shifts)
+        assert archive.lookup(url) is None
+
+        archive.put(2999020001, "boxscore", b'{"gameState":"OFF"}')
+        archive.store(url, shifts)
+
+        assert archive.lookup(url).json()["total"] == 1
+
+    def test_shifts_archived_after_season(self):
+        """Test that shift charts from a finished season are archived."""
+        archive = GameArchive(":memory:")
+        archive.store(
+            SHIFTS_URL, _response(SHIFTS_URL, b'{"data":[{"id":1}],"total":1}')
+        )
+
+        assert archive.lookup(SHIFTS_URL) is not None
+
+    def test_empty_shifts_not_archived(self):
+        """Test that empty shift charts are never archived."""
+        archive = GameArchive(":memory:")
+        archive.put(2023020001, "boxscore", b'{"gameState":"OFF"}')
+        archive.store(SHIFTS_URL, _response(SHIFTS_URL, b'{"data":[],"total":0}'))
+
+        assert archive.lookup(SHIFTS_URL) is None
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test that archived payloads survive a new connection."""
+        path = str(tmp_path / "games.sqlite3")
+        archive = GameArchive(path)
+        archive.put(2023020001, "play-by-play", b'{"plays":[]}')
+        archive.close()
+
+        assert GameArchive(path).get(2023020001, "play-by-play") == b'{"plays":[]}'
+
+
+class TestHttpClientArchive:
+    """Test class for HttpClient archive integration."""
+
+    def test_archived_game_makes_no_request(self, tmp_path):
+        """Test that a final game is replayed with zero network requests."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={"id": 2023020001, "gameState": "FINAL"})
+
+        path = str(tmp_path / "games.sqlite3")
+        client = HttpClient(archive=GameArchive(path))
+        client._client = httpx.Client(transport=httpx.MockTransport(handler))
+        client.get("gamecenter/2023020001/boxscore", web=True)
+
+        replay = HttpClient(archive=GameArchive(path))
+        replay._client = httpx.Client(transport=httpx.MockTransport(handler))
+        response = replay.get("gamecenter/2023020001/boxscore", web=True)
+
+        assert len(calls) == 1
+        assert response.json()["gameState"] == "FINAL"
+        assert replay.archive.hits == 1
@@ -0,0 +1,279 @@
+"""Tests for the asynchronous HTTP client, sub-clients and AsyncEdgework facade."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from edgework import AsyncEdgework
+from edgework.clients.game_client import AsyncGameClient
+from edgework.clients.player_client import AsyncPlayerClient
+from edgework.clients.schedule_client import AsyncScheduleClient
+from edgework.clients.standings_client import AsyncStandingClient
+from edgework.http_client import AsyncHttpClient
+from edgework.models.game import Game
+from edgework.models.play_by_play import PlayByPlay
+
+
+def _response(payload):
+    """Build a mock response whose json() returns payload."""
+    response = Mock()
+    response.status_code = 200
+    response.json.return_value = payload
+    return response
+
+
+BOXSCORE = {
+    "id": 2023020001,
+    "gameDate": "2023-10-10",
+    "startTimeUTC": "2023-10-10T23:00:00Z",
+    "gameState": "OFF",
+    "awayTeam": {"id": 1, "abbrev": "NJD", "score": 3},
+    "homeTeam": {"id": 2, "abbrev": "NYR", "score": 4},
+    "season": 20232024,
+    "venue": {"default": "Madison Square Garden"},
+}
+
+
+class TestAsyncHttpClient:
+    """Test class for AsyncHttpClient."""
+
+    def _client_with_transport(self, handler):
+        client = AsyncHttpClient(user_agent="TestAgent/1.0")
+        client._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler),
+            headers={"User-Agent": client._user_agent},
+        )
+        return client
+
+    def test_get_builds_web_url(self):
+        """Test that web requests resolve against the web API base URL."""
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={"ok": True})
+
+        async def run():
+            async with self._client_with_transport(handler) as client:
+                return await client.get("schedule/now", web=True)
+
+        response = asyncio.run(run())
+
+        assert response.json() == {"ok": True}
+        assert str(seen[0].url) == "https://api-web.nhle.com/v1/schedule/now"
+        assert seen[0].headers["User-Agent"] == "TestAgent/1.0"
+
+    def test_get_builds_stats_url(self):
+        """Test that stats requests strip the rest/en prefixes."""
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={"data": []})
+
+        async def run():
+            async with self._client_with_transport(handler) as client:
+                return await client.get("rest/en/team", web=False)
+
+        asyncio.run(run())
+
+        assert str(seen[0].url) == "https://api.nhle.com/stats/rest/en/team"
+
+    def test_get_raises_for_status(self):
+        """Test that HTTP errors are raised like the sync client."""
+
+        def handler(request):
+            return httpx.Response(404, json={})
+
+        async def run():
+            async with self._client_with_transport(handler) as client:
+                await client.get("player/1/landing", web=True)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(run())
+
+
+class TestAsyncGameClient:
+    """Test class for AsyncGameClient."""
+
+    def test_get_game(self):
+        """Test fetching a game boxscore asynchronously."""
+        http = Mock(spec=AsyncHttpClient)
+        http.get = AsyncMock(return_value=_response(BOXSCORE))
+        client = AsyncGameClient(http)
+
+        game = asyncio.run(client.get_game(2023020001))
+
+        assert isinstance(game, Game)
+        assert game._data["game_id"] == 2023020001
+        assert game._data["home_team_abbrev"] == "NYR"
+        http.get.assert_awaited_once_with("gamecenter/2023020001/boxscore", web=True)
+
+    def test_get_play_by_play(self):
+        """Test fetching play-by-play asynchronously."""
+        http = Mock(spec=AsyncHttpClient)
+        http.get = AsyncMock(return_value=_response({"id": 2023020001, "plays": []}))
+        client = AsyncGameClient(http)
+
+        pbp = asyncio.run(client.get_play_by_play(2023020001))
+
+        assert isinstance(pbp, PlayByPlay)
+        http.get.assert_awaited_once_with(
+            "gamecenter/2023020001/play-by-play", web=True
+        )
+
+    def test_get_games_for_date_hydrates_all_boxscores(self):
+        """Test that hydrating requests a boxscore for every scheduled game."""
+        schedule = {
+            "gameWeek": [
+                {"games": [{"id": 2023020001}, {"id": 2023020002}]},
+                {"games": [{"id": 2023020003}]},
+            ]
+        }
+
+        async def fake_get(endpoint, **kwargs):
+            if endpoint.startswith("schedule/"):
+                return _response(schedule)
+            game_id = int(endpoint.split("/")[1])
+            return _response({**BOXSCORE, "id": game_id})
+
+        http = Mock(spec=AsyncHttpClient)
+        http.get = AsyncMock(side_effect=fake_get)
+        client = AsyncGameClient(http)
+
+        games = asyncio.run(client.get_games_for_date("2023-10-10", hydrate=True))
+
+        assert [g._data["game_id"] for g in games] == [
+            2023020001,
+            2023020002,
+            2023020003,
+        ]
+        assert http.get.await_count == 4
+
+
+class TestAsyncScheduleClient:
+    """Test class for AsyncScheduleClient."""
+
+    def test_get_schedule_for_date_invalid(self):
+        """Test that invalid dates raise before any request is made."""
+        http = Mock(spec=AsyncHttpClient)
+        http.get = AsyncMock()
+        client = AsyncScheduleClient(http)
+
+        with pytest.raises(ValueError):
+            asyncio.run(client.get_schedule_for_date("2024/01/01"))
+        http.get.assert_not_awaited()
+
+    def test_get_schedule_for_date_range_follows_pages(self):
+        """Test that the date range walks nextStartDate pages."""
+        pages = {
+            "schedule/2024-01-01": {
+                "nextStartDate": "2024-01-08",
+                "gameWeek": [
+                    {"games": [{"id": 1, "startTimeUTC": "2024-01-02T00:00:00Z"}]}
+                ],
+            },
+            "schedule/2024-01-08": {
+                "gameWeek": [
+                    {"games": [{"id": 2, "startTimeUTC": "2024-01-09T00:00:00Z"}]}
+                ],
+            },
+        }
+
+        async def fake_get(endpoint, **kwargs):
+            return _response(pages[endpoint])
+
+        http = Mock(spec=AsyncHttpClient)
+        http.get = AsyncMock(side_effect=fake_get)
+        client = AsyncScheduleClient(http)
+
+        schedule = asyncio.run(
+            client.get_schedule_for_date_range("2024-01-01", "2024-01-10")
+        )
+
+        assert [g["id"] for g in schedule._data["games"]] == [1, 2]
+
+
+class TestAsyncPlayerClient:
+    """Test class for AsyncPlayerClient."""
+
+    def test_get_player_landing(self):
+        """Test that landing data is converted like the sync client."""
+        http = Mock(spec=AsyncHttpClient)
+        http.get = AsyncMock(
+            return_value=_response(
+                {"firstName": {"default": "Connor"}, "sweaterNumber": 97}
+            )
+        )
+        client = AsyncPlayerClient(http)
+
+        landing = asyncio.run(client.get_player_landing(8478402))
+
+        assert landing["first_name"] == "Connor"
+        assert landing["sweater_number"] == 97
+        assert landing["player_id"] == 8478402
+
+    def test_get_players_streams_results(self):
+        """Test that batch results stream in with per-id failures."""
+
+        async def fake_get(endpoint, **kwargs):
+            if endpoint == "player/2/landing":
+                raise RuntimeError("boom")
+            return _response({"firstName": {"default": "Connor"}})
+
+        http = Mock(spec=AsyncHttpClient)
+        http.get = AsyncMock(side_effect=fake_get)
+        client = AsyncPlayerClient(http)
+
+        async def run():
+            return [r async for r in client.get_players([1, 2, 1, 3], concurrency=2)]
+
+        results = dict(asyncio.run(run()))
+
+        assert set(results) == {1, 2, 3}
+        assert isinstance(results[2], RuntimeError)
+        assert results[3]._data["first_name"] == "Connor"
+        assert http.get.await_count == 3
+
+
+class TestAsyncStandingClient:
+    """Test class for AsyncStandingClient."""
+
+    def test_get_standings_invalid_date(self):
+        """Test that date validation matches the sync client."""
+        client = AsyncStandingClient(Mock(spec=AsyncHttpClient))
+
+        with pytest.raises(ValueError):
+            asyncio.run(client.get_standings("2024-1-1"))
+
+
+class TestAsyncEdgework:
+    """Test class for the AsyncEdgework facade."""
+
+    def test_sub_clients_share_http_client(self):
+        """Test that every sub-client uses the same AsyncHttpClient."""
+
+        async def run():
+            async with AsyncEdgework(user_agent="TestAgent/1.0") as client:
+                return client
+
+        client = asyncio.run(run())
+
+        assert isinstance(client._client, AsyncHttpClient)
+        assert client.games._client is client._client
+        assert client.players.client is client._client
+        assert client.teams.client is client._client
+        assert client.schedule._client is client._client
+        assert client.stats._client is client._client
+
+    def test_get_roster_validates_season(self):
+        """Test that season validation is shared with the sync facade."""
+
+        async def run():
+            async with AsyncEdgework() as client:
+                await client.get_roster("TOR", season="2023")
+
+        with pytest.raises(ValueError):
+            asyncio.run(run())
@@ -0,0 +1,297 @@
+"""Tests for the response cache layer."""
+
+import time
+
+import httpx
+import pytest
+
+from edgework.cache import (
+    FOREVER,
+    CachedResponse,
+    CachePolicy,
+    DiskCache,
+    MemoryCache,
+    cache_key,
+)
+from edgework.http_client import HttpClient
+
+
+def _entry(content=b"{}", ttl=60, url="https://api-web.nhle.com/v1/meta"):
+    return CachedResponse(
+        url=url,
+        status_code=200,
+        headers={"content-type": "application/json"},
+        content=content,
+        expires_at=time.time() + ttl,
+    )
+
+
+class TestCachePolicy:
+    """Test class for CachePolicy."""
+
+    @pytest.mark.parametrize(
+        "url,route",
+        [
+            ("https://api-web.nhle.com/v1/standings/now", "standings"),
+            ("https://api-web.nhle.com/v1/standings/2024-01-01", "standings_date"),
+            ("https://api-web.nhle.com/v1/player/8478402/landing", "player_landing"),
+            ("https://api-web.nhle.com/v1/score/now", "score_now"),
+            ("https://api-web.nhle.com/v1/roster/TOR/current", "roster_current"),
+            ("https://api.nhle.com/stats/rest/en/team", "teams"),
+            (
+                "https://api-web.nhle.com/v1/gamecenter/2023020001/play-by-play",
+                "play_by_play",
+            ),
+            ("https://search.d3.nhle.com/api/v1/search/player", None),
+        ],
+    )
+    def test_route_for(self, url, route):
+        """Test that URLs resolve to their API_PATH route family."""
+        assert CachePolicy().route_for(url) == route
+
+    def test_ttl_for_known_and_unknown_routes(self):
+        """Test per-route TTLs and the default TTL."""
+        policy = CachePolicy(ttls={"score_now": 5}, default_ttl=42)
+
+        assert policy.ttl_for("https://api-web.nhle.com/v1/score/now") == 5
+        assert policy.ttl_for("https://api.nhle.com/stats/rest/en/team") == 6 * 3600
+        assert policy.ttl_for("https://search.d3.nhle.com/api/v1/search/player") == 42
+
+    def test_finished_games_cached_forever(self):
+        """Test that final game centre payloads never expire."""
+        policy = CachePolicy()
+        url = "https://api-web.nhle.com/v1/gamecenter/2023020001/boxscore"
+
+        assert policy.ttl_for(url, b'{"id":1,"gameState":"OFF"}') == FOREVER
+        assert policy.ttl_for(url, b'{"id":1,"gameState":"FINAL"}') == FOREVER
+        assert policy.ttl_for(url, b'{"id":1,"gameState":"LIVE"}') == 10
+
+
+class TestCacheKey:
+    """Test class for cache_key."""
+
+    def test_merges_params(self):
+        """Test that params are merged into the URL query."""
+        key = cache_key("https://api-web.nhle.com/v1/standings-season", {"seasonId": 1})
+        assert key == "https://api-web.nhle.com/v1/standings-season?seasonId=1"
+
+    def test_keeps_existing_query(self):
+        """Test that an inline query string is preserved."""
+        url = "https://api.nhle.com/stats/rest/en/skater/summary?limit=-1"
+        assert cache_key(url, {}) == url
+
+
+class TestMemoryCache:
+    """Test class for MemoryCache."""
+
+    def test_hit_and_miss_counters(self):
+        """Test that lookups are counted."""
+        cache = MemoryCache()
+        cache.set("a", _entry())
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.stats() == {"hits": 1, "misses": 1, "revalidations": 0}
+
+    def test_expired_entries_are_misses(self):
+        """Test that expired entries are dropped."""
+        cache = MemoryCache()
+        cache.set("a", _entry(ttl=-1))
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction_by_entries(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", _entry())
+        cache.set("b", _entry())
+        cache.get("a")
+        cache.set("c", _entry())
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_eviction_by_bytes(self):
+        """Test that the byte bound is enforced."""
+        cache = MemoryCache(max_bytes=10)
+        cache.set("a", _entry(content=b"x" * 6))
+        cache.set("b", _entry(content=b"y" * 6))
+
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+        assert cache.size == 6
+
+    def test_oversized_entry_not_stored(self):
+        """Test that an entry larger than the byte bound is skipped."""
+        cache = MemoryCache(max_bytes=4)
+        cache.set("a", _entry(content=b"too large"))
+
+        assert len(cache) == 0
+
+
+class TestDiskCache:
+    """Test class for DiskCache."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that entries survive a new cache instance."""
+        DiskCache(str(tmp_path)).set("a", _entry(content=b'{"x": 1}'))
+
+        entry = DiskCache(str(tmp_path)).get("a")
+
+        assert entry is not None
+        assert entry.to_response().json() == {"x": 1}
+
+    def test_forever_round_trip(self, tmp_path):
+        """Test that non-expiring entries are stored and read back."""
+        cache = DiskCache(str(tmp_path))
+        entry = _entry()
+        entry.expires_at = FOREVER
+        cache.set("a", entry)
+
+        assert cache.get("a").expires_at == FOREVER
+
+    def test_clear(self, tmp_path):
+        """Test that clear removes every entry."""
+        cache = DiskCache(str(tmp_path))
+        cache.set("a", _entry())
+        cache.clear()
+
+        assert cache.get("a") is None
+
+
+class TestHttpClientCaching:
+    """Test class for HttpClient cache integration."""
+
+    def _client(self, cache, handler, cache_policy=None):
+        client = HttpClient(cache=cache, cache_policy=cache_policy)
+        client._client = httpx.Client(transport=httpx.MockTransport(handler))
+        return client
+
+    def test_repeated_get_served_from_cache(self):
+        """Test that a second identical GET makes no request."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={"standings": []})
+
+        client = self._client(MemoryCache(), handler)
+
+        first = client.get("standings/now", web=True)
+        second = client.get("standings/now", web=True)
+
+        assert len(calls) == 1
+        assert first.json() == second.json() == {"standings": []}
+        assert client.cache.stats() == {
+            "hits": 1,
+            "misses": 1,
+            "revalidations": 0,
+        }
+
+    def test_different_params_not_shared(self):
+        """Test that params are part of the cache key."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={})
+
+        client = self._client(MemoryCache(), handler)
+
+        client.get("standings-season", web=True, params={"seasonId": 1})
+        client.get("standings-season", web=True, params={"seasonId": 2})
+
+        assert len(calls) == 2
+
+    def test_zero_ttl_not_cached(self):
+        """Test that routes with a zero TTL are always fetched."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={})
+
+        client = self._client(MemoryCache(), handler)
+        client._cache_policy = CachePolicy(ttls={"score_now": 0})
+
+        client.get("score/now", web=True)
+        client.get("score/now", web=True)
+
+        assert len(calls) == 2
+
+    def test_errors_not_cached(self):
+        """Test that failed responses raise and are not stored."""
+
+        def handler(request):
+            return httpx.Response(500, json={})
+
+        cache = MemoryCache()
+        client = self._client(cache, handler)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            client.get("meta", web=True)
+        assert len(cache) == 0
+
+    def test_revalidates_with_etag(self):
+        """Test that expired entries are revalidated and served on 304."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304, headers={"ETag": '"v1"'})
+            return httpx.Response(200, headers={"ETag": '"v1"'}, json={"teams": []})
+
+        cache = MemoryCache()
+        policy = CachePolicy(ttls={"standings": 0})
+        client = self._client(cache, handler, policy)
+
+        first = client.get("standings/now", web=True)
+        second = client.get("standings/now", web=True)
+
+        assert len(calls) == 2
+        assert "If-None-Match" not in calls[0].headers
+        assert calls[1].headers["If-None-Match"] == '"v1"'
+        assert first.json() == second.json() == {"teams": []}
+        assert second.status_code == 200
+        assert cache.revalidations == 1
+
+    def test_revalidates_with_last_modified(self):
+        """Test that Last-Modified is sent back as If-Modified-Since."""
+        stamp = "Wed, 01 Jan 2025 00:00:00 GMT"
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if "If-Modified-Since" in request.headers:
+                return httpx.Response(304)
+            return httpx.Response(200, headers={"Last-Modified": stamp}, json={})
+
+        policy = CachePolicy(ttls={"roster_current": 0})
+        client = self._client(MemoryCache(), handler, policy)
+
+        client.get("roster/TOR/current", web=True)
+        client.get("roster/TOR/current", web=True)
+
+        assert calls[1].headers["If-Modified-Since"] == stamp
+
+    def test_changed_resource_replaces_entry(self):
+        """Test that a 200 on revalidation replaces the cached body."""
+        versions = iter([('"v1"', {"n": 1}), ('"v2"', {"n": 2})])
+
+        def handler(request):
+            etag, body = next(versions)
+            return httpx.Response(200, headers={"ETag": etag}, json=body)
+
+        policy = CachePolicy(ttls={"teams": 0})
+        client = self._client(MemoryCache(), handler, policy)
+
+        client.get("rest/en/team", web=False)
+        second = client.get("rest/en/team", web=False)
+
+        assert second.json() == {"n": 2}
+        assert client.cache.get_stale(
+            "https://api.nhle.com/stats/rest/en/team"
+        ).validators == {"If-None-Match": '"v2"'}
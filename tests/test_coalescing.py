@@ -0,0 +1,191 @@
+"""Tests for coalescing identical in-flight requests."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from edgework.http_client import AsyncHttpClient, HttpClient
+
+
+class TestHttpClientCoalescing:
+    """Test class for single-flight in HttpClient."""
+
+    def _client(self, handler, coalesce=True):
+        client = HttpClient(coalesce=coalesce)
+        client._client = httpx.Client(transport=httpx.MockTransport(handler))
+        return client
+
+    def _blocking_handler(self, calls, release, status=200):
+        def handler(request):
+            calls.append(request)
+            release.wait(timeout=5)
+            return httpx.Response(status, json={"plays": []})
+
+        return handler
+
+    def _run_concurrently(self, client, n, release):
+        with ThreadPoolExecutor(max_workers=n) as pool:
+            futures = [
+                pool.submit(client.get, "gamecenter/1/play-by-play", web=True)
+                for _ in range(n)
+            ]
+            while client.coalesced < n - 1:
+                threading.Event().wait(0.01)
+            release.set()
+            return [f.result() for f in futures]
+
+    def test_concurrent_identical_gets_share_one_request(self):
+        """Test that simultaneous identical GETs make one request."""
+        calls, release = [], threading.Event()
+        client = self._client(self._blocking_handler(calls, release))
+
+        responses = self._run_concurrently(client, 8, release)
+
+        assert len(calls) == 1
+        assert all(r is responses[0] for r in responses)
+        assert client._inflight == {}
+
+    def test_errors_propagate_to_every_waiter(self):
+        """Test that a failed shared request raises in every caller."""
+        calls, release = [], threading.Event()
+        client = self._client(self._blocking_handler(calls, release, status=503))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            self._run_concurrently(client, 4, release)
+        assert len(calls) == 1
+
+    def test_sequential_gets_not_coalesced(self):
+        """Test that finished requests are not reused without a cache."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={})
+
+        client = self._client(handler)
+        client.get("player/1/landing", web=True)
+        client.get("player/1/landing", web=True)
+
+        assert len(calls) == 2
+
+    def test_coalesce_disabled(self):
+        """Test that coalescing can be turned off."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={})
+
+        client = self._client(handler, coalesce=False)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda _: client.get("meta", web=True), range(4)))
+
+        assert len(calls) == 4
+        assert client.coalesced == 0
+
+
+class TestAsyncHttpClientCoalescing:
+    """Test class for single-flight in AsyncHttpClient."""
+
+    def _client(self, handler):
+        client = AsyncHttpClient()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client
+
+    def test_gathered_identical_gets_share_one_request(self):
+        """Test that gathered identical GETs make one request."""
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"plays": []})
+
+        async def run():
+            async with self._client(handler) as client:
+                responses = await asyncio.gather(
+                    *[
+                        client.get("gamecenter/1/play-by-play", web=True)
+                        for _ in range(10)
+                    ],
+                    client.get("gamecenter/2/play-by-play", web=True),
+                )
+                return client, responses
+
+        client, responses = asyncio.run(run())
+
+        assert len(calls) == 2
+        assert all(r is responses[0] for r in responses[:10])
+        assert client.coalesced == 9
+
+    def test_errors_propagate_to_every_waiter(self):
+        """Test that a failed shared request raises in every awaiting task."""
+
+        async def handler(request):
+            await asyncio.sleep(0.01)
+            return httpx.Response(500, json={})
+
+        async def run():
+            async with self._client(handler) as client:
+                return await asyncio.gather(
+                    *[client.get("meta", web=True) for _ in range(3)],
+                    return_exceptions=True,
+                )
+
+        results = asyncio.run(run())
+
+        assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+
+    def test_cancelled_leader_does_not_cancel_followers(self):
+        """Test that followers still get the response when the leader is cancelled."""
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            await asyncio.sleep(0.02)
+            return httpx.Response(200, json={"plays": []})
+
+        async def run():
+            async with self._client(handler) as client:
+                leader = asyncio.ensure_future(client.get("meta", web=True))
+                await asyncio.sleep(0)
+                followers = [
+                    asyncio.ensure_future(client.get("meta", web=True))
+                    for _ in range(2)
+                ]
+                await asyncio.sleep(0.005)
+                leader.cancel()
+                responses = await asyncio.gather(*followers)
+                return leader, responses, client
+
+        leader, responses, client = asyncio.run(run())
+
+        assert leader.cancelled()
+        assert [r.json() for r in responses] == [{"plays": []}] * 2
+        assert len(calls) == 1
+        assert client._inflight == {}
+
+    def test_request_cancelled_when_every_waiter_leaves(self):
+        """Test that a flight nobody awaits any more is cancelled."""
+        started = []
+
+        async def handler(request):
+            started.append(request)
+            await asyncio.sleep(1)
+            return httpx.Response(200, json={})
+
+        async def run():
+            async with self._client(handler) as client:
+                waiter = asyncio.ensure_future(client.get("meta", web=True))
+                await asyncio.sleep(0.005)
+                waiter.cancel()
+                await asyncio.sleep(0)
+                return client
+
+        client = asyncio.run(run())
+
+        assert len(started) == 1
+        assert client._inflight == {}
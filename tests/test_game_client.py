@@ -253,6 +253,46 @@ class TestGameClient:
 
         mock_client.get.assert_called_once_with("partner-game/US/now", web=True)
 
+    def test_get_games_for_date_uses_schedule_only(
+        self, mock_client, mock_schedule_response
+    ):
+        """Test that games are built from the schedule page in one request."""
+        mock_client.get.return_value = mock_schedule_response
+        client = GameClient(mock_client)
+
+        games = client.get_games_for_date("2023-10-10")
+
+        assert len(games) == 1
+        assert isinstance(games[0], Game)
+        assert games[0]._data["game_id"] == 2023020001
+        assert games[0]._data["away_team_abbrev"] == "NJD"
+        assert games[0]._data["game_date"] == datetime(2023, 10, 10)
+        mock_client.get.assert_called_once_with("schedule/2023-10-10", web=True)
+
+    def test_get_games_for_date_hydrate(
+        self, mock_client, mock_schedule_response, mock_game_response
+    ):
+        """Test that hydrate=True fetches the boxscore for each game."""
+        mock_client.get.side_effect = [mock_schedule_response, mock_game_response]
+        client = GameClient(mock_client)
+
+        games = client.get_games_for_date("2023-10-10", hydrate=True, max_workers=4)
+
+        assert len(games) == 1
+        assert games[0]._data["venue"] == "Madison Square Garden"
+        assert mock_client.get.call_count == 2
+        mock_client.get.assert_called_with("gamecenter/2023020001/boxscore", web=True)
+
+    def test_get_current_games_empty_hydrate(self, mock_client):
+        """Test that hydrating an empty schedule makes no boxscore requests."""
+        response = Mock()
+        response.json.return_value = {"gameWeek": [{"date": "2023-07-01", "games": []}]}
+        mock_client.get.return_value = response
+        client = GameClient(mock_client)
+
+        assert client.get_current_games(hydrate=True) == []
+        mock_client.get.assert_called_once_with("schedule/now", web=True)
+
 
 class TestGameClientLiveAPI:
     """Live API tests for GameClient."""
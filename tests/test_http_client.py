@@ -0,0 +1,73 @@
+"""Tests for HttpClient connection options."""
+
+import asyncio
+import importlib.util
+
+import httpx
+import pytest
+
+from edgework import AsyncEdgework, Edgework
+from edgework.http_client import AsyncHttpClient, HttpClient
+
+
+class TestHttpClientOptions:
+    """Test class for connection pool, timeout and HTTP/2 options."""
+
+    def test_defaults_match_httpx(self):
+        """Test that the defaults keep httpx's pool and timeout settings."""
+        client = HttpClient()
+        options = client._transport_options
+
+        assert options["limits"] == httpx.Limits(
+            max_connections=100, max_keepalive_connections=20, keepalive_expiry=5.0
+        )
+        assert client._client.timeout == httpx.Timeout(5.0)
+        assert options["http2"] is False
+
+    def test_pool_and_timeout_options(self):
+        """Test that pool limits and timeouts reach the httpx client."""
+        client = HttpClient(
+            max_connections=8,
+            max_keepalive_connections=8,
+            keepalive_expiry=60,
+            timeout=httpx.Timeout(10.0, connect=2.0),
+        )
+
+        assert client._transport_options["limits"] == httpx.Limits(
+            max_connections=8, max_keepalive_connections=8, keepalive_expiry=60
+        )
+        assert client._client.timeout == httpx.Timeout(10.0, connect=2.0)
+
+    def test_edgework_forwards_options(self):
+        """Test that Edgework passes connection options to its HttpClient."""
+        client = Edgework(max_connections=4, timeout=30)
+
+        assert client._client._transport_options["limits"].max_connections == 4
+        assert client._client._client.timeout == httpx.Timeout(30)
+
+    def test_async_edgework_forwards_options(self):
+        """Test that AsyncEdgework passes connection options through."""
+
+        async def run():
+            async with AsyncEdgework(max_keepalive_connections=2) as client:
+                return client._client
+
+        http = asyncio.run(run())
+
+        assert isinstance(http, AsyncHttpClient)
+        assert http._transport_options["limits"].max_keepalive_connections == 2
+
+    @pytest.mark.skipif(
+        importlib.util.find_spec("h2") is None, reason="h2 is not installed"
+    )
+    def test_http2_enabled(self):
+        """Test that http2=True builds an HTTP/2-capable client."""
+        assert HttpClient(http2=True)._transport_options["http2"] is True
+
+    @pytest.mark.skipif(
+        importlib.util.find_spec("h2") is not None, reason="h2 is installed"
+    )
+    def test_http2_without_h2(self):
+        """Test that requesting HTTP/2 without h2 fails loudly."""
+        with pytest.raises(ImportError):
+            HttpClient(http2=True)
@@ -0,0 +1,91 @@
+"""Tests for the JSON decoding backend."""
+
+import json
+
+import httpx
+import pytest
+
+from edgework import jsonlib
+from edgework.cache import MemoryCache
+from edgework.http_client import AsyncHttpClient, HttpClient
+from edgework.jsonlib import JSONResponse, JSONTransport
+
+
+class TestLoads:
+    """Test class for jsonlib.loads."""
+
+    def test_backend_detected(self):
+        """Test that a known backend was selected."""
+        assert jsonlib.BACKEND in ("orjson", "msgspec", "json")
+
+    def test_matches_stdlib(self):
+        """Test that decoding agrees with the standard library."""
+        doc = b'{"plays": [{"eventId": 1, "xCoord": -42.5, "details": null}]}'
+        assert jsonlib.loads(doc) == json.loads(doc)
+        assert jsonlib.loads(doc.decode()) == json.loads(doc)
+
+    def test_invalid_document(self):
+        """Test that invalid JSON raises JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            jsonlib.loads(b'{"plays": [')
+
+
+class TestJSONResponse:
+    """Test class for JSONResponse and JSONTransport."""
+
+    def test_json_uses_fast_decoder(self):
+        """Test that json() decodes the body."""
+        response = JSONResponse(200, content=b'{"id": 2023020001}')
+        assert response.json() == {"id": 2023020001}
+
+    def test_json_kwargs_fall_back_to_stdlib(self):
+        """Test that decoder options still work."""
+        response = JSONResponse(200, content=b'{"a": 1.5}')
+        assert response.json(parse_float=str) == {"a": "1.5"}
+
+    def test_transport_returns_json_responses(self):
+        """Test that the transport wrapper upgrades responses."""
+        transport = JSONTransport(
+            httpx.MockTransport(lambda request: httpx.Response(200, json={"ok": 1}))
+        )
+        with httpx.Client(transport=transport) as client:
+            response = client.get("https://api-web.nhle.com/v1/meta")
+
+        assert isinstance(response, JSONResponse)
+        assert response.json() == {"ok": 1}
+
+    def test_http_clients_use_json_transport(self):
+        """Test that both HTTP clients decode through the fast backend."""
+        assert isinstance(HttpClient()._client._transport, JSONTransport)
+        assert isinstance(
+            AsyncHttpClient()._client._transport, jsonlib.AsyncJSONTransport
+        )
+
+    def test_environment_proxies_are_mounted(self, monkeypatch):
+        """Test that HTTPS_PROXY still routes requests through a proxy."""
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+        monkeypatch.setenv("NO_PROXY", "localhost")
+
+        for client in (HttpClient(), AsyncHttpClient()):
+            url = httpx.URL("https://api-web.nhle.com/v1/meta")
+            transport = client._client._transport_for_url(url)
+            proxy = transport._transport._pool._proxy_url
+
+            assert isinstance(transport, (JSONTransport, jsonlib.AsyncJSONTransport))
+            assert proxy.host == b"proxy.example"
+            assert (
+                client._client._transport_for_url(
+                    httpx.URL("https://localhost/v1/meta")
+                )
+                is client._client._transport
+            )
+
+    def test_cached_responses_use_fast_decoder(self):
+        """Test that responses rebuilt from the cache are JSONResponses."""
+        client = HttpClient(cache=MemoryCache())
+        client._client = httpx.Client(
+            transport=httpx.MockTransport(lambda r: httpx.Response(200, json={}))
+        )
+        client.get("meta", web=True)
+
+        assert isinstance(client.get("meta", web=True), JSONResponse)
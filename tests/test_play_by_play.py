@@ -117,6 +117,67 @@ class TestPlayFromApi:
         assert play._fetched is True
 
 
+class TestPlayRecord:
+    """Test the compact Play record fields."""
+
+    PLAY = {
+        "eventId": 159,
+        "periodDescriptor": {"number": 2, "periodType": "REG"},
+        "timeInPeriod": "05:43",
+        "typeCode": 505,
+        "typeDescKey": "goal",
+        "details": {
+            "xCoord": 50,
+            "yCoord": -9,
+            "zoneCode": "O",
+            "scoringPlayerId": 8480802,
+            "assist1PlayerId": 8477365,
+            "eventOwnerTeamId": 7,
+            "goalieInNetId": 8474682,
+        },
+    }
+
+    def test_typed_fields(self):
+        """Test that common values are lifted out of the payload."""
+        play = Play.from_api(self.PLAY, MagicMock())
+
+        assert play.event_id == 159
+        assert play.period_number == 2
+        assert play.seconds_elapsed == 20 * 60 + 5 * 60 + 43
+        assert play.type_code == 505
+        assert play.team_id == 7
+        assert play.coordinates == (50, -9)
+        assert play.zone_code == "O"
+        assert play.player_ids == (8480802, 8477365, 8474682)
+
+    def test_slotted(self):
+        """Test that plays carry no instance dict or client reference."""
+        play = Play.from_api(self.PLAY, MagicMock())
+
+        assert not hasattr(play, "__dict__")
+        assert not hasattr(play, "_client")
+
+    def test_data_view(self):
+        """Test that _data still exposes the fields as a dict."""
+        play = Play.from_api(self.PLAY, MagicMock())
+
+        assert play._data["type_desc_key"] == "goal"
+        assert play._data["details"]["scoringPlayerId"] == 8480802
+
+    def test_missing_clock(self):
+        """Test that plays without a clock have no elapsed time."""
+        play = Play.from_api({"eventId": 1, "typeDescKey": "game-end"})
+
+        assert play.seconds_elapsed is None
+        assert play.player_ids == ()
+        assert play.coordinates is None
+
+    def test_unknown_field(self):
+        """Test that unknown keyword fields are rejected."""
+        with pytest.raises(TypeError):
+            Play(edgework_client=MagicMock(), not_a_field=1)
+
+
 class TestPlayProperties:
     """Test Play properties."""
 
@@ -558,6 +619,132 @@ class TestPlayByPlayProperties:
         assert len(player_plays) == 1
 
 
+class TestPlayByPlayIndex:
+    """Test the PlayByPlay query indexes."""
+
+    PLAYS = [
+        {
+            "eventId": 1,
+            "typeDescKey": "shot-on-goal",
+            "periodDescriptor": {"number": 1},
+            "details": {"eventOwnerTeamId": 7, "playerId": 10},
+        },
+        {
+            "eventId": 2,
+            "typeDescKey": "goal",
+            "periodDescriptor": {"number": 1},
+            "details": {
+                "eventOwnerTeamId": 12,
+                "scoringPlayerId": 20,
+                "assist1PlayerId": 10,
+                "playerId": 10,
+            },
+        },
+        {
+            "eventId": 3,
+            "typeDescKey": "missed-shot",
+            "periodDescriptor": {"number": 2},
+            "details": {"eventOwnerTeamId": 7},
+        },
+        {"eventId": 4, "typeDescKey": "period-end", "periodDescriptor": {}},
+    ]
+
+    def test_index_positions(self):
+        """Test that each index maps keys to ascending event positions."""
+        index = PlayByPlay.from_dict(None, {"plays": self.PLAYS}).index
+
+        assert index.players == {10: [0, 1], 20: [1]}
+        assert index.teams == {7: [0, 2], 12: [1]}
+        assert index.periods == {1: [0, 1], 2: [2]}
+        assert index.positions_of_types(("missed-shot", "shot-on-goal")) == [0, 2]
+
+    def test_player_index_covers_every_role(self):
+        """Test that shooters, hitters and penalized players are indexed."""
+        plays = [
+            {
+                "eventId": 1,
+                "typeDescKey": "shot-on-goal",
+                "details": {"shootingPlayerId": 30, "goalieInNetId": 31},
+            },
+            {
+                "eventId": 2,
+                "typeDescKey": "hit",
+                "details": {"hittingPlayerId": 31, "hitteePlayerId": 30},
+            },
+            {
+                "eventId": 3,
+                "typeDescKey": "penalty",
+                "details": {"committedByPlayerId": 30, "drawnByPlayerId": 32},
+            },
+        ]
+        play_by_play = PlayByPlay.from_dict(None, {"plays": plays})
+
+        assert [p.event_id for p in play_by_play.get_plays_by_player(30)] == [
+            1,
+            2,
+            3,
+        ]
+        assert [p.event_id for p in play_by_play.get_plays_by_player(32)] == [3]
+        assert play_by_play.index.players[31] == [0, 1]
+        assert all(
+            30 in play.player_ids for play in play_by_play.get_plays_by_player(30)
+        )
+
+    def test_index_built_once(self):
+        """Test that the index is built lazily and reused."""
+        play_by_play = PlayByPlay.from_dict(None, {"plays": self.PLAYS})
+
+        assert play_by_play._index is None
+        assert play_by_play.index is play_by_play.index
+
+    def test_queries_use_index(self):
+        """Test that queries return plays in game order."""
+        play_by_play = PlayByPlay.from_dict(None, {"plays": self.PLAYS})
+
+        assert [p.event_id for p in play_by_play.shots] == [1, 3]
+        assert [p.event_id for p in play_by_play.get_plays_by_player(10)] == [1, 2]
+        assert [p.event_id for p in play_by_play.get_plays_by_team(7)] == [1, 3]
+        assert play_by_play.get_plays_by_period(5) == []
+        assert play_by_play.penalties == []
+
+
+class TestPlayByPlayLazyPlays:
+    """Test lazy Play materialization."""
+
+    PLAYS = [
+        {"eventId": 1, "typeDescKey": "faceoff"},
+        {"eventId": 2, "typeDescKey": "goal"},
+        {"eventId": 3, "typeDescKey": "hit"},
+        {"eventId": 4, "typeDescKey": "penalty"},
+    ]
+
+    def test_empty_plays_cached(self):
+        """Test that a game without plays is parsed once and gives a list."""
+        play_by_play = PlayByPlay.from_dict(None, {"game_id": 1, "plays": []})
+
+        assert play_by_play.plays == []
+        assert play_by_play.plays is play_by_play.plays
+
+    def test_iter_plays_parses_only_matches(self):
+        """Test that iter_plays builds Play objects for matching events only."""
+        play_by_play = PlayByPlay.from_dict(None, {"plays": self.PLAYS})
+
+        with patch.object(Play, "from_api", wraps=Play.from_api) as from_api:
+            plays = list(play_by_play.iter_plays(("goal", "penalty")))
+            assert [play.event_id for play in play_by_play.iter_plays("goal")] == [2]
+
+        assert [play.event_id for play in plays] == [2, 4]
+        assert from_api.call_count == 2
+
+    def test_parsed_plays_shared_with_list(self):
+        """Test that plays parsed on demand are reused by ``plays``."""
+        play_by_play = PlayByPlay.from_dict(None, {"plays": self.PLAYS})
+        goal = play_by_play.goals[0]
+
+        assert play_by_play.plays[1] is goal
+        assert list(play_by_play.iter_plays()) == play_by_play.plays
+
+
 class TestPlayByPlayStringRepresentations:
     """Test PlayByPlay string representations."""
 
@@ -0,0 +1,157 @@
+"""Tests for the columnar play-by-play view."""
+
+import pytest
+
+from edgework.models.play_by_play import PlayByPlay
+from edgework.models.play_columns import STRENGTH_STATES, TYPE_CODES, PlayColumns
+
+np = pytest.importorskip("numpy")
+
+PLAYS = [
+    {
+        "eventId": 1,
+        "periodDescriptor": {"number": 1},
+        "timeInPeriod": "00:00",
+        "situationCode": "1551",
+        "typeCode": 502,
+        "typeDescKey": "faceoff",
+        "details": {
+            "eventOwnerTeamId": 7,
+            "xCoord": 0,
+            "yCoord": 0,
+            "winningPlayerId": 101,
+            "losingPlayerId": 201,
+        },
+    },
+    {
+        "eventId": 2,
+        "periodDescriptor": {"number": 2},
+        "timeInPeriod": "05:30",
+        "situationCode": "1451",
+        "typeCode": 505,
+        "typeDescKey": "goal",
+        "details": {
+            "eventOwnerTeamId": 7,
+            "xCoord": 80,
+            "yCoord": -5,
+            "scoringPlayerId": 102,
+            "assist1PlayerId": 101,
+            "goalieInNetId": 299,
+        },
+    },
+    {
+        "eventId": 3,
+        "periodDescriptor": {"number": 3},
+        "typeDescKey": "period-end",
+    },
+]
+
+
+class TestPlayColumns:
+    """Test class for PlayColumns."""
+
+    def test_from_api(self):
+        """Test that columns hold typed values with sentinels for gaps."""
+        columns = PlayColumns.from_api(PLAYS, game_id=2023020001)
+
+        assert len(columns) == 3
+        assert columns.game_id.tolist() == [2023020001] * 3
+        assert columns.period.tolist() == [1, 2, 3]
+        assert columns.seconds.tolist() == [0, 1530, -1]
+        assert columns.type_code.tolist() == [502, 505, TYPE_CODES["period-end"]]
+        assert columns.team_id.tolist() == [7, 7, 0]
+        assert columns.situation_code.tolist() == [1551, 1451, -1]
+        assert np.isnan(columns.x_coord[2])
+        assert columns.player_ids[1].tolist() == [102, 101, 299, 0]
+
+    def test_filter(self):
+        """Test that filters combine as vectorized masks."""
+        columns = PlayColumns.from_api(PLAYS)
+
+        assert columns.filter(player_id=101).rows() == [0, 1]
+        assert columns.filter(player_id=101, type_code="goal").rows() == [1]
+        assert columns.filter(team_id=7, period=1).event_id.tolist() == [1]
+        assert len(columns.filter(team_id=99)) == 0
+
+    def test_concat_and_counts(self):
+        """Test that games stack into one set of columns."""
+        games = PlayColumns.concat(
+            [PlayColumns.from_api(PLAYS, game_id=1), PlayColumns.from_api(PLAYS, 2)]
+        )
+
+        assert len(games) == 6
+        assert games.counts("type_code")[505] == 2
+        assert games.filter(game_id=2, type_code="goal").rows() == [1]
+        assert len(PlayColumns.concat([])) == 0
+
+
+class TestSituations:
+    """Test class for situation code decoding."""
+
+    def test_situations(self):
+        """Test that each digit of the code is decoded."""
+        columns = PlayColumns.from_api(
+            [{"situationCode": code} for code in ("1551", "0651", "1560", "1451")]
+            + [{}]
+        )
+
+        situations = columns.situations()
+
+        assert situations["away_skaters"].tolist() == [5, 6, 5, 4, -1]
+        assert situations["home_skaters"].tolist() == [5, 5, 6, 5, -1]
+        assert situations["away_empty_net"].tolist() == [0, 1, 0, 0, 0]
+        assert situations["home_empty_net"].tolist() == [0, 0, 1, 0, 0]
+
+    def test_strength(self):
+        """Test strength states from the event owner's point of view."""
+        plays = [
+            ("1551", 7),
+            ("1451", 7),
+            ("1451", 9),
+            ("0651", 7),
+            ("0651", 9),
+            ("1441", 9),
+            ("1551", None),
+        ]
+        columns = PlayColumns.from_api(
+            [
+                {"situationCode": code, "details": {"eventOwnerTeamId": team}}
+                for code, team in plays
+            ],
+            home_team_id=7,
+        )
+
+        states = [
+            STRENGTH_STATES[code] if code >= 0 else None
+            for code in columns.strength().tolist()
+        ]
+
+        assert states == ["5v5", "PP", "SH", "EN", "EA", "EV", None]
+        assert columns.filter(strength="PP").rows() == [1]
+        assert columns.filter(strength="EA").rows() == [4]
+
+    def test_strength_needs_home_team(self):
+        """Test that strength is unknown without the home team."""
+        columns = PlayColumns.from_api(PLAYS)
+
+        assert columns.strength().tolist() == [-1, -1, -1]
+
+
+class TestPlayByPlayColumns:
+    """Test class for PlayByPlay.to_columns."""
+
+    def test_to_columns_cached(self):
+        """Test that the view is built once per PlayByPlay."""
+        pbp = PlayByPlay.from_dict(
+            None,
+            {"game_id": 2023020001, "home_team": {"id": 7}, "plays": PLAYS},
+        )
+
+        columns = pbp.to_columns()
+
+        assert pbp.to_columns() is columns
+        assert columns.game_id[0] == 2023020001
+        assert columns.strength().tolist()[:2] == [0, 2]
+        assert [pbp.plays[i] for i in columns.filter(type_code="goal").rows()] == (
+            pbp.goals
+        )
@@ -264,6 +264,31 @@ class TestPlayerClient:
         player = client.get_player_by_id(999)
         assert player is None
 
+    def test_get_players(self, mock_client, mock_player_landing_response):
+        """Test batch fetching with deduplication and per-id failures."""
+
+        def fake_get(endpoint, **kwargs):
+            if endpoint == "player/999/landing":
+                raise Exception("Not found")
+            return mock_player_landing_response
+
+        mock_client.get.side_effect = fake_get
+        client = PlayerClient(mock_client)
+
+        results = dict(client.get_players([8478402, 999, 8478402], concurrency=2))
+
+        assert set(results) == {8478402, 999}
+        assert isinstance(results[8478402], Player)
+        assert isinstance(results[999], Exception)
+        assert mock_client.get.call_count == 2
+
+    def test_get_players_empty(self, mock_client):
+        """Test that an empty batch makes no requests."""
+        client = PlayerClient(mock_client)
+
+        assert list(client.get_players([])) == []
+        mock_client.get.assert_not_called()
+
 
 class TestPlayerClientLiveAPI:
     """Live API tests for PlayerClient."""
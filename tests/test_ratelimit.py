@@ -0,0 +1,209 @@
+"""Tests for rate limiting and retries."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from edgework import http_client
+from edgework.http_client import AsyncHttpClient, HttpClient
+from edgework.ratelimit import (
+    NHL_HOSTS,
+    RateLimiter,
+    RetryPolicy,
+    TokenBucket,
+    parse_retry_after,
+)
+
+
+class TestTokenBucket:
+    """Test class for TokenBucket."""
+
+    def test_burst_then_wait(self):
+        """Test that tokens beyond the burst must be waited for."""
+        bucket = TokenBucket(rate=10, burst=2)
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+        assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+    def test_invalid_rate(self):
+        """Test that a non-positive rate is rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestRateLimiter:
+    """Test class for RateLimiter."""
+
+    def test_per_host_buckets_are_independent(self):
+        """Test that each host has its own bucket."""
+        limiter = RateLimiter.per_nhl_host(1)
+
+        assert limiter.reserve("api-web.nhle.com") == 0
+        assert limiter.reserve("api.nhle.com") == 0
+        assert limiter.reserve("api-web.nhle.com") > 0
+        assert set(limiter._hosts) == set(NHL_HOSTS)
+
+    def test_global_bucket_applies_to_all_hosts(self):
+        """Test that the global bucket is shared across hosts."""
+        limiter = RateLimiter(rate=1)
+
+        assert limiter.reserve("api-web.nhle.com") == 0
+        assert limiter.reserve("api.nhle.com") > 0
+
+    def test_pause(self):
+        """Test that a paused host waits out the pause."""
+        limiter = RateLimiter()
+        limiter.pause("api.nhle.com", 5)
+
+        assert limiter.reserve("api.nhle.com") == pytest.approx(5, abs=0.1)
+        assert limiter.reserve("api-web.nhle.com") == 0
+
+
+class TestRetryPolicy:
+    """Test class for RetryPolicy and Retry-After parsing."""
+
+    def test_parse_retry_after(self):
+        """Test delta-seconds, HTTP dates and garbage."""
+        later = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+        assert parse_retry_after("7") == 7
+        assert parse_retry_after(format_datetime(later, usegmt=True)) == (
+            pytest.approx(30, abs=2)
+        )
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    def test_should_retry(self):
+        """Test retryable statuses and the retry budget."""
+        policy = RetryPolicy(max_retries=2)
+
+        assert policy.should_retry(0, httpx.Response(429))
+        assert policy.should_retry(1, None)
+        assert not policy.should_retry(2, httpx.Response(503))
+        assert not policy.should_retry(0, httpx.Response(404))
+
+    def test_delay_backoff_and_retry_after(self):
+        """Test exponential backoff and Retry-After precedence."""
+        policy = RetryPolicy(backoff=1, max_backoff=3, jitter=False)
+
+        assert [policy.delay(n) for n in range(4)] == [1, 2, 3, 3]
+        assert policy.delay(0, httpx.Response(429, headers={"Retry-After": "9"})) == 9
+
+    def test_jitter_stays_in_upper_half(self):
+        """Test that jittered delays stay within [delay/2, delay]."""
+        policy = RetryPolicy(backoff=2)
+
+        assert all(2 <= policy.delay(1) <= 4 for _ in range(50))
+
+
+class TestHttpClientRetries:
+    """Test class for HttpClient retry and throttling integration."""
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(http_client.time, "sleep", calls.append)
+        return calls
+
+    def _client(self, handler, **kwargs):
+        client = HttpClient(**kwargs)
+        client._client = httpx.Client(transport=httpx.MockTransport(handler))
+        return client
+
+    def test_retries_429_honoring_retry_after(self, sleeps):
+        """Test that a 429 is retried after its Retry-After delay."""
+        statuses = iter([429, 200])
+
+        def handler(request):
+            status = next(statuses)
+            return httpx.Response(status, headers={"Retry-After": "2"}, json={})
+
+        limiter = RateLimiter()
+        client = self._client(handler, retry=RetryPolicy(), rate_limiter=limiter)
+
+        assert client.get("meta", web=True).status_code == 200
+        assert sleeps[0] == 2
+        assert limiter._paused_until["api-web.nhle.com"] > 0
+
+    def test_gives_up_after_max_retries(self, sleeps):
+        """Test that the last failure is raised once retries run out."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503, json={})
+
+        client = self._client(handler, retry=RetryPolicy(max_retries=2))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            client.get("meta", web=True)
+        assert len(calls) == 3
+        assert len(sleeps) == 2
+
+    def test_retries_transport_errors(self, sleeps):
+        """Test that connection errors are retried."""
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            if len(attempts) == 1:
+                raise httpx.ConnectError("boom", request=request)
+            return httpx.Response(200, json={"ok": True})
+
+        client = self._client(handler, retry=RetryPolicy())
+
+        assert client.get("meta", web=True).json() == {"ok": True}
+
+    def test_no_retry_by_default(self, sleeps):
+        """Test that retries are opt-in."""
+
+        def handler(request):
+            return httpx.Response(429, json={})
+
+        with pytest.raises(httpx.HTTPStatusError):
+            self._client(handler).get("meta", web=True)
+        assert sleeps == []
+
+    def test_rate_limiter_throttles_requests(self, sleeps):
+        """Test that requests beyond the burst sleep for a token."""
+
+        def handler(request):
+            return httpx.Response(200, json={})
+
+        client = self._client(handler, rate_limiter=RateLimiter(rate=1))
+        client.get("meta", web=True)
+        client.get("meta", web=True)
+
+        assert len(sleeps) == 1
+        assert sleeps[0] == pytest.approx(1, abs=0.05)
+
+
+class TestAsyncHttpClientRetries:
+    """Test class for AsyncHttpClient retries."""
+
+    def test_retries_then_succeeds(self, monkeypatch):
+        """Test that the async client retries 503s."""
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr(http_client.asyncio, "sleep", fake_sleep)
+        statuses = iter([503, 503, 200])
+
+        def handler(request):
+            return httpx.Response(next(statuses), json={})
+
+        async def run():
+            client = AsyncHttpClient(retry=RetryPolicy(backoff=1, jitter=False))
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with client:
+                return await client.get("meta", web=True)
+
+        assert asyncio.run(run()).status_code == 200
+        assert sleeps == [1, 2]
@@ -1,11 +1,16 @@
 """Tests for schedule-related functionality in the Edgework client."""
 
+import asyncio
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
-from edgework.clients.schedule_client import ScheduleClient
+from edgework.clients.schedule_client import (
+    AsyncScheduleClient,
+    ScheduleClient,
+    _GameIdBitmap,
+)
 from edgework.models.game import Game
 from edgework.models.schedule import Schedule, schedule_api_to_dict
 
@@ -393,27 +398,76 @@ class TestScheduleClient:
             "regularSeasonStartDate": "2023-10-01T00:00:00Z",
         }
 
-        # Set up mock to return different responses
-        self.mock_http_client.get.side_effect = [first_response, second_response]
+        # Weeks are fetched concurrently, so respond by path
+        unused_response = Mock()
+        unused_response.json.return_value = {
+            "gameWeek": [{"games": [{"id": 4}]}],
+            "nextStartDate": None,
+        }
+        responses = {
+            "schedule/2024-01-01": first_response,
+            "schedule/2024-01-08": second_response,
+            "schedule/2024-01-15": unused_response,
+        }
+        self.mock_http_client.get.side_effect = lambda path, **kwargs: responses[path]
 
         result = self.schedule_client.get_schedule_for_date_range(
             "2024-01-01", "2024-01-15"
         )
 
-        # Verify it made 2 API calls (pagination)
-        assert self.mock_http_client.get.call_count == 2
+        # Verify every predicted week was requested, once
+        paths = sorted(call[0][0] for call in self.mock_http_client.get.call_args_list)
+        assert paths == sorted(responses)
 
-        # Verify first call used start_date
-        first_call = self.mock_http_client.get.call_args_list[0]
-        assert "schedule/2024-01-01" in first_call[0][0]
+        # Verify pages were merged by following nextStartDate
+        game_ids = [game.get("id") for game in result._data["games"]]
+        assert game_ids == [1, 2, 3]
+
+    def test_get_schedule_for_date_range_fetches_unpredicted_week(self):
+        """Test that a nextStartDate off the weekly grid is fetched on demand."""
+        pages = {
+            "schedule/2024-01-01": {
+                "gameWeek": [{"games": [{"id": 1}]}],
+                "nextStartDate": "2024-01-05",
+            },
+            "schedule/2024-01-05": {
+                "gameWeek": [{"games": [{"id": 2}]}],
+                "nextStartDate": None,
+            },
+        }
+        self.mock_http_client.get.side_effect = lambda path, **kwargs: Mock(
+            json=Mock(return_value=pages[path])
+        )
 
-        # Verify second call used nextStartDate
-        second_call = self.mock_http_client.get.call_args_list[1]
-        assert "schedule/2024-01-08" in second_call[0][0]
+        result = self.schedule_client.get_schedule_for_date_range(
+            "2024-01-01", "2024-01-06"
+        )
 
-        # Verify no duplicates
-        game_ids = [game.get("id") for game in result._data["games"]]
-        assert len(game_ids) == len(set(game_ids))
+        assert self.mock_http_client.get.call_count == 2
+        assert [game["id"] for game in result._data["games"]] == [1, 2]
+
+    def test_async_get_schedule_for_date_range(self):
+        """Test that the async client fetches the predicted weeks concurrently."""
+        pages = {
+            f"schedule/2024-01-{day:02d}": {
+                "gameWeek": [{"games": [{"id": day}]}],
+                "nextStartDate": f"2024-01-{day + 7:02d}",
+            }
+            for day in (1, 8, 15, 22)
+        }
+        http_client = Mock()
+        http_client.get = AsyncMock(
+            side_effect=lambda path, **kwargs: Mock(json=Mock(return_value=pages[path]))
+        )
+
+        result = asyncio.run(
+            AsyncScheduleClient(http_client).get_schedule_for_date_range(
+                "2024-01-01", "2024-01-28"
+            )
+        )
+
+        assert http_client.get.await_count == 4
+        assert [game["id"] for game in result._data["games"]] == [1, 8, 15, 22]
 
     def test_get_schedule_for_date_range_filters_by_date(self):
         """Test that get_schedule_for_date_range filters games to requested date range."""
@@ -473,6 +527,119 @@ class TestScheduleClient:
             self.schedule_client.get_schedule_for_date_range("2024-01-15", "2024-01-01")
 
 
+def _week_pages():
+    """Three weekly pages where a game repeats across the first two weeks."""
+    return {
+        "schedule/2024-01-01": {
+            "gameWeek": [
+                {"date": "2023-12-31", "games": [{"id": 2023020500}]},
+                {"date": "2024-01-01", "games": [{"id": 2023020501}]},
+                {"date": "2024-01-02", "games": [{"id": 2023020502}]},
+            ],
+            "nextStartDate": "2024-01-08",
+        },
+        "schedule/2024-01-08": {
+            "gameWeek": [
+                {"date": "2024-01-02", "games": [{"id": 2023020502}]},
+                {
+                    "date": "2024-01-08",
+                    "games": [{"id": 2023020600}, {"id": 2023020601}],
+                },
+            ],
+            "nextStartDate": "2024-01-15",
+        },
+        "schedule/2024-01-15": {
+            "gameWeek": [{"date": "2024-01-15", "games": [{"id": 2023020700}]}],
+            "nextStartDate": "2024-01-22",
+        },
+    }
+
+
+class TestIterSchedule:
+    """Unit tests for streaming schedule ranges."""
+
+    def setup_method(self):
+        """Set up a client answering schedule pages by path."""
+        pages = _week_pages()
+        self.mock_http_client = Mock()
+        self.mock_http_client.get.side_effect = lambda path, **kwargs: Mock(
+            json=Mock(return_value=pages[path])
+        )
+        self.schedule_client = ScheduleClient(self.mock_http_client)
+
+    def test_iter_schedule_yields_unique_games_in_range(self):
+        """Test that games stream in order, de-duplicated and range-filtered."""
+        games = self.schedule_client.iter_schedule("2024-01-01", "2024-01-14")
+
+        assert [game["id"] for game in games] == [
+            2023020501,
+            2023020502,
+            2023020600,
+            2023020601,
+        ]
+
+    def test_iter_schedule_by_day(self):
+        """Test that per-day batches are yielded with their date."""
+        days = list(
+            self.schedule_client.iter_schedule("2024-01-01", "2024-01-21", by_day=True)
+        )
+
+        assert [(date, len(games)) for date, games in days] == [
+            ("2024-01-01", 1),
+            ("2024-01-02", 1),
+            ("2024-01-08", 2),
+            ("2024-01-15", 1),
+        ]
+
+    def test_iter_schedule_is_lazy(self):
+        """Test that games are available before later weeks are consumed."""
+        games = self.schedule_client.iter_schedule(
+            "2024-01-01", "2024-01-21", prefetch=1
+        )
+
+        assert next(games)["id"] == 2023020501
+        assert self.mock_http_client.get.call_count == 1
+        games.close()
+
+    def test_async_iter_schedule(self):
+        """Test that the async client streams the same games."""
+        pages = _week_pages()
+        http_client = Mock()
+        http_client.get = AsyncMock(
+            side_effect=lambda path, **kwargs: Mock(json=Mock(return_value=pages[path]))
+        )
+
+        async def collect():
+            client = AsyncScheduleClient(http_client)
+            return [
+                game["id"]
+                async for game in client.iter_schedule("2024-01-01", "2024-01-21")
+            ]
+
+        assert asyncio.run(collect()) == [
+            2023020501,
+            2023020502,
+            2023020600,
+            2023020601,
+            2023020700,
+        ]
+
+
+class TestGameIdBitmap:
+    """Unit tests for the seen-game bitmap."""
+
+    def test_add(self):
+        """Test that each game ID is new exactly once."""
+        seen = _GameIdBitmap()
+
+        assert seen.add(2023020001)
+        assert not seen.add(2023020001)
+        assert seen.add(2023030001)
+        assert seen.add(2024020001)
+        assert seen.add(None)
+        assert not seen.add(None)
+
+
 class TestScheduleIntegration:
     """Integration tests for Schedule with real Edgework client (if available)."""
 
@@ -0,0 +1,190 @@
+"""Tests for the season schedule index."""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
+
+from edgework.clients.schedule_client import AsyncScheduleClient, ScheduleClient
+from edgework.models.schedule import Schedule
+from edgework.models.season_schedule import SeasonSchedule, game_local_date
+
+
+def _game(game_id, start, home, away, game_type=2, state="FUT", **extra):
+    return dict(
+        {
+            "id": game_id,
+            "season": 20232024,
+            "gameType": game_type,
+            "startTimeUTC": start,
+            "gameState": state,
+            "homeTeam": {"id": home[0], "abbrev": home[1]},
+            "awayTeam": {"id": away[0], "abbrev": away[1]},
+        },
+        **extra,
+    )
+
+
+TOR, MTL, VAN = (10, "TOR"), (8, "MTL"), (23, "VAN")
+
+GAMES = [
+    _game(2023020003, "2023-10-13T23:00:00Z", MTL, TOR),
+    _game(2023010001, "2023-09-25T23:00:00Z", TOR, MTL, game_type=1, state="OFF"),
+    _game(2023020001, "2023-10-11T23:00:00Z", TOR, MTL, state="OFF"),
+    _game(
+        2023020002,
+        "2023-10-13T02:00:00Z",
+        VAN,
+        TOR,
+        state="FINAL",
+        venueUTCOffset="-07:00",
+    ),
+]
+
+
+class TestGameLocalDate:
+    """Test class for game_local_date."""
+
+    def test_local_date(self):
+        """Test that late games keep their venue date."""
+        assert game_local_date(GAMES[3]) == "2023-10-12"
+        assert game_local_date({"gameDate": "2023-10-12"}) == "2023-10-12"
+        assert game_local_date({}) is None
+
+
+class TestSeasonSchedule:
+    """Test class for SeasonSchedule."""
+
+    def test_lookups(self):
+        """Test lookups by ID, date, team and game type."""
+        season = SeasonSchedule(GAMES + [GAMES[0]])
+
+        assert len(season) == 4
+        assert 2023020001 in season
+        assert season.get(2023020002)["homeTeam"]["abbrev"] == "VAN"
+        assert season.get(1) is None
+        assert [g["id"] for g in season.on("2023-10-12")] == [2023020002]
+        assert [g["id"] for g in season.for_team("tor")] == [
+            2023010001,
+            2023020001,
+            2023020002,
+            2023020003,
+        ]
+        assert [g["id"] for g in season.for_team(10, home=True)] == [
+            2023010001,
+            2023020001,
+        ]
+        assert len(season.of_type(2)) == 3
+        assert [g["id"] for g in season.completed()] == [
+            2023010001,
+            2023020001,
+            2023020002,
+        ]
+
+    def test_rest_days(self):
+        """Test precomputed rest days and back-to-backs."""
+        season = SeasonSchedule(GAMES)
+
+        assert season.rest_days(2023010001, "TOR") is None
+        assert season.rest_days(2023020002, "TOR") == 1
+        assert season.rest_days(2023020003, "TOR") == 1
+        assert season.rest_days(2023020003, "MTL") == 2
+        assert season.rest_days(2023020003, "VAN") is None
+        assert [g["id"] for g in season.back_to_backs("TOR")] == [
+            2023020002,
+            2023020003,
+        ]
+
+    def test_upcoming(self):
+        """Test that upcoming games are found by start time."""
+        season = SeasonSchedule(GAMES)
+        now = datetime(2023, 10, 13, 12, tzinfo=timezone.utc)
+
+        assert [g["id"] for g in season.upcoming(now)] == [2023020003]
+
+    def test_schedule_index(self):
+        """Test that Schedule builds its index once."""
+        schedule = Schedule(None, games=GAMES)
+
+        assert schedule.index is schedule.index
+        assert len(schedule.index.for_team("MTL")) == 3
+
+
+WEEK_PAGES = {
+    "schedule/2023-08-01": {
+        "gameWeek": [
+            {"date": "2023-09-25", "games": [GAMES[1]]},
+            {"date": "2023-10-11", "games": [GAMES[2]]},
+        ],
+        "nextStartDate": "2023-10-12",
+    },
+    "schedule/2023-10-12": {
+        "gameWeek": [
+            {"date": "2023-10-12", "games": [GAMES[3]]},
+            {
+                "date": "2023-10-13",
+                "games": [GAMES[0], dict(GAMES[0], id=2022020001, season=20222023)],
+            },
+            {
+                "date": "2023-10-14",
+                "games": [dict(GAMES[0], id=2024010001, season=20242025)],
+            },
+            {
+                "date": "2023-10-15",
+                "games": [dict(GAMES[0], id=2023020099)],
+            },
+        ],
+    },
+}
+
+
+class TestGetSeasonSchedule:
+    """Test class for get_season_schedule."""
+
+    def test_get_season_schedule(self):
+        """Test that a season is streamed and indexed."""
+        http_client = Mock()
+        http_client.get.side_effect = lambda path, **kwargs: Mock(
+            json=Mock(return_value=WEEK_PAGES.get(path, {"gameWeek": []}))
+        )
+
+        season = ScheduleClient(http_client).get_season_schedule(20232024)
+
+        assert len(season) == 4
+        assert season.dates == ["2023-09-25", "2023-10-11", "2023-10-12", "2023-10-13"]
+
+    def test_async_get_season_schedule(self):
+        """Test the async client builds the same index."""
+        http_client = Mock()
+        http_client.get = AsyncMock(
+            side_effect=lambda path, **kwargs: Mock(
+                json=Mock(return_value=WEEK_PAGES.get(path, {"gameWeek": []}))
+            )
+        )
+
+        season = asyncio.run(
+            AsyncScheduleClient(http_client).get_season_schedule("20232024")
+        )
+
+        assert 2022020001 not in season
+        assert [g["id"] for g in season.on("2023-10-13")] == [2023020003]
+        assert 2023020099 not in season
+
+    def test_late_playoffs_kept(self):
+        """Test that games played after 31 Aug still belong to their season."""
+        bubble = _game(2019030415, "2020-09-28T23:30:00Z", TOR, MTL, game_type=3)
+        pages = {
+            "schedule/2019-08-01": {"gameWeek": [], "nextStartDate": "2020-09-28"},
+            "schedule/2020-09-28": {
+                "gameWeek": [
+                    {"date": "2020-09-28", "games": [dict(bubble, season=20192020)]}
+                ]
+            },
+        }
+        http_client = Mock()
+        http_client.get.side_effect = lambda path, **kwargs: Mock(
+            json=Mock(return_value=pages.get(path, {"gameWeek": []}))
+        )
+
+        season = ScheduleClient(http_client).get_season_schedule(20192020)
+
+        assert [g["id"] for g in season.of_type(3)] == [2019030415]
@@ -0,0 +1,188 @@
+"""Tests for the shift timeline."""
+
+from unittest.mock import Mock
+
+from edgework.clients.game_client import GameClient
+from edgework.http_client import HttpClient
+from edgework.models.game import Game
+from edgework.models.shift_timeline import ShiftTimeline, game_seconds
+
+SHIFT_ROWS = [
+    {"playerId": 1, "teamId": 7, "period": 1, "startTime": "00:00", "endTime": "00:45"},
+    {"playerId": 2, "teamId": 7, "period": 1, "startTime": "00:30", "endTime": "01:10"},
+    {"playerId": 3, "teamId": 9, "period": 1, "startTime": "00:00", "endTime": "01:00"},
+    {"playerId": 1, "teamId": 7, "period": 2, "startTime": "00:00", "endTime": "00:40"},
+    {"playerId": 2, "teamId": 7, "period": 2, "startTime": "00:20", "endTime": "01:00"},
+    {
+        "playerId": 1,
+        "teamId": 7,
+        "period": 1,
+        "startTime": "00:30",
+        "endTime": "00:30",
+        "typeCode": 505,
+    },
+]
+
+
+class TestGameSeconds:
+    """Test class for game_seconds."""
+
+    def test_conversion(self):
+        """Test that period clocks map onto one game clock."""
+        assert game_seconds(1, "00:45") == 45
+        assert game_seconds(3, "19:59") == 2 * 1200 + 1199
+        assert game_seconds(None, "00:45") is None
+        assert game_seconds(1, None) is None
+
+
+class TestShiftTimeline:
+    """Test class for ShiftTimeline."""
+
+    def test_from_api(self):
+        """Test that shift rows are parsed and non-shift rows skipped."""
+        timeline = ShiftTimeline.from_api(SHIFT_ROWS)
+
+        assert len(timeline) == 5
+        assert timeline.shifts_of(1) == [(0, 45), (1200, 1240)]
+        assert timeline.teams == {1: 7, 2: 7, 3: 9}
+
+    def test_on_ice(self):
+        """Test who is on ice at a game second."""
+        timeline = ShiftTimeline.from_api(SHIFT_ROWS)
+
+        assert timeline.on_ice(-1) == frozenset()
+        assert timeline.on_ice(0) == {1, 3}
+        assert timeline.on_ice(30) == {1, 2, 3}
+        assert timeline.on_ice(45) == {2, 3}
+        assert timeline.on_ice(45, include_end=True) == {1, 2, 3}
+        assert timeline.on_ice(30, team_id=7) == {1, 2}
+        assert timeline.on_ice(100) == frozenset()
+        assert timeline.on_ice(1230) == {1, 2}
+
+    def test_is_on_ice(self):
+        """Test the per-player interval lookup."""
+        timeline = ShiftTimeline.from_api(SHIFT_ROWS)
+
+        assert timeline.is_on_ice(1, 44)
+        assert not timeline.is_on_ice(1, 45)
+        assert timeline.is_on_ice(1, 45, include_end=True)
+        assert not timeline.is_on_ice(1, 0, include_end=True)
+        assert not timeline.is_on_ice(99, 10)
+
+    def test_overlap_and_time_on_ice(self):
+        """Test shared ice time between two players."""
+        timeline = ShiftTimeline.from_api(SHIFT_ROWS)
+
+        assert timeline.time_on_ice(1) == 85
+        assert timeline.overlap(1, 2) == 15 + 20
+        assert timeline.overlap(1, 3) == 45
+        assert timeline.overlap(1, 99) == 0
+
+    def test_overlap_matches_per_second_count(self):
+        """Test overlap against counting shared seconds one by one."""
+        shifts = [(1, 7, start, start + 40) for start in range(0, 3600, 90)]
+        shifts += [(2, 7, 30, 200), (2, 7, 1190, 1300), (2, 7, 3550, 3700)]
+        timeline = ShiftTimeline(shifts)
+
+        shared = sum(
+            timeline.is_on_ice(1, t) and timeline.is_on_ice(2, t) for t in range(3700)
+        )
+
+        assert timeline.overlap(1, 2) == shared
+        assert timeline.overlap(2, 1) == shared
+        assert timeline.time_on_ice(2) == 170 + 110 + 150
+
+    def test_overlapping_rows_merged(self):
+        """Test that duplicated or overlapping rows are counted once."""
+        timeline = ShiftTimeline([(1, 7, 0, 30), (1, 7, 20, 50), (1, 7, 50, 60)])
+
+        assert timeline.shifts_of(1) == [(0, 60)]
+        assert timeline.time_on_ice(1) == 60
+
+    def test_sweep_matches_bisect(self):
+        """Test that the linear sweep agrees with per-time lookups."""
+        timeline = ShiftTimeline.from_api(SHIFT_ROWS)
+        times = [
+            (t, end)
+            for t in (-5, 0, 30, 45, 45, 70, 1200, 1240)
+            for end in (False, True)
+        ]
+        times += [(10, False), (None, False)]
+
+        positions = list(timeline.sweep(times))
+
+        assert positions[-1] == -1
+        for (t, include_end), position in zip(times[:-1], positions):
+            assert position == timeline.segment(t, include_end)
+            assert timeline.players_at(position) == timeline.on_ice(
+                t, None, include_end
+            )
+
+
+class TestGameOnIce:
+    """Test class for Game.on_ice."""
+
+    def test_on_ice(self):
+        """Test that each event gets its home and away skaters."""
+        plays = [
+            {
+                "eventId": 1,
+                "periodDescriptor": {"number": 1},
+                "timeInPeriod": "00:00",
+                "typeDescKey": "faceoff",
+            },
+            {
+                "eventId": 2,
+                "periodDescriptor": {"number": 1},
+                "timeInPeriod": "00:45",
+                "typeDescKey": "goal",
+            },
+            {
+                "eventId": 3,
+                "periodDescriptor": {"number": 1},
+                "timeInPeriod": "00:45",
+                "typeDescKey": "faceoff",
+            },
+            {"eventId": 4, "typeDescKey": "game-end"},
+        ]
+        responses = {
+            "rest/en/shiftcharts": {"data": SHIFT_ROWS},
+            "gamecenter/2023020001/play-by-play": {
+                "id": 2023020001,
+                "homeTeam": {"id": 7},
+                "awayTeam": {"id": 9},
+                "plays": plays,
+            },
+        }
+        client = Mock(spec=HttpClient)
+        client.get.side_effect = lambda path, **kwargs: Mock(
+            json=Mock(return_value=responses[path])
+        )
+        game = Game.from_dict(
+            {"game_id": 2023020001, "home_team_id": 7, "away_team_id": 9}, client
+        )
+        game._fetched = True
+
+        on_ice = game.on_ice()
+
+        assert [(row.play.event_id, row.home, row.away) for row in on_ice] == [
+            (1, {1}, {3}),
+            (2, {1, 2}, {3}),
+            (3, {2}, {3}),
+            (4, set(), set()),
+        ]
+        assert client.get.call_count == 2
+
+
+class TestGameClientShiftTimeline:
+    """Test class for GameClient.get_shift_timeline."""
+
+    def test_get_shift_timeline(self):
+        """Test that the timeline is built from the shift chart endpoint."""
+        client = Mock(spec=HttpClient)
+        client.get.return_value.json.return_value = {"data": SHIFT_ROWS}
+
+        timeline = GameClient(client).get_shift_timeline(2023020001)
+
+        client.get.assert_called_once_with("shiftcharts?cayenneExp=gameId=2023020001")
+        assert timeline.on_ice(30) == {1, 2, 3}
@@ -0,0 +1,253 @@
+"""Tests for paginated stats reports."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from edgework.clients.stats_client import AsyncStatsClient, StatsClient
+from edgework.http_client import HttpClient
+
+ROWS = [
+    {"playerId": i, "skaterFullName": f"Player {i}", "points": 50 - i} for i in range(5)
+]
+
+
+def _pages(endpoint, params=None, **kwargs):
+    start, limit = params["start"], params["limit"]
+    return Mock(
+        json=Mock(
+            return_value={"data": ROWS[start : start + limit], "total": len(ROWS)}
+        )
+    )
+
+
+class TestIterReport:
+    """Test class for StatsClient.iter_report."""
+
+    def test_pages_through_report(self):
+        """Test that every page is requested once and rows are snake_cased."""
+        client = Mock(spec=HttpClient)
+        client.get.side_effect = _pages
+
+        rows = list(
+            StatsClient(client).iter_report("skater", "summary", 20232024, page_size=2)
+        )
+
+        assert [row["player_id"] for row in rows] == [0, 1, 2, 3, 4]
+        assert rows[0]["skater_full_name"] == "Player 0"
+        starts = [call.kwargs["params"]["start"] for call in client.get.call_args_list]
+        assert starts == [0, 2, 4]
+        endpoint = client.get.call_args_list[0].args[0]
+        params = client.get.call_args_list[0].kwargs["params"]
+        assert endpoint == "en/skater/summary"
+        assert params["cayenneExp"] == "seasonId=20232024"
+        assert [order["property"] for order in json.loads(params["sort"])] == [
+            "points",
+            "playerId",
+        ]
+
+    def test_exact_multiple_stops_on_total(self):
+        """Test that no empty trailing page is requested."""
+        client = Mock(spec=HttpClient)
+        client.get.side_effect = lambda endpoint, params=None, **kwargs: Mock(
+            json=Mock(
+                return_value={
+                    "data": ROWS[params["start"] : params["start"] + 5],
+                    "total": 5,
+                }
+            )
+        )
+
+        rows = list(
+            StatsClient(client).iter_report(
+                "team", "summary", (20222023, 20232024), game=True, page_size=5
+            )
+        )
+
+        assert len(rows) == 5
+        params = client.get.call_args.kwargs["params"]
+        assert client.get.call_count == 1
+        assert params["cayenneExp"] == "seasonId>=20222023 and seasonId<=20232024"
+        assert [order["property"] for order in json.loads(params["sort"])] == [
+            "wins",
+            "teamId",
+            "seasonId",
+            "gameId",
+        ]
+
+    def test_season_range_tie_break(self):
+        """Test that unaggregated season ranges also order rows by season."""
+        client = Mock(spec=HttpClient)
+        client.get.return_value.json.return_value = {"data": [], "total": 0}
+        stats = StatsClient(client)
+
+        def order(**kwargs):
+            list(stats.iter_report("goalie", "summary", **kwargs))
+            params = client.get.call_args.kwargs["params"]
+            return [order["property"] for order in json.loads(params["sort"])]
+
+        assert order(season=(20212022, 20232024)) == ["wins", "playerId", "seasonId"]
+        assert order(season=(20212022, 20232024), aggregate=True) == [
+            "wins",
+            "playerId",
+        ]
+        assert order(season=20232024, sort="savePct") == ["savePct", "playerId"]
+
+    def test_invalid_report(self):
+        """Test that unknown entities and reports are rejected."""
+        stats = StatsClient(Mock(spec=HttpClient))
+
+        with pytest.raises(ValueError):
+            next(stats.iter_report("coach", "summary", 20232024))
+        with pytest.raises(ValueError):
+            next(stats.iter_report("goalie", "faceoffpercentages", 20232024))
+
+    def test_async_iter_report(self):
+        """Test that the async client streams the same rows."""
+        client = Mock()
+        client.get = AsyncMock(side_effect=_pages)
+
+        async def collect():
+            stats = AsyncStatsClient(client)
+            return [
+                row
+                async for row in stats.iter_report(
+                    "skater", "summary", 20232024, page_size=2
+                )
+            ]
+
+        rows = asyncio.run(collect())
+
+        assert [row["player_id"] for row in rows] == [0, 1, 2, 3, 4]
+        assert client.get.await_count == 3
+
+
+REPORTS = {
+    "en/skater/summary": [
+        {"playerId": 1, "gameId": 10, "skaterFullName": "A", "points": 2},
+        {"playerId": 1, "gameId": 11, "skaterFullName": "A", "points": 1},
+        {"playerId": 2, "gameId": 10, "skaterFullName": "B", "points": 0},
+    ],
+    "en/skater/realtime": [
+        {"playerId": 2, "gameId": 10, "skaterFullName": "B", "hits": 4},
+        {"playerId": 1, "gameId": 10, "skaterFullName": "A", "hits": 1},
+        {"playerId": 3, "gameId": 11, "skaterFullName": "C", "hits": 2},
+    ],
+}
+
+
+def _report(endpoint, params=None, **kwargs):
+    return Mock(json=Mock(return_value={"data": REPORTS[endpoint], "total": 3}))
+
+
+class TestGetSkaterTable:
+    """Test class for StatsClient.get_skater_table."""
+
+    def test_join_game_rows(self):
+        """Test that game rows are joined on player and game."""
+        client = Mock(spec=HttpClient)
+        client.get.side_effect = _report
+
+        table = StatsClient(client).get_skater_table(
+            20232024, reports=["summary", "realtime"], game=True
+        )
+
+        assert [
+            (row["player_id"], row["game_id"], row.get("points"), row.get("hits"))
+            for row in table
+        ] == [(1, 10, 2, 1), (1, 11, 1, None), (2, 10, 0, 4), (3, 11, None, 2)]
+        assert sorted(table[0]) == [
+            "game_id",
+            "hits",
+            "player_id",
+            "points",
+            "skater_full_name",
+        ]
+        params = client.get.call_args.kwargs["params"]
+        assert [order["property"] for order in json.loads(params["sort"])] == [
+            "playerId",
+            "gameId",
+        ]
+
+    def test_join_season_range(self):
+        """Test that a season range keeps one row per player and season."""
+        seasons = {
+            "en/skater/summary": [
+                {"playerId": 1, "seasonId": 20222023, "points": 40},
+                {"playerId": 1, "seasonId": 20232024, "points": 55},
+            ],
+            "en/skater/realtime": [
+                {"playerId": 1, "seasonId": 20232024, "hits": 12},
+                {"playerId": 1, "seasonId": 20222023, "hits": 30},
+            ],
+        }
+        client = Mock(spec=HttpClient)
+        client.get.side_effect = lambda endpoint, **kwargs: Mock(
+            json=Mock(return_value={"data": seasons[endpoint], "total": 2})
+        )
+
+        table = StatsClient(client).get_skater_table(
+            (20222023, 20232024), reports=["summary", "realtime"]
+        )
+
+        assert [(row["season_id"], row["points"], row["hits"]) for row in table] == [
+            (20222023, 40, 30),
+            (20232024, 55, 12),
+        ]
+
+    def test_join_report_without_season(self):
+        """Test that a report without seasonId merges into every season row."""
+        reports = {
+            "en/skater/bios": [
+                {"playerId": 1, "birthCity": "Toronto"},
+                {"playerId": 2, "birthCity": "Oslo"},
+            ],
+            "en/skater/summary": [
+                {"playerId": 1, "seasonId": 20222023, "points": 40},
+                {"playerId": 1, "seasonId": 20232024, "points": 55},
+            ],
+        }
+        client = Mock(spec=HttpClient)
+        client.get.side_effect = lambda endpoint, **kwargs: Mock(
+            json=Mock(return_value={"data": reports[endpoint], "total": 2})
+        )
+
+        table = StatsClient(client).get_skater_table(
+            (20222023, 20232024), reports=["bios", "summary"]
+        )
+
+        assert [
+            (row["player_id"], row.get("season_id"), row["birth_city"]) for row in table
+        ] == [
+            (1, 20222023, "Toronto"),
+            (1, 20232024, "Toronto"),
+            (2, None, "Oslo"),
+        ]
+
+    def test_invalid_report(self):
+        """Test that unknown reports are rejected before any request."""
+        client = Mock(spec=HttpClient)
+
+        with pytest.raises(ValueError):
+            StatsClient(client).get_skater_table(20232024, reports=["summary", "x"])
+        client.get.assert_not_called()
+
+    def test_async_join_season_rows(self):
+        """Test that the async client joins season rows on player only."""
+        client = Mock()
+        client.get = AsyncMock(side_effect=_report)
+
+        table = asyncio.run(
+            AsyncStatsClient(client).get_skater_table(
+                20232024, reports=["summary", "realtime"]
+            )
+        )
+
+        assert [(row["player_id"], row.get("hits")) for row in table] == [
+            (1, 1),
+            (2, 4),
+            (3, 2),
+        ]
+        assert client.get.await_count == 2
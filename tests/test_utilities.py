@@ -0,0 +1,155 @@
+"""Tests for the key-conversion utilities."""
+
+from datetime import datetime
+
+import pytest
+
+from edgework.utilities import (
+    PayloadFlattener,
+    camel_to_snake,
+    dict_camel_to_snake,
+    parse_date_string,
+    rows_camel_to_snake,
+)
+
+
+class TestCamelToSnake:
+    """Test class for camel_to_snake."""
+
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("playerId", "player_id"),
+            ("skaterFullName", "skater_full_name"),
+            ("timeOnIcePerGame", "time_on_ice_per_game"),
+            ("faceoffWinPct", "faceoff_win_pct"),
+            ("HTTPResponse", "http_response"),
+            ("ppGoals", "pp_goals"),
+            ("already_snake", "already_snake"),
+        ],
+    )
+    def test_conversion(self, name, expected):
+        """Test representative API keys."""
+        assert camel_to_snake(name) == expected
+
+    def test_memoized_and_bounded(self):
+        """Test that conversions are cached with a bounded cache."""
+        camel_to_snake("gamesPlayed")
+        hits = camel_to_snake.cache_info().hits
+
+        camel_to_snake("gamesPlayed")
+
+        assert camel_to_snake.cache_info().hits == hits + 1
+        assert camel_to_snake.cache_info().maxsize is not None
+
+
+class TestRowsCamelToSnake:
+    """Test class for rows_camel_to_snake."""
+
+    def test_matches_per_row_conversion(self):
+        """Test that bulk conversion equals dict_camel_to_snake per row."""
+        rows = [
+            {"playerId": 1, "teamAbbrevs": "TOR", "goals": 3},
+            {"playerId": 2, "teamAbbrevs": "EDM", "goals": 5},
+            {"goals": 1, "playerId": 3},
+            {"teamName": {"default": "Oilers"}, "seasonIds": [{"seasonId": 1}]},
+        ]
+
+        assert rows_camel_to_snake(rows) == [dict_camel_to_snake(r) for r in rows]
+
+    def test_key_order_preserved(self):
+        """Test that rows with a different key order are mapped correctly."""
+        rows = [{"playerId": 1, "goals": 2}, {"goals": 3, "playerId": 4}]
+
+        assert rows_camel_to_snake(rows) == [
+            {"player_id": 1, "goals": 2},
+            {"goals": 3, "player_id": 4},
+        ]
+
+    def test_non_dict_rows(self):
+        """Test that scalar rows pass through."""
+        assert rows_camel_to_snake([1, {"aB": 2}]) == [1, {"a_b": 2}]
+
+
+class TestParseDateString:
+    """Test class for parse_date_string."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("2024-01-13", datetime(2024, 1, 13)),
+            ("2024-01-13T19:30:05", datetime(2024, 1, 13, 19, 30, 5)),
+            ("2024-01-13T19:30:05Z", datetime(2024, 1, 13, 19, 30, 5)),
+        ],
+    )
+    def test_dates(self, value, expected):
+        """Test the three API date shapes, returned as naive datetimes."""
+        result = parse_date_string(value)
+
+        assert result == expected
+        assert result.tzinfo is None
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "Connor",
+            "EDM",
+            "https://assets.nhle.com/mugs/nhl/20232024/EDM/8478402.png",
+            "21:28",
+            "2024-13-01",
+            "2024-02-30",
+            "2024-01-13T19:30",
+            "2024-01-13 19:30:05",
+            "2024-01-13T19:30:05+00:00",
+            "",
+        ],
+    )
+    def test_non_dates_unchanged(self, value):
+        """Test that other strings, including invalid dates, pass through."""
+        assert parse_date_string(value) == value
+
+
+class TestPayloadFlattener:
+    """Test class for PayloadFlattener."""
+
+    def test_flattens_nested_objects_with_parent_prefix(self):
+        """Test prefixing, default extraction and date parsing."""
+        flattener = PayloadFlattener()
+
+        result = flattener.flatten(
+            {
+                "firstName": {"default": "Connor", "fr": "Connor"},
+                "birthDate": "1997-01-13",
+                "careerTotals": {"regularSeason": {"gamesPlayed": 645}},
+                "last5Games": [{"gameId": 1, "opponentCommonName": {"default": "X"}}],
+            }
+        )
+
+        assert result == {
+            "first_name": "Connor",
+            "birth_date": datetime(1997, 1, 13),
+            "career_totals_regular_season_games_played": 645,
+            "last5_games": [{"game_id": 1, "opponent_common_name": "X"}],
+        }
+
+    def test_prefixed_keys_and_transforms(self):
+        """Test fixed prefixes and per-key transforms."""
+        flattener = PayloadFlattener(
+            prefixed={"draftDetails": "draft"},
+            transforms={"draft_year": lambda year: year * 10},
+        )
+
+        result = flattener.flatten({"draftDetails": {"year": 2015, "overallPick": 1}})
+
+        assert result == {"draft_year": 20150, "draft_overall_pick": 1}
+
+    def test_key_map_is_reused(self):
+        """Test that flattened key names are memoized across payloads."""
+        flattener = PayloadFlattener()
+        flattener.flatten({"featuredStats": {"regularSeason": {"goals": 1}}})
+        keys = dict(flattener._keys)
+
+        flattener.flatten({"featuredStats": {"regularSeason": {"goals": 2}}})
+
+        assert flattener._keys == keys
+        assert ("featured_stats_regular_season", "goals") in keys